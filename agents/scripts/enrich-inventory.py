@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Enrich agent-inventory.csv with columns joined from other sources.
+
+Each source is a markdown file (every table in it is parsed) or a CSV file,
+keyed by agent name. All sources are loaded into lookup tables first, then
+the inventory is streamed row by row into a temporary file and swapped into
+place, so the CSV is never held in memory. Names present on only one side of
+each join are reported.
+
+Usage:
+    python3 scripts/enrich-inventory.py
+    python3 scripts/enrich-inventory.py \\
+        --source TIER-CLASSIFICATION.md:Rationale=rationale \\
+        --source notes.csv:owner
+
+Source spec: PATH:SOURCE_COLUMN[=TARGET_COLUMN]. Markdown tables are keyed
+by their first column (backticks stripped); CSV files by their 'name'
+column, falling back to the first column.
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+DEFAULT_SOURCE = 'TIER-CLASSIFICATION.md:Rationale=rationale'
+
+
+@dataclass
+class Source:
+    """One enrichment source: a name -> value lookup for a single column."""
+    path: Path
+    source_column: str
+    target_column: str
+    values: dict[str, str] = field(default_factory=dict)
+    matched: set[str] = field(default_factory=set)
+
+    @property
+    def label(self) -> str:
+        return f"{self.path.name}:{self.source_column}"
+
+
+def split_table_row(line: str) -> list[str]:
+    """Split a markdown table row into cells, honouring \\| escapes and code spans."""
+    cells = []
+    current = []
+    in_code = False
+    i = 0
+    body = line.strip()
+    if body.startswith('|'):
+        body = body[1:]
+    if body.endswith('|') and not body.endswith('\\|'):
+        body = body[:-1]
+
+    while i < len(body):
+        ch = body[i]
+        if ch == '\\' and i + 1 < len(body) and body[i + 1] == '|':
+            current.append('|')
+            i += 2
+            continue
+        if ch == '`':
+            in_code = not in_code
+        elif ch == '|' and not in_code:
+            cells.append(''.join(current).strip())
+            current = []
+            i += 1
+            continue
+        current.append(ch)
+        i += 1
+
+    cells.append(''.join(current).strip())
+    return cells
+
+
+def is_separator_row(cells: list[str]) -> bool:
+    """True for the |---|:---:| row that follows a table header."""
+    return bool(cells) and all(
+        c and set(c) <= set('-: ') and '-' in c for c in cells
+    )
+
+
+def parse_markdown_tables(md_path: Path) -> Iterator[dict[str, str]]:
+    """Yield every row of every markdown table as a dict keyed by header."""
+    header: list[str] | None = None
+    pending: list[str] | None = None
+
+    with open(md_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped.startswith('|'):
+                header = pending = None
+                continue
+
+            cells = split_table_row(stripped)
+            if header is None:
+                if pending is not None and is_separator_row(cells):
+                    header = pending
+                    pending = None
+                else:
+                    pending = cells
+                continue
+
+            if len(cells) < len(header):
+                cells += [''] * (len(header) - len(cells))
+            yield dict(zip(header, cells))
+
+
+def clean_key(value: str) -> str:
+    """Normalise a table key cell: `agent-name` -> agent-name."""
+    return value.strip().strip('`').strip()
+
+
+def load_source(source: Source):
+    """Populate source.values from a markdown or CSV file."""
+    if source.path.suffix.lower() == '.md':
+        rows = parse_markdown_tables(source.path)
+        for row in rows:
+            if source.source_column not in row:
+                continue
+            key = clean_key(next(iter(row.values())))
+            value = row[source.source_column].strip()
+            if key and value and not value.startswith('-'):
+                source.values[key] = value
+        return
+
+    with open(source.path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        if source.source_column not in fieldnames:
+            raise ValueError(f"{source.path}: no column '{source.source_column}'")
+        key_column = 'name' if 'name' in fieldnames else fieldnames[0]
+        for row in reader:
+            key = clean_key(row[key_column] or '')
+            value = (row[source.source_column] or '').strip()
+            if key and value:
+                source.values[key] = value
+
+
+def parse_source_spec(spec: str, base: Path) -> Source:
+    """Parse PATH:SOURCE_COLUMN[=TARGET_COLUMN]."""
+    path_part, sep, column_part = spec.rpartition(':')
+    if not sep or not path_part or not column_part:
+        raise ValueError(f"Invalid source spec '{spec}' (expected PATH:COLUMN[=TARGET])")
+
+    source_column, _, target_column = column_part.partition('=')
+    path = Path(path_part)
+    if not path.is_absolute():
+        path = base / path
+    return Source(
+        path=path,
+        source_column=source_column,
+        target_column=target_column or source_column.lower(),
+    )
+
+
+def enrich_csv(csv_path: Path, sources: list[Source]) -> tuple[int, list[str]]:
+    """Stream the inventory once, applying every source. Returns (rows, unmatched names)."""
+    unmatched_rows = []
+    row_count = 0
+
+    fd, tmp_name = tempfile.mkstemp(prefix='.enrich-', suffix='.csv', dir=csv_path.parent)
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as src, \
+                os.fdopen(fd, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.DictReader(src)
+            fieldnames = list(reader.fieldnames or [])
+            for source in sources:
+                if source.target_column not in fieldnames:
+                    fieldnames.append(source.target_column)
+
+            writer = csv.DictWriter(dst, fieldnames=fieldnames)
+            writer.writeheader()
+
+            for row in reader:
+                row_count += 1
+                name = row['name']
+                hit = False
+                for source in sources:
+                    value = source.values.get(name)
+                    if value is not None:
+                        row[source.target_column] = value
+                        source.matched.add(name)
+                        hit = True
+                    else:
+                        row[source.target_column] = row.get(source.target_column) or ''
+                if not hit:
+                    unmatched_rows.append(name)
+                writer.writerow(row)
+
+        shutil.copymode(csv_path, tmp_name)
+        os.replace(tmp_name, csv_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    return row_count, unmatched_rows
+
+
+def main():
+    repo_root = Path(__file__).parent.parent.resolve()
+
+    parser = argparse.ArgumentParser(description='Join enrichment columns into agent-inventory.csv')
+    parser.add_argument('--csv', type=Path, default=repo_root / 'agent-inventory.csv',
+                        help='Inventory CSV to enrich (default: agent-inventory.csv)')
+    parser.add_argument('--source', action='append', dest='sources', metavar='SPEC',
+                        help=f"PATH:COLUMN[=TARGET], repeatable (default: {DEFAULT_SOURCE})")
+    args = parser.parse_args()
+
+    try:
+        sources = [parse_source_spec(s, repo_root) for s in (args.sources or [DEFAULT_SOURCE])]
+        for source in sources:
+            print(f"Parsing {source.path} ({source.source_column} -> {source.target_column})...")
+            load_source(source)
+            print(f"  - {len(source.values)} values found")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"\nUpdating {args.csv}...")
+    row_count, unmatched_rows = enrich_csv(args.csv, sources)
+
+    for source in sources:
+        print(f"  - {source.label}: matched {len(source.matched)}/{row_count} agents")
+        orphans = sorted(set(source.values) - source.matched)
+        if orphans:
+            print(f"    Not in inventory ({len(orphans)}): {', '.join(orphans)}")
+
+    if unmatched_rows:
+        print(f"\n  Inventory agents with no source entry ({len(unmatched_rows)}): "
+              f"{', '.join(unmatched_rows)}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
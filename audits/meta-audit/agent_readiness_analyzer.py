@@ -61,6 +61,15 @@ MANUAL_BLOCKERS = [
 ]
 
 
+# The report lists the first issues by severity, blocker examples and fully
+# automatable audits only up to these limits; nothing beyond them is kept,
+# so memory stays flat however large the corpus is
+REPORTED_ISSUES = 100
+BLOCKER_EXAMPLES = 5
+REPORTED_AUTOMATABLE = 50
+SEVERITY_ORDER = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+
 class AgentReadinessAnalyzer:
     def __init__(self, audits_dir: str):
         self.audits_dir = Path(audits_dir)
@@ -71,8 +80,9 @@ class AgentReadinessAnalyzer:
             'automation_distribution': defaultdict(int),
             'cognitive_modes': defaultdict(int),
             'tool_usage': defaultdict(int),
-            'manual_blockers': defaultdict(list),
-            'issues': [],
+            'manual_blockers': defaultdict(lambda: {'count': 0, 'example_audits': []}),
+            'findings_count': defaultdict(int),
+            'issues_by_rank': defaultdict(list),  # severity rank -> first REPORTED_ISSUES issues
             'readiness_scores': defaultdict(int),
             'files_by_category': defaultdict(int),
             'category_readiness': defaultdict(lambda: defaultdict(int)),
@@ -142,22 +152,25 @@ class AgentReadinessAnalyzer:
             blockers = self._check_manual_blockers(data, content)
             for blocker_type, details in blockers.items():
                 if details:
-                    self.results['manual_blockers'][blocker_type].append({
-                        'audit_id': audit_id,
-                        'details': details
-                    })
+                    blocker = self.results['manual_blockers'][blocker_type]
+                    blocker['count'] += 1
+                    if len(blocker['example_audits']) < BLOCKER_EXAMPLES:
+                        blocker['example_audits'].append(audit_id)
 
             # Calculate readiness score
             score = self._calculate_readiness_score(data, content, automation, blockers)
             self.results['readiness_scores'][score] += 1
             self.results['category_readiness'][category][score] += 1
 
-            if score == 'fully_automatable':
+            if score == 'fully_automatable' and len(self.results['fully_automatable_audits']) < REPORTED_AUTOMATABLE:
                 self.results['fully_automatable_audits'].append(audit_id)
 
             # Generate issues for non-ready audits
-            issues = self._generate_issues(audit_id, data, automation, blockers, filepath)
-            self.results['issues'].extend(issues)
+            for issue in self._generate_issues(audit_id, data, automation, blockers, filepath):
+                self.results['findings_count'][issue['severity']] += 1
+                kept = self.results['issues_by_rank'][SEVERITY_ORDER.get(issue['severity'], 4)]
+                if len(kept) < REPORTED_ISSUES:
+                    kept.append(issue)
 
         except yaml.YAMLError as e:
             self.results['parse_errors'].append({
@@ -443,27 +456,20 @@ class AgentReadinessAnalyzer:
 
     def _generate_report(self) -> Dict[str, Any]:
         """Generate the final report in the required format."""
-        # Count findings by severity
-        findings_count = defaultdict(int)
-        for issue in self.results['issues']:
-            findings_count[issue['severity']] += 1
+        findings_count = self.results['findings_count']
 
         # Aggregate manual blockers
-        blocker_summary = []
-        for blocker_type, instances in self.results['manual_blockers'].items():
-            example_ids = [inst['audit_id'] for inst in instances[:5]]
-            blocker_summary.append({
-                'type': blocker_type,
-                'count': len(instances),
-                'example_audits': example_ids
-            })
-
-        # Sort issues by severity
-        severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        sorted_issues = sorted(
-            self.results['issues'],
-            key=lambda x: severity_order.get(x['severity'], 4)
-        )
+        blocker_summary = [
+            {'type': blocker_type, **blocker}
+            for blocker_type, blocker in self.results['manual_blockers'].items()
+        ]
+
+        # Issues by severity, in the order they were found
+        sorted_issues = [
+            issue
+            for rank in sorted(self.results['issues_by_rank'])
+            for issue in self.results['issues_by_rank'][rank]
+        ]
 
         # Calculate pass rate (fully + mostly automatable)
         total_scored = sum(self.results['readiness_scores'].values())
@@ -560,11 +566,11 @@ class AgentReadinessAnalyzer:
                     ],
                 },
 
-                'issues': sorted_issues[:100],  # Top 100 issues
+                'issues': sorted_issues[:REPORTED_ISSUES],
 
                 'manual_blockers': blocker_summary,
 
-                'fully_automatable_audits': self.results['fully_automatable_audits'][:50],
+                'fully_automatable_audits': self.results['fully_automatable_audits'],
 
                 'summary': {
                     'pass_rate': round(pass_rate, 3),
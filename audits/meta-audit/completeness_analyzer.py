@@ -1,237 +1,108 @@
 #!/usr/bin/env python3
 """
 Completeness Meta-Audit Analyzer
-Analyzes all audit files for missing required fields.
+Analyzes all audit files for missing, empty or invalid required fields,
+as annotated in schema/AUDIT-TEMPLATE-BLANK.yaml.
 """
 
 import os
+import sys
 import yaml
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
-AUDITS_DIR = "/mnt/walnut-drive/dev/audits/audits"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from audit_schema import Coverage, compile_schema  # noqa: E402
 
-# Define required fields and their severity
-REQUIRED_FIELDS = {
-    "critical": [
-        ("audit.id", ["audit", "id"]),
-        ("audit.name", ["audit", "name"]),
-        ("audit.category", ["audit", "category"]),
-        ("audit.tier", ["audit", "tier"]),
-        ("description.what", ["description", "what"]),
-    ],
-    "high": [
-        ("execution.automatable", ["execution", "automatable"]),
-        ("execution.severity", ["execution", "severity"]),
-        ("description.why_it_matters", ["description", "why_it_matters"]),
-        ("procedure.steps", ["procedure", "steps"]),
-    ]
+AUDITS_DIR = "/mnt/walnut-drive/dev/audits/audits"
+LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Which fields are required comes from the [REQUIRED]/[CONDITIONAL]
+# annotations of schema/AUDIT-TEMPLATE-BLANK.yaml (scripts/audit_schema.py);
+# this only sets how bad a missing one is. Missing fields not listed here
+# are high, empty or invalid values medium. A whole missing section is
+# reported once, under its own name.
+MISSING_SEVERITY = {
+    "audit": "critical",
+    "description": "critical",
+    "signals": "critical",
+    "audit.id": "critical",
+    "audit.name": "critical",
+    "audit.category": "critical",
+    "audit.tier": "critical",
+    "description.what": "critical",
+    "signals.critical": "critical",
+    "signals.high": "critical",
 }
 
-def get_nested_value(data, keys):
-    """Get a nested value from a dict using a list of keys."""
-    if not data or not isinstance(data, dict):
-        return None
-
-    current = data
-    for key in keys:
-        if not isinstance(current, dict) or key not in current:
-            return None
-        current = current[key]
-    return current
-
-def check_signals(data):
-    """Check if signals.critical OR signals.high exists and has content."""
-    signals = get_nested_value(data, ["signals"])
-    if not signals or not isinstance(signals, dict):
-        return False
-
-    critical = signals.get("critical")
-    high = signals.get("high")
-
-    # Check if at least one has content
-    has_critical = isinstance(critical, list) and len(critical) > 0
-    has_high = isinstance(high, list) and len(high) > 0
-
-    return has_critical or has_high
-
-def check_discovery(data):
-    """Check if discovery.code_patterns OR discovery.file_patterns exists."""
-    discovery = get_nested_value(data, ["discovery"])
-    if not discovery or not isinstance(discovery, dict):
-        return False
-
-    code_patterns = discovery.get("code_patterns")
-    file_patterns = discovery.get("file_patterns")
-
-    has_code = isinstance(code_patterns, list) and len(code_patterns) > 0
-    has_file = isinstance(file_patterns, list) and len(file_patterns) > 0
-
-    return has_code or has_file
-
-def is_empty_value(value):
-    """Check if a value is effectively empty."""
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    if isinstance(value, list) and len(value) == 0:
-        return True
-    if isinstance(value, dict) and len(value) == 0:
-        return True
-    return False
+def file_issue(filepath, issue, recommended):
+    return {
+        "audit_id": os.path.basename(filepath),
+        "severity": "critical",
+        "issue": issue,
+        "field": "file",
+        "recommended": recommended
+    }
 
-def analyze_audit_file(filepath):
-    """Analyze a single audit file for completeness issues."""
-    issues = []
+def schema_issue(audit_id, issue):
+    """Report entry for one audit_schema.Issue."""
+    if issue.problem == "missing" and " OR " in issue.field:
+        return {
+            "audit_id": audit_id,
+            "severity": MISSING_SEVERITY.get(issue.field, "high"),
+            "issue": "Missing all alternative fields",
+            "field": issue.field,
+            "recommended": "Add at least one of: " + issue.field.replace(" OR ", ", ")
+        }
+    if issue.problem == "missing":
+        return {
+            "audit_id": audit_id,
+            "severity": MISSING_SEVERITY.get(issue.field, "high"),
+            "issue": "Missing required field",
+            "field": issue.field,
+            "recommended": "Add required field with appropriate value"
+        }
+    if issue.problem == "empty":
+        return {
+            "audit_id": audit_id,
+            "severity": "medium",
+            "issue": "Empty required field",
+            "field": issue.field,
+            "recommended": "Populate field with meaningful content"
+        }
+    return {
+        "audit_id": audit_id,
+        "severity": "medium",
+        "issue": f"Invalid value: {issue.detail}",
+        "field": issue.field,
+        "recommended": "Use a value the audit template allows"
+    }
 
+def analyze_audit_file(filepath, coverage):
+    """Analyze a single audit file for completeness issues, counting it in coverage."""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=LOADER)
     except yaml.YAMLError as e:
-        return [{
-            "audit_id": os.path.basename(filepath),
-            "severity": "critical",
-            "issue": f"YAML parsing error: {str(e)[:100]}",
-            "field": "file",
-            "recommended": "Fix YAML syntax errors"
-        }]
+        coverage.add(None)
+        return [file_issue(filepath, f"YAML parsing error: {str(e)[:100]}", "Fix YAML syntax errors")]
     except Exception as e:
-        return [{
-            "audit_id": os.path.basename(filepath),
-            "severity": "critical",
-            "issue": f"File read error: {str(e)[:100]}",
-            "field": "file",
-            "recommended": "Ensure file is readable"
-        }]
+        coverage.add(None)
+        return [file_issue(filepath, f"File read error: {str(e)[:100]}", "Ensure file is readable")]
 
     if not data:
-        return [{
-            "audit_id": os.path.basename(filepath),
-            "severity": "critical",
-            "issue": "Empty or null YAML content",
-            "field": "file",
-            "recommended": "Add required audit content"
-        }]
+        coverage.add(None)
+        return [file_issue(filepath, "Empty or null YAML content", "Add required audit content")]
 
-    # Get audit ID for reporting
-    audit_id = get_nested_value(data, ["audit", "id"]) or os.path.basename(filepath)
-
-    # Check critical fields
-    for field_name, keys in REQUIRED_FIELDS["critical"]:
-        value = get_nested_value(data, keys)
-        if value is None:
-            issues.append({
-                "audit_id": audit_id,
-                "severity": "critical",
-                "issue": "Missing required field",
-                "field": field_name,
-                "recommended": "Add required field with appropriate value"
-            })
-        elif is_empty_value(value):
-            issues.append({
-                "audit_id": audit_id,
-                "severity": "medium",
-                "issue": "Empty required field",
-                "field": field_name,
-                "recommended": "Populate field with meaningful content"
-            })
-
-    # Check high severity fields
-    for field_name, keys in REQUIRED_FIELDS["high"]:
-        value = get_nested_value(data, keys)
-        if value is None:
-            issues.append({
-                "audit_id": audit_id,
-                "severity": "high",
-                "issue": "Missing required field",
-                "field": field_name,
-                "recommended": "Add required field with appropriate value"
-            })
-        elif is_empty_value(value):
-            issues.append({
-                "audit_id": audit_id,
-                "severity": "medium",
-                "issue": "Empty required field",
-                "field": field_name,
-                "recommended": "Populate field with meaningful content"
-            })
-
-    # Check signals (at least critical or high required)
-    if not check_signals(data):
-        issues.append({
-            "audit_id": audit_id,
-            "severity": "critical",
-            "issue": "Missing signals - no critical or high level signals defined",
-            "field": "signals.critical OR signals.high",
-            "recommended": "Add at least one critical or high severity signal"
-        })
+    result = compile_schema().validate(data)
+    coverage.add(result)
 
-    # Check discovery patterns
-    if not check_discovery(data):
-        issues.append({
-            "audit_id": audit_id,
-            "severity": "high",
-            "issue": "Missing discovery patterns",
-            "field": "discovery.code_patterns OR discovery.file_patterns",
-            "recommended": "Add code patterns or file patterns for discovery"
-        })
-
-    return issues
-
-def calculate_field_coverage(all_files_data):
-    """Calculate percentage coverage for each field."""
-    total = len(all_files_data)
-    if total == 0:
-        return {}
-
-    coverage = {
-        "audit.id": 0,
-        "audit.name": 0,
-        "audit.category": 0,
-        "audit.tier": 0,
-        "execution.automatable": 0,
-        "execution.severity": 0,
-        "description.what": 0,
-        "description.why_it_matters": 0,
-        "signals": 0,
-        "discovery": 0,
-        "procedure.steps": 0,
-    }
-
-    field_mappings = {
-        "audit.id": ["audit", "id"],
-        "audit.name": ["audit", "name"],
-        "audit.category": ["audit", "category"],
-        "audit.tier": ["audit", "tier"],
-        "execution.automatable": ["execution", "automatable"],
-        "execution.severity": ["execution", "severity"],
-        "description.what": ["description", "what"],
-        "description.why_it_matters": ["description", "why_it_matters"],
-        "procedure.steps": ["procedure", "steps"],
-    }
-
-    for data in all_files_data:
-        if not data:
-            continue
-
-        for field_name, keys in field_mappings.items():
-            value = get_nested_value(data, keys)
-            if value is not None and not is_empty_value(value):
-                coverage[field_name] += 1
-
-        if check_signals(data):
-            coverage["signals"] += 1
-
-        if check_discovery(data):
-            coverage["discovery"] += 1
-
-    # Convert to percentages
-    for field in coverage:
-        coverage[field] = round((coverage[field] / total) * 100, 2)
+    # Get audit ID for reporting
+    audit = data.get("audit") if isinstance(data, dict) else None
+    audit_id = (audit.get("id") if isinstance(audit, dict) else None) or os.path.basename(filepath)
 
-    return coverage
+    return [schema_issue(audit_id, issue) for issue in result.issues]
 
 def main():
     print("Starting completeness meta-audit...")
@@ -246,19 +117,12 @@ def main():
     print(f"Found {len(audit_files)} audit files")
 
     all_issues = []
-    all_files_data = []
+    coverage = Coverage(compile_schema())
     files_with_issues = set()
     fully_complete_count = 0
 
     for filepath in audit_files:
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            all_files_data.append(data)
-        except:
-            all_files_data.append(None)
-
-        issues = analyze_audit_file(filepath)
+        issues = analyze_audit_file(filepath, coverage)
         if issues:
             all_issues.extend(issues)
             files_with_issues.add(filepath)
@@ -271,7 +135,7 @@ def main():
         severity_counts[issue["severity"]] += 1
 
     # Calculate field coverage
-    field_coverage = calculate_field_coverage(all_files_data)
+    field_coverage = coverage.percentages()
 
     # Calculate stats
     total_audits = len(audit_files)
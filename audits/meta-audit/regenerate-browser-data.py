@@ -1,25 +1,65 @@
 #!/usr/bin/env python3
-"""Regenerate audits.json for the audit browser."""
+"""Regenerate audits.json for the audit browser.
+
+Parsed definitions are taken from the compiled corpus bundle
+(AUDIT-BUNDLE.sqlite, built by `python3 -m audit_engine bundle`) where its
+entry for a file is current; of other files only the sections used here
+are parsed (scripts/yaml_sections.py).
+"""
 
 import json
-import yaml
+import os
+import sqlite3
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from yaml_sections import YamlSections  # noqa: E402
+
 AUDITS_DIR = Path("/mnt/walnut-drive/dev/audits/audits")
 OUTPUT_PATH = Path("/mnt/walnut-drive/dev/audits/audit-browser/static/data/audits.json")
+BUNDLE_PATH = AUDITS_DIR.parent / "AUDIT-BUNDLE.sqlite"
+
+
+def load_bundle():
+    """file_path -> (stamp, record JSON) from the compiled bundle, empty if there is none."""
+    if not BUNDLE_PATH.is_file():
+        return {}
+    try:
+        db = sqlite3.connect(f"file:{BUNDLE_PATH}?mode=ro", uri=True)
+        rows = db.execute("SELECT file_path, stamp, record FROM audits WHERE record IS NOT NULL").fetchall()
+        db.close()
+    except sqlite3.Error:
+        return {}
+    return {file_path: (stamp, record) for file_path, stamp, record in rows}
+
+
+def has_flag(content, key):
+    """True if key is set to true anywhere in the YAML or bundled JSON text."""
+    return f"{key}: true" in content or f'"{key}":true' in content
+
 
 def main():
     print("=== Regenerating audits.json for browser ===")
 
     audits = []
     categories = {}
+    bundled = load_bundle()
+    from_bundle = 0
 
     for yaml_file in sorted(AUDITS_DIR.rglob("*.yaml")):
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                data = yaml.safe_load(content)
+            st = os.stat(yaml_file)
+            stamp, record = bundled.get(str(yaml_file.relative_to(AUDITS_DIR.parent)), (None, None))
+            if stamp == f"{st.st_mtime_ns}:{st.st_size}":
+                content = record
+                data = json.loads(record)
+                from_bundle += 1
+            else:
+                with open(yaml_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                data = YamlSections(content).load('audit', 'execution', 'description')
 
             if not data or 'audit' not in data:
                 continue
@@ -67,9 +107,9 @@ def main():
                 "requires_team_input": False,
                 "requires_cost_data": False,
                 # New metadata fields from meta-audit (check execution section)
-                "requires_physical_access": execution.get('requires_physical_access', False) or 'requires_physical_access: true' in content,
-                "requires_human_evaluation": execution.get('requires_human_evaluation', False) or 'requires_human_evaluation: true' in content,
-                "requires_interviews": execution.get('requires_interviews', False) or 'requires_interviews: true' in content,
+                "requires_physical_access": execution.get('requires_physical_access', False) or has_flag(content, 'requires_physical_access'),
+                "requires_human_evaluation": execution.get('requires_human_evaluation', False) or has_flag(content, 'requires_human_evaluation'),
+                "requires_interviews": execution.get('requires_interviews', False) or has_flag(content, 'requires_interviews'),
                 # SDLC phases (simplified - most apply to all)
                 "discovery": True,
                 "prd": True,
@@ -110,7 +150,7 @@ def main():
         json.dump(output, f, indent=2)
 
     print(f"  Generated: {OUTPUT_PATH}")
-    print(f"  Audits: {len(audits)}")
+    print(f"  Audits: {len(audits)} ({from_bundle} from {BUNDLE_PATH.name})")
     print(f"  Categories: {len(categories)}")
 
     # Also copy to build directory if it exists
@@ -0,0 +1,342 @@
+"""
+Audit schema compiled from schema/AUDIT-TEMPLATE-BLANK.yaml.
+
+The template marks its fields with trailing annotations:
+
+    status: "active"                # [REQUIRED] active|draft|deprecated|archived
+    category_number: 0              # [REQUIRED] 1-43
+    code_patterns:                  # [CONDITIONAL]
+    blocks_phase: false             # [OPTIONAL]
+
+compile_schema() reads those annotations (and the template's own values
+for the expected types) into a tree of rules once; Schema.validate() then
+checks a parsed audit against every rule in a single walk over the tree:
+
+    [REQUIRED]      present and non-empty; when the template value is a
+                    list, mapping or boolean, of that type; when the note
+                    after the tag is a choice list (a|b|c) or a range
+                    (1-43), within it. A mapping the template does not
+                    annotate (audit:, description:, ...) is required when
+                    it holds required fields, and reported once when it
+                    is missing; required fields under an [OPTIONAL] or
+                    [CONDITIONAL] field are checked only when it exists.
+    [CONDITIONAL]   two or more siblings are alternatives of which at least
+                    one must be present (discovery's code_patterns,
+                    file_patterns, interviews, ...); a lone conditional
+                    field depends on context the template does not spell
+                    out and is only counted for coverage.
+    [OPTIONAL]      counted for coverage only.
+
+Fields inside sequence items (procedure.steps[].commands) count as present
+when any item has them.
+
+    schema = compile_schema()
+    result = schema.validate(data)      # result.issues, result.present
+    coverage = Coverage(schema)
+    coverage.add(result)
+    coverage.percentages()              # field -> % of documents
+
+Usage:
+    python3 scripts/audit_schema.py [--template PATH] PATH...
+
+Validates the audit YAMLs given (directories are searched recursively) and
+prints their issues and the per-field coverage.
+"""
+
+import argparse
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import yaml
+
+LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+TEMPLATE_PATH = Path(__file__).resolve().parent.parent / 'schema' / 'AUDIT-TEMPLATE-BLANK.yaml'
+
+REQUIRED, CONDITIONAL, OPTIONAL = 'required', 'conditional', 'optional'
+ITEM = '[]'
+
+_KEY_LINE = re.compile(r'^(?P<indent> *)(?P<dash>- +)?(?P<key>[A-Za-z_][\w-]*):(?:[ \t]+(?P<value>.*))?$')
+_ANNOTATION = re.compile(r'#\s*\[(?P<tag>REQUIRED|CONDITIONAL|OPTIONAL)\b[^\]]*\]\s*(?P<note>.*)$')
+_CHOICES = re.compile(r'^([\w-]+(?:\|[\w-]+)+)(?:\s|$)')
+_RANGE = re.compile(r'^(-?\d+)-(-?\d+)(?:\s|$)')
+_BLOCK_SCALAR = re.compile(r'^[|>][+-]?\d*\s*(?:#.*)?$')
+
+_MISSING = object()
+
+
+class Issue(NamedTuple):
+    field: str              # dotted path, or 'a OR b' for a conditional group
+    problem: str            # missing | empty | type | value
+    detail: str = ''
+
+
+@dataclass
+class Rule:
+    """One template field and the checks compiled for it."""
+    name: str
+    path: str
+    requirement: str | None = None
+    kind: type | None = None                    # list, dict or bool when the template says so
+    choices: frozenset[str] | None = None
+    bounds: tuple[int, int] | None = None
+    children: dict[str, 'Rule'] = field(default_factory=dict)
+    item: 'Rule | None' = None                  # rule for the fields of sequence items
+    groups: list[tuple['Rule', ...]] = field(default_factory=list)
+    holds_required: bool = False                # some descendant is [REQUIRED]
+
+    @property
+    def counted(self) -> bool:
+        return self.requirement is not None
+
+
+@dataclass
+class Validation:
+    issues: list[Issue]
+    present: set[str]
+
+
+def is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, (str, list, dict)):
+        return not (value.strip() if isinstance(value, str) else value)
+    return False
+
+
+def group_name(group: tuple[Rule, ...]) -> str:
+    return ' OR '.join(rule.path for rule in group)
+
+
+def _annotated_fields(text: str) -> list[tuple[tuple[str, ...], str, str]]:
+    """(key path, tag, note) for every annotated key line of the template, in order."""
+    found = []
+    stack: list[tuple[int, tuple[str, ...], bool]] = []    # (key column, path, has sequence items)
+    block_indent = None
+    for line in text.splitlines():
+        stripped = line.lstrip(' ')
+        indent = len(line) - len(stripped)
+        if not stripped or stripped.startswith('#'):
+            continue
+        if block_indent is not None:
+            if indent > block_indent:
+                continue
+            block_indent = None
+        match = _KEY_LINE.match(line)
+        if match is None:
+            continue
+        dash = match.group('dash') or ''
+        column = indent + len(dash)
+        while stack and stack[-1][0] >= (indent if dash else column):
+            stack.pop()
+        if dash and stack:
+            stack[-1] = (stack[-1][0], stack[-1][1], True)
+        parent = stack[-1][1] + (ITEM,) * stack[-1][2] if stack else ()
+        path = parent + (match.group('key'),)
+        stack.append((column, path, False))
+
+        value = match.group('value') or ''
+        if _BLOCK_SCALAR.match(value):
+            block_indent = column
+        annotation = _ANNOTATION.search(value)
+        if annotation:
+            found.append((path, annotation.group('tag').lower(), annotation.group('note').strip()))
+    return found
+
+
+def _template_value(template: Any, path: tuple[str, ...]) -> Any:
+    node = template
+    for key in path:
+        if key == ITEM:
+            node = node[0] if isinstance(node, list) and node else _MISSING
+        else:
+            node = node.get(key, _MISSING) if isinstance(node, dict) else _MISSING
+        if node is _MISSING:
+            break
+    return node
+
+
+class Schema:
+    """Compiled template rules; validate() checks one parsed audit."""
+
+    def __init__(self, text: str):
+        template = yaml.load(text, Loader=LOADER) or {}
+        self.root = Rule('', '')
+        self.fields: list[Rule] = []
+        for path, tag, note in _annotated_fields(text):
+            rule = self._rule(path)
+            rule.requirement = tag
+            example = _template_value(template, path)
+            if isinstance(example, (list, dict, bool)):
+                rule.kind = type(example)
+            if tag == REQUIRED:
+                self._mark_holders(path)
+                choices, bounds = _CHOICES.match(note), _RANGE.match(note)
+                if choices:
+                    rule.choices = frozenset(choices.group(1).split('|'))
+                elif bounds:
+                    rule.bounds = (int(bounds.group(1)), int(bounds.group(2)))
+            self.fields.append(rule)
+        self._group(self.root)
+
+    @classmethod
+    def from_file(cls, path: Path | str = TEMPLATE_PATH) -> 'Schema':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read())
+
+    def _rule(self, path: tuple[str, ...]) -> Rule:
+        node = self.root
+        for depth, key in enumerate(path):
+            if key == ITEM:
+                if node.item is None:
+                    node.item = Rule(ITEM, node.path + ITEM)
+                node = node.item
+                continue
+            if key not in node.children:
+                dotted = '.'.join(path[:depth + 1]).replace('.' + ITEM, ITEM)
+                node.children[key] = Rule(key, dotted)
+            node = node.children[key]
+        return node
+
+    def _mark_holders(self, path: tuple[str, ...]) -> None:
+        node = self.root
+        for key in path[:-1]:
+            node = node.item if key == ITEM else node.children[key]
+            node.holds_required = True
+
+    def _group(self, rule: Rule) -> None:
+        conditional = tuple(c for c in rule.children.values() if c.requirement == CONDITIONAL)
+        if len(conditional) > 1:
+            rule.groups.append(conditional)
+        for child in rule.children.values():
+            self._group(child)
+        if rule.item is not None:
+            self._group(rule.item)
+
+    @property
+    def coverage_fields(self) -> list[str]:
+        """Every annotated field, then every conditional group, in template order."""
+        names = [rule.path for rule in self.fields]
+        pending = [self.root]
+        while pending:
+            rule = pending.pop(0)
+            names += [group_name(g) for g in rule.groups]
+            pending += list(rule.children.values()) + ([rule.item] if rule.item else [])
+        return names
+
+    def validate(self, data: Any) -> Validation:
+        result = Validation([], set())
+        self._walk(self.root, data if isinstance(data, dict) else {}, True, result)
+        return result
+
+    def _walk(self, rule: Rule, value: Any, enforce: bool, result: Validation) -> None:
+        """Check rule's children against mapping value (or _MISSING), recording present fields."""
+        mapping = value if isinstance(value, dict) else {}
+        for child in rule.children.values():
+            sub = mapping.get(child.name, _MISSING)
+            present = sub is not _MISSING and not is_empty(sub)
+            if present and child.counted:
+                result.present.add(child.path)
+            if enforce and child.requirement == REQUIRED:
+                self._check(child, sub, result.issues)
+            elif enforce and child.requirement is None and child.holds_required and not isinstance(sub, dict):
+                result.issues.append(Issue(child.path, 'missing' if sub is _MISSING or sub is None else 'type',
+                                           '' if sub is _MISSING or sub is None else
+                                           f'expected dict, got {type(sub).__name__}'))
+                continue
+            if child.children:
+                self._walk(child, sub, enforce and (present or child.requirement is None), result)
+            if child.item is not None and isinstance(sub, list):
+                for element in sub:
+                    if isinstance(element, dict):
+                        self._walk(child.item, element, enforce, result)
+        for group in rule.groups:
+            if any(g.path in result.present for g in group):
+                result.present.add(group_name(group))
+            elif enforce:
+                result.issues.append(Issue(group_name(group), 'missing'))
+
+    @staticmethod
+    def _check(rule: Rule, value: Any, issues: list[Issue]) -> None:
+        if value is _MISSING:
+            issues.append(Issue(rule.path, 'missing'))
+        elif is_empty(value):
+            issues.append(Issue(rule.path, 'empty'))
+        elif rule.kind is not None and not isinstance(value, rule.kind):
+            issues.append(Issue(rule.path, 'type', f'expected {rule.kind.__name__}, got {type(value).__name__}'))
+        elif rule.choices is not None and str(value) not in rule.choices:
+            issues.append(Issue(rule.path, 'value', f'{value!r} is not one of {"|".join(sorted(rule.choices))}'))
+        elif rule.bounds is not None:
+            low, high = rule.bounds
+            if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+                issues.append(Issue(rule.path, 'value', f'{value!r} is not in {low}-{high}'))
+
+
+@lru_cache(maxsize=None)
+def compile_schema(template: Path | str = TEMPLATE_PATH) -> Schema:
+    """The compiled schema of a template, compiled once per process."""
+    return Schema.from_file(template)
+
+
+class Coverage:
+    """Share of validated documents that have each schema field."""
+
+    def __init__(self, schema: Schema):
+        self.fields = schema.coverage_fields
+        self.counts = dict.fromkeys(self.fields, 0)
+        self.documents = 0
+
+    def add(self, result: Validation | None) -> None:
+        """Count one document; None for one that did not parse."""
+        self.documents += 1
+        if result is not None:
+            for name in result.present:
+                self.counts[name] += 1
+
+    def percentages(self) -> dict[str, float]:
+        if not self.documents:
+            return {}
+        return {name: round(count / self.documents * 100, 2) for name, count in self.counts.items()}
+
+
+def _audit_files(paths: list[str]) -> list[Path]:
+    files = []
+    for path in map(Path, paths):
+        files += sorted(path.rglob('*.yaml')) if path.is_dir() else [path]
+    return files
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description='Validate audit YAMLs against the audit template')
+    parser.add_argument('--template', default=str(TEMPLATE_PATH), help='Annotated audit template')
+    parser.add_argument('paths', nargs='+', help='Audit YAML files or directories')
+    args = parser.parse_args(argv)
+
+    schema = compile_schema(args.template)
+    coverage = Coverage(schema)
+    failed = 0
+    for path in _audit_files(args.paths):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = schema.validate(yaml.load(f, Loader=LOADER))
+        except (OSError, yaml.YAMLError) as e:
+            print(f'{path}: unreadable: {str(e).splitlines()[0]}')
+            coverage.add(None)
+            failed += 1
+            continue
+        coverage.add(result)
+        failed += bool(result.issues)
+        for issue in result.issues:
+            print(f'{path}: {issue.field}: {issue.problem}' + (f' ({issue.detail})' if issue.detail else ''))
+
+    print(f'\n{coverage.documents} file(s), {failed} with issues\n\nField coverage:')
+    for name, pct in coverage.percentages().items():
+        print(f'  {pct:6.2f}%  {name}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -8,8 +8,17 @@ and populates the inventory with all relevant fields.
 
 SDLC phases: If an audit YAML has an `sdlc_phases` section, those values
 are used. Otherwise, defaults are applied based on the audit's scope.
+
+Also writes AUDIT-PATHS.tsv, an audit_id -> file_path map sorted by ID,
+so runners can resolve an audit's YAML exactly without walking the tree.
+Audit IDs defined by more than one file are reported as a warning (an
+error, exiting 1, with --strict).
+
+Only the audit, execution and sdlc_phases sections of each file are parsed
+(see yaml_sections.py).
 """
 
+import argparse
 import os
 import sys
 import csv
@@ -17,11 +26,14 @@ import yaml
 from pathlib import Path
 from typing import Any
 
+from yaml_sections import YamlSections
+
 # Determine base directory (script can run from anywhere)
 SCRIPT_DIR = Path(__file__).parent.resolve()
 BASE_DIR = SCRIPT_DIR.parent
 AUDITS_DIR = BASE_DIR / "audits"
 CSV_PATH = BASE_DIR / "AUDIT-INVENTORY.csv"
+PATHS_TSV_PATH = BASE_DIR / "AUDIT-PATHS.tsv"
 
 # CSV column headers
 CSV_HEADERS = [
@@ -209,9 +221,7 @@ def get_sdlc_phases(data: dict[str, Any], scope: str, existing_row: dict[str, st
 def parse_yaml_file(yaml_path: Path, existing_csv: dict[str, dict[str, str]]) -> dict[str, str] | None:
     """Parse a single YAML audit file and extract CSV row data."""
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            data = yaml.safe_load(content)
+        data = YamlSections.from_file(yaml_path).load('audit', 'execution', 'sdlc_phases')
 
         if not data or 'audit' not in data:
             return None
@@ -266,8 +276,33 @@ def parse_yaml_file(yaml_path: Path, existing_csv: dict[str, dict[str, str]]) ->
         return None
 
 
-def generate_inventory() -> int:
-    """Generate the AUDIT-INVENTORY.csv from all YAML files."""
+def write_paths_map(rows: list[dict[str, str]]) -> dict[str, list[str]]:
+    """Write AUDIT-PATHS.tsv (audit_id<TAB>file_path).
+
+    An ID defined by several files maps to the first of them in inventory
+    order, which is also the row lib/audit.sh and audit_engine use. Returns
+    such IDs with all of their files.
+    """
+    paths = {}
+    files: dict[str, list[str]] = {}
+    for row in rows:
+        audit_id = row['audit_id']
+        files.setdefault(audit_id, []).append(row['file_path'])
+        paths.setdefault(audit_id, row['file_path'])
+
+    with open(PATHS_TSV_PATH, 'w', encoding='utf-8') as f:
+        f.write("# audit_id\tfile_path (generated by scripts/generate-inventory.py)\n")
+        for audit_id in sorted(paths):
+            f.write(f"{audit_id}\t{paths[audit_id]}\n")
+
+    return {audit_id: found for audit_id, found in files.items() if len(found) > 1}
+
+
+def generate_inventory() -> tuple[int, dict[str, list[str]]]:
+    """Generate the AUDIT-INVENTORY.csv from all YAML files.
+
+    Returns the number of audits and the duplicated IDs with their files.
+    """
     print(f"Scanning audits in: {AUDITS_DIR}")
 
     # Load existing CSV for SDLC phase preservation
@@ -298,17 +333,34 @@ def generate_inventory() -> int:
     if errors:
         print(f"  ({errors} files skipped due to errors)")
 
-    return len(rows)
+    duplicates = write_paths_map(rows)
+    print(f"Generated {PATHS_TSV_PATH.name}")
+    if duplicates:
+        print(f"Warning: {len(duplicates)} audit ID(s) defined by more than one file "
+              f"(the first is used until they are renamed):", file=sys.stderr)
+        for audit_id, found in sorted(duplicates.items()):
+            print(f"  {audit_id}", file=sys.stderr)
+            for file_path in found:
+                print(f"    {file_path}", file=sys.stderr)
+
+    return len(rows), duplicates
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description='Generate AUDIT-INVENTORY.csv and AUDIT-PATHS.tsv')
+    parser.add_argument('--strict', action='store_true',
+                        help='Exit 1 if an audit ID is defined by more than one file')
+    args = parser.parse_args()
+
     if not AUDITS_DIR.exists():
         print(f"Error: Audits directory not found: {AUDITS_DIR}", file=sys.stderr)
         sys.exit(1)
 
-    count = generate_inventory()
+    count, duplicates = generate_inventory()
     print(f"\nInventory generation complete: {count} audits")
+    if duplicates and args.strict:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
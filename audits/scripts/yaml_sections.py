@@ -0,0 +1,121 @@
+"""
+Section-level loading of audit YAML files.
+
+Most tools need only a few top-level sections of an audit (usually
+`audit:` and `execution:`), yet yaml.safe_load parses the whole document,
+including the long signals, procedure and governance sections. Audit files
+are block mappings whose top-level keys start at column 0, so each section
+can be cut out of the text by offset and parsed on its own.
+
+    doc = YamlSections.from_file(path)
+    audit = doc.get('audit', {})
+    data = doc.load('audit', 'execution')      # {'audit': ..., 'execution': ...}
+
+A file is indexed only when it is regular: every non-blank line at column
+0 is a comment, a simple `key:` line or an item of the sequence under the
+key before it, there is no document marker beyond a leading `---`, and
+there are no anchors (an alias could reach into another section). Anything
+else is parsed in full on first access, so results are always what a full
+parse would give. Parse errors surface only for the sections actually
+loaded.
+
+Uses libyaml (CSafeLoader) when available.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Iterable
+
+import yaml
+
+LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Non-blank, non-comment lines at column 0, searched in "\n" + text (a
+# literal prefix is an order of magnitude faster to scan for than ^ in
+# MULTILINE mode)
+_TOP_LEVEL = re.compile(r'\n([^\s#][^\n]*)')
+_KEY = re.compile(r'([A-Za-z_][\w.-]*):(?:[ \t].*)?$')
+# Anchor definitions; the cheap hint rules out most files first
+_ANCHOR_HINT = re.compile(r'&[A-Za-z0-9_-]')
+_ANCHOR = re.compile(r'(?:^[ \t]*|:[ \t]+|-[ \t]+)&[A-Za-z0-9_-]+', re.M)
+# Block sequence items may sit at column 0 under their key
+_SEQUENCE_ITEM = re.compile(r'-(?:[ \t]|$)')
+
+
+class YamlSections:
+    """Top-level sections of one YAML document, each parsed on first access."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._parsed: dict[str, Any] = {}
+        self._full: dict[str, Any] | None = None
+        self.offsets = self._index(text)
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> 'YamlSections':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read())
+
+    @staticmethod
+    def _index(text: str) -> dict[str, tuple[int, int]] | None:
+        """Top-level key -> (start, end) offsets, or None if the file is not regular."""
+        if _ANCHOR_HINT.search(text) and _ANCHOR.search(text):
+            return None
+        starts: list[tuple[str, int]] = []
+        for match in _TOP_LEVEL.finditer('\n' + text):
+            line, start = match.group(1), match.start(1) - 1
+            if line.rstrip() == '---' and start == 0:
+                continue
+            if starts and _SEQUENCE_ITEM.match(line):
+                continue
+            key = _KEY.match(line)
+            if key is None:
+                return None
+            starts.append((key.group(1), start))
+        offsets = {}
+        for i, (name, start) in enumerate(starts):
+            if name in offsets:
+                return None
+            end = starts[i + 1][1] if i + 1 < len(starts) else len(text)
+            offsets[name] = (start, end)
+        return offsets
+
+    @property
+    def regular(self) -> bool:
+        return self.offsets is not None
+
+    def keys(self) -> list[str]:
+        if self.offsets is not None:
+            return list(self.offsets)
+        return list(self.full())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.keys()
+
+    def full(self) -> dict[str, Any]:
+        """The whole document (parsed once)."""
+        if self._full is None:
+            data = yaml.load(self.text, Loader=LOADER)
+            self._full = data if isinstance(data, dict) else {}
+        return self._full
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """One top-level section's value, default if the document has no such key."""
+        if self.offsets is None:
+            return self.full().get(name, default)
+        if name not in self._parsed:
+            if name not in self.offsets:
+                return default
+            start, end = self.offsets[name]
+            data = yaml.load(self.text[start:end], Loader=LOADER)
+            self._parsed[name] = data.get(name) if isinstance(data, dict) else None
+        return self._parsed[name]
+
+    def load(self, *names: str) -> dict[str, Any]:
+        """The named sections that exist, as a partial document."""
+        return {name: self.get(name) for name in names if name in self}
+
+
+def load_sections(path: Path | str, names: Iterable[str]) -> dict[str, Any]:
+    """Just the named top-level sections of an audit YAML file."""
+    return YamlSections.from_file(path).load(*names)
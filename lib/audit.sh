@@ -57,9 +57,111 @@ AUDIT_MIN_RECOMMENDATIONS="${AUDIT_MIN_RECOMMENDATIONS:-10}"
 AUDIT_MAX_RECOMMENDATIONS="${AUDIT_MAX_RECOMMENDATIONS:-50}"
 AUDIT_DEFAULT_RECOMMENDATIONS="${AUDIT_DEFAULT_RECOMMENDATIONS:-25}"
 
+# Preselection: rank the phase's applicable audits against the project
+# context offline and show the selection LLM only the best AUDIT_PRESELECT_TOP
+# (at least 2x the requested recommendations)
+#   bm25 - BM25 over audit text + discovery file globs matched against the
+#          project (requires python3 + PyYAML, falls back to off)
+#   off  - first 150 applicable audits in inventory order
+AUDIT_PRESELECT="${AUDIT_PRESELECT:-bm25}"
+AUDIT_PRESELECT_TOP="${AUDIT_PRESELECT_TOP:-60}"
+
 # Run ALL applicable audits (bypass LLM selection)
 # WARNING: Can be 300-1900 audits depending on phase - very expensive!
 AUDIT_RUN_ALL="${AUDIT_RUN_ALL:-false}"
+# Run-all filters (comma-separated, empty = no filter) and order (comma-separated
+# keys: inventory, severity, duration, tier, category); require python3
+AUDIT_RUN_ALL_TIERS="${AUDIT_RUN_ALL_TIERS:-}"              # e.g. expert,phd
+AUDIT_RUN_ALL_SEVERITIES="${AUDIT_RUN_ALL_SEVERITIES:-}"    # e.g. critical,high
+AUDIT_RUN_ALL_AUTOMATABLE="${AUDIT_RUN_ALL_AUTOMATABLE:-}"  # yes, partial, manual
+AUDIT_RUN_ALL_CATEGORIES="${AUDIT_RUN_ALL_CATEGORIES:-}"
+AUDIT_RUN_ALL_ORDER="${AUDIT_RUN_ALL_ORDER:-inventory}"
+
+# Corpus bundle: compile the audits repo into AUDIT-BUNDLE.sqlite (parsed
+# definitions, inventory, rendered prompts) so engine commands skip YAML
+# parsing. Refreshed incrementally on init; only edited audits are re-parsed.
+# Off by default: the bundle (~33 MB) is written into the audits checkout
+# (requires python3 + PyYAML and a writable audits repo) (on|off)
+AUDIT_BUNDLE="${AUDIT_BUNDLE:-off}"
+
+# Discovery pre-pass: evaluate each audit's file/code patterns against the
+# project before invoking agents (requires python3 + PyYAML, see lib/audit_engine)
+#   off       - no pre-pass, every audit gets a full agent run
+#   downgrade - audits with zero evidence run with AUDIT_DOWNGRADE_TURNS turns
+#   skip      - audits with zero evidence are recorded as "skip", no agent run
+AUDIT_DISCOVERY="${AUDIT_DISCOVERY:-downgrade}"
+AUDIT_DOWNGRADE_TURNS="${AUDIT_DOWNGRADE_TURNS:-8}"
+AUDIT_PROJECT_ROOT="${AUDIT_PROJECT_ROOT:-$PWD}"
+
+# Result cache: reuse an audit's result while its YAML, the project files its
+# discovery patterns matched and the prompt context are unchanged (keys come
+# from the discovery pre-pass, stored under $AUDIT_CACHE_DIR/results)
+#   on      - return cached results, store new ones
+#   refresh - ignore cached results, store new ones
+#   off     - no caching
+AUDIT_RESULT_CACHE="${AUDIT_RESULT_CACHE:-on}"
+AUDIT_RESULT_TTL="${AUDIT_RESULT_TTL:-604800}"  # seconds (7 days); 0 = never expire
+
+# Project snapshot: a compact repo map (layout, languages, manifests,
+# dependencies, entry points) built once and cached by git tree hash, placed
+# at the top of every audit prompt so agents skip re-exploring the tree
+# (requires python3; on|off)
+AUDIT_PROJECT_SNAPSHOT="${AUDIT_PROJECT_SNAPSHOT:-on}"
+
+# Audit definition format in agent prompts
+#   compact - execution-relevant fields only (signals, procedure, discovery
+#             evidence), rendered densely within AUDIT_PROMPT_BUDGET tokens
+#             (requires python3 + PyYAML, falls back to full)
+#   full    - the entire audit YAML
+AUDIT_PROMPT_FORMAT="${AUDIT_PROMPT_FORMAT:-compact}"
+AUDIT_PROMPT_BUDGET="${AUDIT_PROMPT_BUDGET:-2500}"  # estimated tokens per audit; 0 = unlimited
+
+# Audit scheduling: order and concurrency of agent runs (AUDIT_PARALLEL is
+# the starting concurrency)
+#   adaptive - longest/critical audits first; concurrency grows towards
+#              AUDIT_PARALLEL_MAX while the provider keeps up and halves on
+#              rate limits or agent failures (requires python3)
+#   fixed    - longest/critical audits first, AUDIT_PARALLEL concurrent
+#   fifo     - recommendation order, AUDIT_PARALLEL concurrent (pure bash;
+#              no dependency ordering)
+AUDIT_SCHEDULER="${AUDIT_SCHEDULER:-adaptive}"
+AUDIT_PARALLEL_MAX="${AUDIT_PARALLEL_MAX:-12}"
+
+# Batching: run compatible audits (same subcategory and tier, overlapping
+# discovery evidence) in one agent session, so the project is explored once
+# per batch instead of once per audit (requires python3)
+AUDIT_BATCH_SIZE="${AUDIT_BATCH_SIZE:-4}"          # audits per session; 1 = no batching
+AUDIT_BATCH_TOKENS="${AUDIT_BATCH_TOKENS:-8000}"   # estimated definition tokens per session
+AUDIT_BATCH_MINUTES="${AUDIT_BATCH_MINUTES:-360}"  # summed estimated_duration per session
+
+# Seconds an audit agent session (single or batched) may run
+AUDIT_AGENT_TIMEOUT="${AUDIT_AGENT_TIMEOUT:-1200}"
+
+# Audit dependencies from the corpus relationship graph (relationships.depends_on
+# and feeds_into of each audit YAML, see audit_engine graph)
+#   graph - audits wait for their upstream audits and get their results in the
+#           prompt; independent audits still run concurrently. needs-deps
+#           recommendations whose upstream audits are in the same run are run
+#           too (requires python3 and the adaptive or fixed scheduler)
+#   off   - ready audits only, no ordering
+AUDIT_DEPENDENCIES="${AUDIT_DEPENDENCIES:-graph}"
+
+# Streaming remediation pipeline: while findings are still being reviewed,
+# each accepted resolution is turned into a small patch (exact-text edits) of
+# the phase artifact by a background agent. "apply" merges the patches in the
+# order they were accepted; only those that fail to apply (or overflow the
+# queue) go through the full-document revision (requires python3; phases
+# whose artifact is a single file)
+AUDIT_REMEDIATE_PIPELINE="${AUDIT_REMEDIATE_PIPELINE:-on}"
+AUDIT_REMEDIATE_PARALLEL="${AUDIT_REMEDIATE_PARALLEL:-3}"  # patch agents at once
+AUDIT_REMEDIATE_QUEUE="${AUDIT_REMEDIATE_QUEUE:-12}"       # accepted resolutions waiting for an agent
+
+# Execution telemetry: one JSON line per executed audit (agent start/end,
+# provider, model, turn budget and whether it ran out, prompt/response size,
+# parse strategy, outcome) appended to AUDIT_TELEMETRY_FILE. Summarize with
+# audit_telemetry_report (on|off)
+AUDIT_TELEMETRY="${AUDIT_TELEMETRY:-on}"
+AUDIT_TELEMETRY_FILE="${AUDIT_TELEMETRY_FILE:-$AUDIT_OUTPUT_DIR/audit-telemetry.jsonl}"
 
 # Phase number to CSV column mapping
 declare -A AUDIT_PHASE_COLUMNS=(
@@ -83,6 +185,24 @@ _AUDIT_INITIALIZED=false
 _AUDIT_REPO_PATH=""
 _AUDIT_INVENTORY_PATH=""
 _AUDIT_MENU_PATH=""  # DEPRECATED
+_AUDIT_ENGINE_OK=""  # cached result of _audit_engine_available
+_AUDIT_DISCOVERY_DIR=""  # manifests from the current discovery pre-pass
+_AUDIT_PROMPT_DIR=""  # compact prompts rendered for the current phase
+_AUDIT_SNAPSHOT_FILE=""  # project snapshot for the current phase
+_AUDIT_PROMPT_SAVED=0  # estimated prompt tokens saved by compact rendering
+_AUDIT_SCHED_STATS="{}"  # statistics of the last scheduled run
+_AUDIT_DEP_GRAPH=""  # dependency run plan (audit_engine graph) for the current phase
+_AUDIT_RUN_AUDITS="[]"  # recommendations to run in the current phase
+_AUDIT_AGENT_DIR=""  # agent telemetry records (<audit_id>.json) of the current phase
+_AUDIT_COLLECT_SUMMARY="{}"  # summary of the last collected phase
+_AUDIT_RESULT_STATUS="" _AUDIT_RESULT_CACHED="" _AUDIT_RESULT_MESSAGE="" _AUDIT_RESULT_JSON=""  # last collected result
+declare -a _AUDIT_UNITS=()  # agent sessions of the current phase: space-separated audit indices
+declare -a _AUDIT_COLLECTED=()  # audit index -> validated result JSON, for downstream prompts
+_AUDIT_REMEDY_DIR=""  # remediation pipeline of the current streaming run ("" = off)
+declare -A _AUDIT_REMEDY_PIDS=()  # patch sequence -> running patch agent PID
+declare -a _AUDIT_REMEDY_QUEUE=()  # patch sequences waiting for an agent
+declare -A _AUDIT_PATHS  # audit_id -> YAML path relative to the audits repo
+_AUDIT_PATHS_LOADED=false
 
 # ============================================================================
 # INITIALIZATION
@@ -99,10 +219,21 @@ audit_init() {
     if [[ -f "$AUDIT_CONFIG_FILE" ]]; then
         _audit_load_config
     fi
+    _audit_bundle_refresh
 
     _AUDIT_INITIALIZED=true
 }
 
+# Bring the compiled corpus bundle up to date (see AUDIT_BUNDLE). The first
+# build parses every audit YAML; later refreshes only the edited ones.
+# Engine commands fall back to the YAML files whenever this fails.
+_audit_bundle_refresh() {
+    [[ "$AUDIT_BUNDLE" == "on" && -n "$_AUDIT_REPO_PATH" && -w "$_AUDIT_REPO_PATH" ]] || return 0
+    _audit_engine_available || return 0
+    [[ -f "$_AUDIT_REPO_PATH/AUDIT-BUNDLE.sqlite" ]] || echo -e "  ${DIM}Compiling audit corpus bundle...${NC}" >&2
+    _audit_engine bundle --repo "$_AUDIT_REPO_PATH" >/dev/null 2>&1 || true
+}
+
 _audit_load_config() {
     local config="$AUDIT_CONFIG_FILE"
 
@@ -142,6 +273,249 @@ _audit_load_config() {
     _AUDIT_CONFIG[air_gap_mode]=$(jq -r '.audit_plan.air_gap_mode // "auto"' "$config")
 }
 
+# Load the audit_id -> file path map once (AUDIT-PATHS.tsv, else the
+# inventory's file_path column). Call before forking audit workers so every
+# worker inherits it.
+_audit_load_paths() {
+    [[ "$_AUDIT_PATHS_LOADED" == "true" ]] && return 0
+    _AUDIT_PATHS_LOADED=true
+    [[ -n "$_AUDIT_REPO_PATH" ]] || return 0
+
+    local audit_id file_path
+    if [[ -f "$_AUDIT_REPO_PATH/AUDIT-PATHS.tsv" ]]; then
+        while IFS=$'\t' read -r audit_id file_path; do
+            [[ -z "$audit_id" || "$audit_id" == \#* ]] && continue
+            _AUDIT_PATHS[$audit_id]="$file_path"
+        done < "$_AUDIT_REPO_PATH/AUDIT-PATHS.tsv"
+    elif [[ -f "$_AUDIT_REPO_PATH/AUDIT-INVENTORY.csv" ]]; then
+        # audit_id and file_path are the first two columns and never quoted
+        while IFS=, read -r audit_id file_path _; do
+            [[ -z "$audit_id" || "$audit_id" == "audit_id" ]] && continue
+            [[ -n "${_AUDIT_PATHS[$audit_id]:-}" ]] || _AUDIT_PATHS[$audit_id]="$file_path"
+        done < "$_AUDIT_REPO_PATH/AUDIT-INVENTORY.csv"
+    fi
+}
+
+# Resolve an audit ID to its YAML file (exact match on the full ID)
+# Usage: audit_file=$(_audit_resolve_file "$audit_id")
+_audit_resolve_file() {
+    local audit_id="$1"
+    _audit_load_paths
+    local rel="${_AUDIT_PATHS[$audit_id]:-}"
+    [[ -n "$rel" && -f "$_AUDIT_REPO_PATH/$rel" ]] && echo "$_AUDIT_REPO_PATH/$rel"
+    return 0
+}
+
+# ============================================================================
+# AUDIT ENGINE (Python accelerators, lib/audit_engine)
+# ============================================================================
+
+# Check once whether the Python audit engine can run (python3 + PyYAML).
+# Every caller keeps a bash fallback for when it cannot.
+_audit_engine_available() {
+    if [[ -z "$_AUDIT_ENGINE_OK" ]]; then
+        if command -v python3 &>/dev/null && python3 -c 'import yaml' &>/dev/null; then
+            _AUDIT_ENGINE_OK=true
+        else
+            _AUDIT_ENGINE_OK=false
+        fi
+    fi
+    [[ "$_AUDIT_ENGINE_OK" == "true" ]]
+}
+
+# Run an audit engine subcommand
+# Usage: _audit_engine discover --repo "$_AUDIT_REPO_PATH" ...
+_audit_engine() {
+    PYTHONPATH="$ATOMIC_ROOT/lib${PYTHONPATH:+:$PYTHONPATH}" python3 -m audit_engine "$@"
+}
+
+# Evaluate discovery patterns of all ready audits in one pass over the project.
+# Sets _AUDIT_DISCOVERY_DIR to the manifest directory on success.
+# Usage: _audit_discovery_prepass "$ready_audits_json" "$phase_num"
+_audit_discovery_prepass() {
+    local ready_audits="$1"
+    local phase_num="$2"
+
+    _AUDIT_DISCOVERY_DIR=""
+    [[ "$AUDIT_DISCOVERY" == "off" && "$AUDIT_RESULT_CACHE" == "off" ]] && return 0
+    [[ -z "$_AUDIT_REPO_PATH" ]] && return 0
+    _audit_engine_available || return 0
+
+    local manifest_dir="$AUDIT_CACHE_DIR/discovery-phase${phase_num}"
+    rm -rf "$manifest_dir"
+
+    # Prompt inputs shared by every audit also invalidate cached results, and
+    # so do the keys of an audit's upstream audits (their results are in its prompt)
+    local -a context_args=(--setting "prompt $AUDIT_PROMPT_FORMAT $AUDIT_PROMPT_BUDGET")
+    local context_file
+    for context_file in "$ATOMIC_OUTPUT_DIR/0-setup/project-config.json" \
+                        "$ATOMIC_OUTPUT_DIR/1-discovery/selected-approach.json" \
+                        "$_AUDIT_SNAPSHOT_FILE"; do
+        [[ -f "$context_file" ]] && context_args+=(--context "$context_file")
+    done
+    [[ -n "$_AUDIT_DEP_GRAPH" && -f "$_AUDIT_DEP_GRAPH" ]] && context_args+=(--plan "$_AUDIT_DEP_GRAPH")
+
+    local summary
+    if ! summary=$(echo "$ready_audits" | jq -r '.[].audit_id' | \
+            _audit_engine discover --repo "$_AUDIT_REPO_PATH" --project "$AUDIT_PROJECT_ROOT" \
+                --out "$manifest_dir" "${context_args[@]}" --ids-file - 2>/dev/null); then
+        echo -e "  ${YELLOW}!${NC} Discovery pre-pass failed — running all audits in full"
+        return 0
+    fi
+
+    _AUDIT_DISCOVERY_DIR="$manifest_dir"
+
+    local files evidence none elapsed
+    read -r files evidence none elapsed < <(echo "$summary" | jq -r '
+        [.files_scanned,
+         ([.audits[] | select(.verdict == "evidence")] | length),
+         ([.audits[] | select(.verdict == "none")] | length),
+         .elapsed_ms] | @tsv')
+    echo -e "  ${DIM}Discovery: scanned $files files in ${elapsed}ms — $evidence with evidence, $none without ($AUDIT_DISCOVERY)${NC}"
+}
+
+# Build (or reuse) the project snapshot. Sets _AUDIT_SNAPSHOT_FILE on success.
+# Usage: _audit_project_snapshot [--quiet]
+_audit_project_snapshot() {
+    _AUDIT_SNAPSHOT_FILE=""
+    [[ "$AUDIT_PROJECT_SNAPSHOT" == "on" ]] || return 0
+    _audit_engine_available || return 0
+
+    local info
+    info=$(_audit_engine context --project "$AUDIT_PROJECT_ROOT" \
+        --cache-dir "$AUDIT_CACHE_DIR/snapshots" 2>/dev/null) || return 0
+    _AUDIT_SNAPSHOT_FILE=$(echo "$info" | jq -r '.path // ""')
+    [[ -f "$_AUDIT_SNAPSHOT_FILE" ]] || { _AUDIT_SNAPSHOT_FILE=""; return 0; }
+
+    if [[ "${1:-}" != "--quiet" ]]; then
+        local tokens origin
+        read -r tokens origin < <(echo "$info" | jq -r '[.tokens, (if .cached then "cached" else "built" end)] | @tsv')
+        echo -e "  ${DIM}Snapshot: ~$tokens tokens of project context ($origin), shared by every audit${NC}"
+    fi
+}
+
+# Project snapshot section opening every audit prompt (same text for every
+# agent of a phase)
+# Usage: _audit_snapshot_section >> "$prompt_file"
+_audit_snapshot_section() {
+    [[ -n "$_AUDIT_SNAPSHOT_FILE" && -f "$_AUDIT_SNAPSHOT_FILE" ]] || return 0
+    cat "$_AUDIT_SNAPSHOT_FILE"
+    echo ""
+}
+
+# Render compact audit definitions for all ready audits (after the pre-pass,
+# so discovery evidence is folded in). Sets _AUDIT_PROMPT_DIR on success.
+# Usage: _audit_render_prompts "$ready_audits_json" "$phase_num"
+_audit_render_prompts() {
+    local ready_audits="$1"
+    local phase_num="$2"
+
+    _AUDIT_PROMPT_DIR=""
+    _AUDIT_PROMPT_SAVED=0
+    [[ "$AUDIT_PROMPT_FORMAT" == "compact" ]] || return 0
+    [[ -z "$_AUDIT_REPO_PATH" ]] && return 0
+    _audit_engine_available || return 0
+
+    local prompt_dir="$AUDIT_CACHE_DIR/prompts-phase${phase_num}"
+    rm -rf "$prompt_dir"
+
+    local -a evidence_args=()
+    if [[ "$AUDIT_DISCOVERY" != "off" && -n "$_AUDIT_DISCOVERY_DIR" ]]; then
+        evidence_args=(--evidence-dir "$_AUDIT_DISCOVERY_DIR")
+    fi
+
+    local summary
+    if ! summary=$(echo "$ready_audits" | jq -r '.[].audit_id' | \
+            _audit_engine prompt --repo "$_AUDIT_REPO_PATH" --out "$prompt_dir" \
+                --budget "$AUDIT_PROMPT_BUDGET" "${evidence_args[@]}" --ids-file - 2>/dev/null); then
+        echo -e "  ${YELLOW}!${NC} Prompt rendering failed — sending full audit YAML"
+        return 0
+    fi
+
+    _AUDIT_PROMPT_DIR="$prompt_dir"
+
+    local original tokens truncated
+    read -r original tokens truncated < <(echo "$summary" | jq -r '
+        [.original_tokens, .tokens, ([.audits[] | select(.truncated)] | length)] | @tsv')
+    _AUDIT_PROMPT_SAVED=$((original - tokens))
+    local pct=0
+    ((original > 0)) && pct=$((100 * _AUDIT_PROMPT_SAVED / original))
+    echo -e "  ${DIM}Prompts: ~$tokens tokens vs ~$original as YAML — saved ~$_AUDIT_PROMPT_SAVED (${pct}%), $truncated truncated to budget${NC}"
+}
+
+# Field of one audit's manifest from the current pre-pass ("" if none)
+# Usage: verdict=$(_audit_discovery_field "$audit_id" verdict)   # evidence | none | n/a
+_audit_discovery_field() {
+    local manifest="$_AUDIT_DISCOVERY_DIR/$1.json"
+    [[ -n "$_AUDIT_DISCOVERY_DIR" && -f "$manifest" ]] || return 0
+    jq -r --arg f "$2" '.[$f] // ""' "$manifest" 2>/dev/null
+}
+
+# Print a cached result for audit_id/key (marked "cached": true); 1 on miss
+_audit_result_cache_get() {
+    local audit_id="$1"
+    local key="$2"
+    [[ "$AUDIT_RESULT_CACHE" == "on" && -n "$key" ]] || return 1
+
+    local cached="$AUDIT_CACHE_DIR/results/$audit_id/$key.json"
+    [[ -s "$cached" ]] || return 1
+    if ((AUDIT_RESULT_TTL > 0)); then
+        local age=$(( $(date +%s) - $(_audit_file_mtime "$cached") ))
+        if ((age > AUDIT_RESULT_TTL)); then
+            rm -f "$cached"
+            return 1
+        fi
+    fi
+    jq -c '. + {cached: true}' "$cached" 2>/dev/null
+}
+
+# Store a completed result (pass/warn/fail only), replacing older keys for the audit
+_audit_result_cache_put() {
+    local audit_id="$1"
+    local key="$2"
+    local result="$3"
+    [[ "$AUDIT_RESULT_CACHE" != "off" && -n "$key" ]] || return 0
+
+    local status
+    status=$(echo "$result" | jq -r '.status // ""' 2>/dev/null)
+    [[ "$status" =~ ^(pass|warn|fail)$ ]] || return 0
+
+    local dir="$AUDIT_CACHE_DIR/results/$audit_id"
+    mkdir -p "$dir"
+    rm -f "$dir"/*.json
+    echo "$result" > "$dir/$key.json.tmp" && mv "$dir/$key.json.tmp" "$dir/$key.json"
+}
+
+# Drop cached results for one audit, or for all audits
+# Usage: audit_cache_clear [audit_id]
+audit_cache_clear() {
+    local audit_id="${1:-}"
+    if [[ -n "$audit_id" ]]; then
+        rm -rf "${AUDIT_CACHE_DIR:?}/results/$audit_id"
+    else
+        rm -rf "${AUDIT_CACHE_DIR:?}/results"
+    fi
+}
+
+# Latency percentiles, outcomes and badly-off duration estimates from the
+# execution telemetry (see AUDIT_TELEMETRY), optionally over the last N runs
+# Usage: audit_telemetry_report [runs]
+audit_telemetry_report() {
+    local runs="${1:-0}"
+    audit_init
+    if [[ ! -s "$AUDIT_TELEMETRY_FILE" ]]; then
+        echo "No audit telemetry recorded yet ($AUDIT_TELEMETRY_FILE)" >&2
+        return 1
+    fi
+    if ! _audit_engine_available; then
+        echo "ERROR: audit telemetry report needs python3 (audit_engine)" >&2
+        return 1
+    fi
+    local -a repo_args=()
+    [[ -n "$_AUDIT_REPO_PATH" ]] && repo_args=(--repo "$_AUDIT_REPO_PATH")
+    _audit_engine telemetry --file "$AUDIT_TELEMETRY_FILE" "${repo_args[@]}" --runs "$runs" --format text
+}
+
 # ============================================================================
 # AUDIT INVENTORY (CSV-based, phase-filtered)
 # ============================================================================
@@ -230,10 +604,42 @@ audit_get_phase_audits() {
     echo "$csv_content" | tail -n +2 | awk -F',' -v col="$col_index" '$col == "Yes"'
 }
 
-# Format filtered audits for LLM consumption (concise format)
+# Rank the phase's applicable audits against the project context (see
+# AUDIT_PRESELECT) and print the top entries as the LLM table
+# Usage: _audit_rank_for_llm "$filtered_csv" "$context" "$top"
+_audit_rank_for_llm() {
+    local filtered="$1"
+    local context="$2"
+    local top="$3"
+
+    [[ "$AUDIT_PRESELECT" == "bm25" && -n "$_AUDIT_REPO_PATH" ]] || return 1
+    _audit_engine_available || return 1
+
+    local ids_file context_file ranked
+    ids_file=$(atomic_mktemp)
+    context_file=$(atomic_mktemp)
+    echo "$filtered" | tail -n +2 | cut -d',' -f1 > "$ids_file"
+    echo -e "$context" > "$context_file"
+    ranked=$(_audit_engine rank --repo "$_AUDIT_REPO_PATH" --ids-file "$ids_file" \
+        --context "$context_file" --project "$AUDIT_PROJECT_ROOT" --top "$top" \
+        --index-cache "$AUDIT_CACHE_DIR/rank-index.json" 2>/dev/null) || ranked=""
+    rm -f "$ids_file" "$context_file"
+    [[ -n "$ranked" ]] || return 1
+
+    echo "$ranked" | jq -r '.ranked[] |
+        "| \(.audit_id) | \(.name) | \(.category) | \(.tier) | \(
+            if .automatable == "yes" then "Yes" elif .automatable == "partial" then "Semi" else "Manual" end) |"'
+}
+
+# Format filtered audits for LLM consumption (concise format). Given the
+# project context, the top_k most relevant audits are listed instead
+# (AUDIT_PRESELECT); max_audits applies when ranking is unavailable.
+# Usage: audit_format_for_llm "$phase_num" [max_audits] [context] [top_k]
 audit_format_for_llm() {
     local phase_num="$1"
     local max_audits="${2:-200}"
+    local context="${3:-}"
+    local top_k="${4:-$AUDIT_PRESELECT_TOP}"
     local filtered count
 
     filtered=$(audit_get_phase_audits "$phase_num")
@@ -244,6 +650,18 @@ audit_format_for_llm() {
     count=$(echo "$filtered" | tail -n +2 | wc -l)
     local phase_column="${AUDIT_PHASE_COLUMNS[$phase_num]}"
 
+    local rows
+    if [[ -n "$context" ]] && rows=$(_audit_rank_for_llm "$filtered" "$context" "$top_k"); then
+        echo "## Most Relevant Audits for Phase $phase_num ($phase_column)"
+        echo ""
+        echo "Total applicable: $count audits — showing the $(echo "$rows" | wc -l) most relevant to this project, best first"
+        echo ""
+        echo "| Audit ID | Name | Category | Tier | Automated |"
+        echo "|----------|------|----------|------|-----------|"
+        echo "$rows"
+        return 0
+    fi
+
     echo "## Audits Available for Phase $phase_num ($phase_column)"
     echo ""
     echo "Total applicable: $count audits"
@@ -808,25 +1226,31 @@ audit_gather_context() {
         context+="  Description: $project_desc\n\n"
     fi
 
-    # Tech stack detection
-    local tech_stack=""
-    if [[ -f "package.json" ]]; then
-        tech_stack+="Node.js/JavaScript, "
-    fi
-    if [[ -f "requirements.txt" ]] || [[ -f "pyproject.toml" ]]; then
-        tech_stack+="Python, "
-    fi
-    if [[ -f "Cargo.toml" ]]; then
-        tech_stack+="Rust, "
-    fi
-    if [[ -f "go.mod" ]]; then
-        tech_stack+="Go, "
-    fi
-    if [[ -f "Dockerfile" ]]; then
-        tech_stack+="Docker, "
-    fi
+    # Tech stack: from the project snapshot (appended below) when available,
+    # otherwise detected from a few marker files
+    _audit_project_snapshot --quiet
 
-    context+="TECH STACK: ${tech_stack:-Not detected}\n\n"
+    if [[ -n "$_AUDIT_SNAPSHOT_FILE" ]]; then
+        context+="TECH STACK: see PROJECT SNAPSHOT below\n\n"
+    else
+        local tech_stack=""
+        if [[ -f "package.json" ]]; then
+            tech_stack+="Node.js/JavaScript, "
+        fi
+        if [[ -f "requirements.txt" ]] || [[ -f "pyproject.toml" ]]; then
+            tech_stack+="Python, "
+        fi
+        if [[ -f "Cargo.toml" ]]; then
+            tech_stack+="Rust, "
+        fi
+        if [[ -f "go.mod" ]]; then
+            tech_stack+="Go, "
+        fi
+        if [[ -f "Dockerfile" ]]; then
+            tech_stack+="Docker, "
+        fi
+        context+="TECH STACK: ${tech_stack:-Not detected}\n\n"
+    fi
 
     # Phase artifacts
     context+="PHASE: $phase_num - $phase_name\n\n"
@@ -847,6 +1271,11 @@ audit_gather_context() {
     context+="\nCOMPLIANCE REQUIREMENTS: $compliance\n"
 
     echo -e "$context"
+
+    if [[ -n "$_AUDIT_SNAPSHOT_FILE" ]]; then
+        echo "PROJECT SNAPSHOT:"
+        tail -n +3 "$_AUDIT_SNAPSHOT_FILE"
+    fi
 }
 
 # ============================================================================
@@ -854,7 +1283,7 @@ audit_gather_context() {
 # ============================================================================
 
 # Generate recommendations for ALL applicable audits (no LLM selection)
-# Used when AUDIT_RUN_ALL=true
+# Used when AUDIT_RUN_ALL=true; AUDIT_RUN_ALL_* filter and order the list
 audit_get_all_recommendations() {
     local phase_num="$1"
     local phase_name="$2"
@@ -863,65 +1292,67 @@ audit_get_all_recommendations() {
 
     local phase_column="${AUDIT_PHASE_COLUMNS[$phase_num]:-}"
     local csv_file
-    csv_file=$(_audit_fetch_inventory_csv)
-
-    if [[ -z "$csv_file" || ! -f "$csv_file" ]]; then
+    csv_file=$(atomic_mktemp)
+    if ! _audit_fetch_inventory_csv > "$csv_file" || [[ ! -s "$csv_file" ]]; then
+        rm -f "$csv_file"
         echo '{"error": "Could not fetch audit inventory"}'
         return 1
     fi
 
-    # Get header to find column index
-    local header col_idx
-    header=$(head -1 "$csv_file")
-    col_idx=$(echo "$header" | tr ',' '\n' | grep -n "^${phase_column}$" | cut -d: -f1)
+    local recommendations rc=0
+    if _audit_engine_available; then
+        recommendations=$(_audit_engine recommend --inventory "$csv_file" --column "$phase_column" \
+            --phase "$phase_num" --phase-name "$phase_name" \
+            --tier "$AUDIT_RUN_ALL_TIERS" --severity "$AUDIT_RUN_ALL_SEVERITIES" \
+            --automatable "$AUDIT_RUN_ALL_AUTOMATABLE" --category "$AUDIT_RUN_ALL_CATEGORIES" \
+            --order "$AUDIT_RUN_ALL_ORDER") || rc=$?
+    else
+        recommendations=$(_audit_all_recommendations_awk "$csv_file" "$phase_num" "$phase_name" "$phase_column") || rc=$?
+    fi
+    rm -f "$csv_file"
+    if [[ $rc -ne 0 ]]; then
+        echo "$recommendations"
+        return 1
+    fi
+
+    local selected total
+    read -r selected total < <(echo "$recommendations" | jq -r '[(.recommendations | length), .total_available] | @tsv')
+    if [[ "$selected" == "$total" ]]; then
+        echo -e "  ${YELLOW}⚠ AUDIT_RUN_ALL=true: Selecting ALL $total applicable audits${NC}" >&2
+    else
+        echo -e "  ${YELLOW}⚠ AUDIT_RUN_ALL=true: Selecting $selected of $total applicable audits (AUDIT_RUN_ALL_* filters)${NC}" >&2
+    fi
+    echo -e "  ${DIM}This will run every selected audit marked for phase $phase_num ($phase_column)${NC}" >&2
+    echo "$recommendations"
+}
+
+# Run-all recommendations without python3: unfiltered, inventory order.
+# Plain comma splitting — a quoted field containing a comma shifts its row.
+_audit_all_recommendations_awk() {
+    local csv_file="$1"
+    local phase_num="$2"
+    local phase_name="$3"
+    local phase_column="$4"
 
+    local col_idx
+    col_idx=$(head -1 "$csv_file" | tr ',' '\n' | grep -n "^${phase_column}$" | cut -d: -f1)
     if [[ -z "$col_idx" ]]; then
         echo '{"error": "Phase column not found: '"$phase_column"'"}'
         return 1
     fi
 
-    # Count all applicable audits
-    local audit_count
-    audit_count=$(awk -F',' -v col="$col_idx" 'NR>1 && $col == "Yes" {c++} END {print c+0}' "$csv_file")
-
-    echo -e "  ${YELLOW}⚠ AUDIT_RUN_ALL=true: Selecting ALL $audit_count applicable audits${NC}" >&2
-    echo -e "  ${DIM}This will run every audit marked for phase $phase_num ($phase_column)${NC}" >&2
-
-    # Generate JSON recommendations for ALL applicable audits
-    awk -F',' -v col="$col_idx" -v phase="$phase_num" -v phase_name="$phase_name" -v total="$audit_count" '
-    BEGIN {
-        print "{"
-        print "  \"phase\": " phase ","
-        print "  \"phase_name\": \"" phase_name "\","
-        print "  \"total_available\": " total ","
-        print "  \"run_all\": true,"
-        print "  \"recommendations\": ["
-        first = 1
-    }
-    NR > 1 && $col == "Yes" {
-        if (!first) print ","
-        first = 0
-
-        # Extract fields: audit_id=$1, audit_name=$3, category=$4, tier=$7, automatable=$9
-        gsub(/"/, "\\\"", $3)  # Escape quotes in name
-
-        printf "    {\n"
-        printf "      \"audit_id\": \"%s\",\n", $1
-        printf "      \"name\": \"%s\",\n", $3
-        printf "      \"category\": \"%s\",\n", $4
-        printf "      \"tier\": \"%s\",\n", $7
-        printf "      \"relevance\": \"Phase-applicable audit (run-all mode)\",\n"
-        printf "      \"dependency_status\": \"ready\",\n"
-        printf "      \"priority\": \"medium\"\n"
-        printf "    }"
-    }
-    END {
-        print ""
-        print "  ],"
-        print "  \"summary\": \"Running ALL " total " audits applicable to phase " phase " (" phase_name "). No LLM prioritization.\""
-        print "}"
-    }
-    ' "$csv_file"
+    awk -F',' -v col="$col_idx" 'NR > 1 && $col == "Yes" {
+        gsub(/\\/, "\\\\", $3); gsub(/"/, "\\\"", $3)
+        printf "{\"audit_id\":\"%s\",\"name\":\"%s\",\"category\":\"%s\",\"tier\":\"%s\"}\n", $1, $3, $4, $7
+    }' "$csv_file" | jq -s --argjson phase "$phase_num" --arg phase_name "$phase_name" '{
+        phase: $phase,
+        phase_name: $phase_name,
+        total_available: length,
+        run_all: true,
+        recommendations: map(. + {relevance: "Phase-applicable audit (run-all mode)",
+                                  dependency_status: "ready", priority: "medium"}),
+        summary: "Running ALL \(length) audits applicable to phase \($phase) (\($phase_name)). No LLM prioritization."
+    }'
 }
 
 # Get AI recommendations for audits (using phase-filtered CSV)
@@ -944,7 +1375,9 @@ audit_get_recommendations() {
 
     # Get phase-filtered audit list (much smaller than full 2,200)
     local phase_column="${AUDIT_PHASE_COLUMNS[$phase_num]:-}"
-    audit_list=$(audit_format_for_llm "$phase_num" 150)
+    local preselect_top=$((num_recommendations * 2))
+    ((preselect_top < AUDIT_PRESELECT_TOP)) && preselect_top=$AUDIT_PRESELECT_TOP
+    audit_list=$(audit_format_for_llm "$phase_num" 150 "$context" "$preselect_top")
     audit_count=$(audit_get_phase_audits "$phase_num" 2>/dev/null | tail -n +2 | wc -l)
 
     if [[ -z "$audit_list" ]]; then
@@ -1236,11 +1669,12 @@ audit_present_recommendations() {
 
 # Extract a JSON result object from Claude's audit output file
 # Handles: pure JSON, markdown-wrapped, mixed output with tool-call preamble
-# Usage: local json=$(_audit_extract_result_json "$file" "$audit_id" "$audit_name")
+# Usage: local json=$(_audit_extract_result_json "$file" "$audit_id" "$audit_name" [key])
 _audit_extract_result_json() {
     local output_file="$1"
     local audit_id="$2"
     local audit_name="$3"
+    local key="${4:-.audit_id}"  # field that must be present (.results for batches)
 
     if [[ ! -f "$output_file" ]] || [[ ! -s "$output_file" ]]; then
         _audit_error_json "$audit_id" "$audit_name" "Empty output from audit agent"
@@ -1260,7 +1694,7 @@ _audit_extract_result_json() {
     fi
 
     # 1) Direct JSON parse
-    if jq -e '.audit_id' "$output_file" &>/dev/null; then
+    if jq -e "$key" "$output_file" &>/dev/null; then
         cat "$output_file"
         return 0
     fi
@@ -1268,7 +1702,7 @@ _audit_extract_result_json() {
     # 2) Try atomic_json_fix (markdown fences, leading text before '{')
     local fixed
     fixed=$(atomic_json_fix "$output_file")
-    if echo "$fixed" | jq -e '.audit_id' &>/dev/null; then
+    if echo "$fixed" | jq -e "$key" &>/dev/null; then
         echo "$fixed"
         return 0
     fi
@@ -1278,7 +1712,7 @@ _audit_extract_result_json() {
     obj_start=$(grep -n '^{' "$output_file" | tail -1 | cut -d: -f1)
     if [[ -n "$obj_start" ]]; then
         extracted=$(tail -n +"$obj_start" "$output_file")
-        if echo "$extracted" | jq -e '.audit_id' &>/dev/null; then
+        if echo "$extracted" | jq -e "$key" &>/dev/null; then
             echo "$extracted"
             return 0
         fi
@@ -1319,262 +1753,795 @@ _audit_error_json() {
 EOF
 }
 
-# Execute selected audits
-audit_execute() {
-    local recommendations_json="$1"
-    local output_dir="${2:-$AUDIT_OUTPUT_DIR}"
-
-    audit_init
+# Result for an audit skipped by the discovery pre-pass (no agent run)
+_audit_skip_json() {
+    local audit_id="$1"
+    local audit_name="$2"
+    cat <<EOF
+{
+    "audit_id": "$audit_id",
+    "name": "$audit_name",
+    "status": "skip",
+    "severity": "low",
+    "message": "Skipped: no discovery pattern matched in the project",
+    "findings": []
+}
+EOF
+}
 
-    mkdir -p "$output_dir"
+# ============================================================================
+# SCHEDULING
+# ============================================================================
 
-    local phase_num ready_audits audit_count audit audit_id audit_name result status
-    phase_num=$(echo "$recommendations_json" | jq -r '.phase')
-    local report_file="$output_dir/phase-$phase_num-report.json"
-    local results=()
+# Choose the audits to run and how they depend on each other. Sets
+# _AUDIT_RUN_AUDITS (recommendations to run, in recommendation order) and
+# _AUDIT_DEP_GRAPH (the run plan of audit_engine graph, "" when off or
+# unavailable). Without a plan only the ready audits run, in no set order.
+# Usage: _audit_dependency_plan "$recommendations_json" "$phase_num"
+_audit_dependency_plan() {
+    local recommendations_json="$1"
+    local phase_num="$2"
 
-    echo ""
-    echo -e "${CYAN}╔═══════════════════════════════════════════════════════════════╗${NC}"
-    echo -e "${CYAN}║${NC} ${BOLD}EXECUTING AUDITS${NC}                                              ${CYAN}║${NC}"
-    echo -e "${CYAN}╚═══════════════════════════════════════════════════════════════╝${NC}"
-    echo ""
+    _AUDIT_DEP_GRAPH=""
+    _AUDIT_RUN_AUDITS=$(echo "$recommendations_json" | jq -c '[.recommendations[] | select(.dependency_status == "ready")]')
+    [[ "$AUDIT_DEPENDENCIES" == "off" || "$AUDIT_SCHEDULER" == "fifo" || -z "$_AUDIT_REPO_PATH" ]] && return 0
+    _audit_engine_available || return 0
 
-    # Get ready audits
-    ready_audits=$(echo "$recommendations_json" | jq -c '[.recommendations[] | select(.dependency_status == "ready")]')
-    audit_count=$(echo "$ready_audits" | jq 'length')
+    local plan_file="$AUDIT_CACHE_DIR/dependency-plan-phase${phase_num}.json"
+    if ! echo "$recommendations_json" | _audit_engine graph --repo "$_AUDIT_REPO_PATH" \
+            --cache "$AUDIT_CACHE_DIR/dependency-index.json" --recommendations - > "$plan_file" 2>/dev/null; then
+        echo -e "  ${YELLOW}!${NC} Dependency graph unavailable — running ready audits without ordering"
+        rm -f "$plan_file"
+        return 0
+    fi
 
-    local passed=0
-    local failed=0
-    local warnings=0
-    local errors=0
+    _AUDIT_DEP_GRAPH="$plan_file"
+    _AUDIT_RUN_AUDITS=$(jq -c '.audits_to_run' "$plan_file")
 
-    local max_parallel="${AUDIT_PARALLEL:-5}"
-    echo -e "  ${DIM}Running $audit_count audit agents ($max_parallel concurrent)${NC}"
-    echo ""
+    local dependencies waves admitted held
+    read -r dependencies waves admitted held < <(jq -r '
+        [.dependencies, (.waves | length),
+         ([.audits_to_run[] | select(.dependency_status == "needs-deps")] | length),
+         (.held | length)] | @tsv' "$plan_file")
+    if ((dependencies > 0 || admitted > 0)); then
+        echo -e "  ${DIM}Dependencies: $dependencies ordering constraint(s), $waves wave(s); $admitted needs-deps audit(s) run after their upstream, $held held back${NC}"
+    fi
+}
 
-    # --- Launch phase: start all agents with concurrency throttle ---
-    local -a result_files=()
+# Fixed-concurrency scheduler in recommendation order. Speaks the same line
+# protocol as `audit_engine schedule`: reads "index kind seconds" completion
+# events on stdin, writes launch/done/finish commands on stdout.
+# Usage: _audit_fifo_schedule "$audit_count" "$max_parallel" < events
+_audit_fifo_schedule() {
+    local audit_count="$1"
+    local max_parallel="$2"
+    local next=0 running=0 finished=0 index kind seconds
+
+    while ((next < audit_count && running < max_parallel)); do
+        echo "launch $next"
+        next=$((next + 1)); running=$((running + 1))
+    done
+    while ((finished < audit_count)) && read -r index kind seconds; do
+        [[ "$index" == "quit" ]] && break
+        [[ "$index" =~ ^[0-9]+$ ]] || continue
+        echo "done $index"
+        finished=$((finished + 1)); running=$((running - 1))
+        if ((next < audit_count)); then
+            echo "launch $next"
+            next=$((next + 1)); running=$((running + 1))
+        fi
+    done
+    echo "finish {\"mode\": \"fifo\", \"initial\": $max_parallel}"
+}
 
-    # FIFO semaphore for concurrency control
-    local sem_fifo="$AUDIT_CACHE_DIR/.audit-sem-$$"
-    mkfifo "$sem_fifo"
-    exec 3<>"$sem_fifo"
-    rm -f "$sem_fifo"
-    for ((j=0; j<max_parallel; j++)); do echo >&3; done
+# Report one unit's completion to the scheduler: "unit kind seconds", where
+# kind tells the scheduler whether the provider was involved and how it fared
+# (error > ok > local across the audits of a batch)
+# Usage: _audit_job_event "$unit" "$phase_num" "$start_seconds" index...
+_audit_job_event() {
+    local unit="$1"
+    local phase_num="$2"
+    local started="$3"
+    shift 3
+
+    local kind="local" index rf status message
+    for index in "$@"; do
+        rf="$AUDIT_CACHE_DIR/result-phase${phase_num}-${index}.json"
+        # Raw agent output (not a result object yet) means the agent ran
+        read -r status message < <(jq -r '
+            if .cached == true then "cached" else (.status // "error") end + " " + (.message // "")' \
+            "$rf" 2>/dev/null) || status="output" message=""
+        case "$status" in
+            cached|skip) ;;
+            pass|warn|fail|output)
+                if [[ -s "$rf" ]]; then
+                    [[ "$kind" == "local" ]] && kind="ok"
+                elif [[ -e "$rf" ]]; then
+                    kind="error"  # the agent ran but produced nothing
+                fi
+                ;;
+            *)
+                # An error result written before reaching the provider is local
+                if [[ "$message" == "Audit agent failed"* || ! -s "$rf" ]]; then
+                    kind="error"
+                fi
+                ;;
+        esac
+    done
 
-    for ((i=0; i<audit_count; i++)); do
-        audit=$(echo "$ready_audits" | jq -c ".[$i]")
-        audit_id=$(echo "$audit" | jq -r '.audit_id')
-        audit_name=$(echo "$audit" | jq -r '.name')
+    # A unit logs to the file named after its first audit
+    local log="$AUDIT_CACHE_DIR/result-phase${phase_num}-$1.log"
+    if [[ "$kind" != "local" ]] && grep -qiE 'rate.?limit|too many requests|\b429\b|overloaded' "$log" 2>/dev/null; then
+        kind="throttled"
+    fi
+    echo "$unit $kind $((SECONDS - started))"
+}
 
-        local rf="$AUDIT_CACHE_DIR/result-phase${phase_num}-${i}.json"
-        result_files+=("$rf")
-        : > "$rf"  # ensure file exists
+# Group the ready audits into agent sessions (see AUDIT_BATCH_SIZE). Sets
+# _AUDIT_UNITS: one entry per session, space-separated audit indices.
+# Usage: _audit_plan_units "$ready_audits_json"
+_audit_plan_units() {
+    local ready_audits="$1"
+    local audit_count
+    audit_count=$(echo "$ready_audits" | jq 'length')
 
-        read -u 3  # acquire semaphore slot
-        (
-            _audit_execute_single "$audit_id" "$audit_name" "$phase_num" > "$rf" 2>"${rf%.json}.log"
-            echo >&3  # release slot
-        ) &
+    _AUDIT_UNITS=()
+    if ((AUDIT_BATCH_SIZE > 1)) && [[ -n "$_AUDIT_REPO_PATH" ]] && _audit_engine_available; then
+        local -a batch_args=(--max-size "$AUDIT_BATCH_SIZE" --max-tokens "$AUDIT_BATCH_TOKENS"
+                             --max-minutes "$AUDIT_BATCH_MINUTES")
+        [[ -n "$_AUDIT_DISCOVERY_DIR" ]] && batch_args+=(--discovery-dir "$_AUDIT_DISCOVERY_DIR")
+        [[ -n "$_AUDIT_PROMPT_DIR" ]] && batch_args+=(--prompt-dir "$_AUDIT_PROMPT_DIR")
+        # Skipped audits never reach an agent; keep them out of batches
+        [[ "$AUDIT_DISCOVERY" == "skip" ]] && batch_args+=(--solo-verdict none)
+
+        local plan
+        if plan=$(echo "$ready_audits" | jq -r '.[].audit_id' | \
+                _audit_engine batch --repo "$_AUDIT_REPO_PATH" "${batch_args[@]}" --ids-file - 2>/dev/null); then
+            mapfile -t _AUDIT_UNITS < <(echo "$plan" | jq -r '.units[] | map(tostring) | join(" ")')
+        fi
+    fi
 
-        echo -e "  ${DIM}[$((i+1))/$audit_count]${NC} $audit_id"
-    done
+    if ((${#_AUDIT_UNITS[@]} == 0 && audit_count > 0)); then
+        mapfile -t _AUDIT_UNITS < <(seq 0 $((audit_count - 1)))
+    elif ((${#_AUDIT_UNITS[@]} < audit_count)); then
+        echo -e "  ${DIM}Batching: $audit_count audits in ${#_AUDIT_UNITS[@]} agent sessions${NC}"
+    fi
+}
 
-    # --- Wait phase: monitor completion ---
-    echo ""
-    echo -e "  ${DIM}Waiting for all agents to complete...${NC}"
+# Run every ready audit, calling on_done with the audit's index as each one
+# completes. Units from _audit_plan_units run as one agent session each;
+# completions arrive on a FIFO (no polling) and the scheduler decides launch
+# order and concurrency (see AUDIT_SCHEDULER).
+# Result of audit i: $AUDIT_CACHE_DIR/result-phase<phase>-<i>.json
+# Usage: _audit_run_scheduled "$ready_audits_json" "$phase_num" on_done_fn
+_audit_run_scheduled() {
+    local ready_audits="$1"
+    local phase_num="$2"
+    local on_done="$3"
+    local max_parallel="${AUDIT_PARALLEL:-5}"
 
-    local completed=0
-    while ((completed < audit_count)); do
-        sleep 3
-        completed=0
-        for ((j=0; j<audit_count; j++)); do
-            [[ -s "${result_files[$j]}" ]] && ((completed++))
-        done
-        echo -ne "\r  ${DIM}Progress: $completed/$audit_count agents completed${NC}   "
-    done
-    echo ""
+    local -a ids=() names=()
+    mapfile -t ids < <(echo "$ready_audits" | jq -r '.[].audit_id')
+    mapfile -t names < <(echo "$ready_audits" | jq -r '.[].name')
+    local audit_count=${#ids[@]}
 
-    wait
-    exec 3>&-  # close semaphore fd
+    _audit_plan_units "$ready_audits"
+    local -a units=("${_AUDIT_UNITS[@]}")
 
-    echo ""
+    # Completion FIFO (FD 4) — each unit writes its event when done
+    local done_fifo="$AUDIT_CACHE_DIR/.audit-done-$$"
+    mkfifo "$done_fifo"
+    exec 4<>"$done_fifo"
+    rm -f "$done_fifo"
 
-    # --- Results phase: collect and display ---
-    for ((i=0; i<audit_count; i++)); do
-        audit=$(echo "$ready_audits" | jq -c ".[$i]")
-        audit_id=$(echo "$audit" | jq -r '.audit_id')
-        audit_name=$(echo "$audit" | jq -r '.name')
-
-        local rf="${result_files[$i]}"
-        if [[ -s "$rf" ]]; then
-            result=$(cat "$rf")
-            # Validate it's JSON
-            if ! echo "$result" | jq -e '.status' &>/dev/null; then
-                result=$(_audit_error_json "$audit_id" "$audit_name" "Invalid result JSON")
-            fi
-        else
-            result=$(_audit_error_json "$audit_id" "$audit_name" "Agent produced no output")
-        fi
+    local -a scheduler=(_audit_fifo_schedule "${#units[@]}" "$max_parallel")
+    local units_file=""
+    if [[ "$AUDIT_SCHEDULER" != "fifo" && -n "$_AUDIT_REPO_PATH" ]] && _audit_engine_available; then
+        units_file=$(atomic_mktemp)
+        local unit i
+        for unit in "${units[@]}"; do
+            local -a line=()
+            for i in $unit; do line+=("${ids[$i]}"); done
+            echo "${line[*]}"
+        done > "$units_file"
+        local mode="adaptive"
+        [[ "$AUDIT_SCHEDULER" == "fixed" ]] && mode="fixed"
+        scheduler=(_audit_engine schedule --repo "$_AUDIT_REPO_PATH" --ids-file "$units_file"
+                   --parallel "$max_parallel" --max "$AUDIT_PARALLEL_MAX" --mode "$mode")
+        [[ -n "$_AUDIT_DISCOVERY_DIR" ]] && scheduler+=(--discovery-dir "$_AUDIT_DISCOVERY_DIR")
+        [[ -n "$_AUDIT_DEP_GRAPH" ]] && scheduler+=(--graph "$_AUDIT_DEP_GRAPH")
+    fi
 
-        status=$(echo "$result" | jq -r '.status')
-        local msg
-        msg=$(echo "$result" | jq -r '.message // ""')
+    # The scheduler only speaks when a unit finishes, and a unit is one
+    # agent session bounded by AUDIT_AGENT_TIMEOUT. Silence beyond that
+    # (with room for batched sessions) is worth a warning, never a reason
+    # to give up on the units not launched yet.
+    local stall=$((AUDIT_AGENT_TIMEOUT * (AUDIT_BATCH_SIZE > 1 ? AUDIT_BATCH_SIZE : 1) + 60))
 
-        case "$status" in
-            pass)
-                echo -e "  ${GREEN}✓ PASS${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((passed++))
+    _AUDIT_SCHED_STATS="{}"
+    local verb arg launched=0 read_rc
+    local -a pids=()
+    while true; do
+        # Block until the scheduler has something to do
+        read_rc=0
+        read -r -t "$stall" -u 5 verb arg || read_rc=$?
+        if ((read_rc > 128)); then
+            echo -e "  ${YELLOW}!${NC} No audit has finished for ${stall}s — still waiting on running agents"
+            continue
+        elif ((read_rc != 0)); then
+            break  # scheduler exited
+        fi
+        case "$verb" in
+            launch)
+                local -a members=(${units[$arg]})
+                local rf="$AUDIT_CACHE_DIR/result-phase${phase_num}-${members[0]}.json"
+                for i in "${members[@]}"; do
+                    : > "$AUDIT_CACHE_DIR/result-phase${phase_num}-${i}.json"
+                done
+                launched=$((launched + ${#members[@]}))
+                (
+                    local _unit="$arg" _started="$SECONDS"
+                    trap '_audit_job_event "$_unit" "$phase_num" "$_started" ${units[$_unit]} >&4' EXIT
+                    if ((${#members[@]} == 1)); then
+                        _audit_execute_single "${ids[$members]}" "${names[$members]}" "$phase_num" \
+                            > "$rf" 2>"${rf%.json}.log"
+                    else
+                        _audit_execute_batch "$phase_num" "$ready_audits" "${members[@]}" \
+                            2>"${rf%.json}.log"
+                    fi
+                ) &
+                pids+=($!)
+                if ((${#members[@]} == 1)); then
+                    echo -e "  ${DIM}[launched $launched/$audit_count]${NC} ${ids[$members]}"
+                else
+                    echo -e "  ${DIM}[launched $launched/$audit_count]${NC} ${ids[$members]} ${DIM}+ $((${#members[@]} - 1)) batched${NC}"
+                fi
                 ;;
-            fail)
-                echo -e "  ${RED}✗ FAIL${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((failed++))
+            done)
+                for i in ${units[$arg]}; do
+                    "$on_done" "$i"
+                done
                 ;;
-            warn)
-                echo -e "  ${YELLOW}⚠ WARN${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((warnings++))
+            info)
+                echo -e "  ${DIM}$arg${NC}"
                 ;;
-            *)
-                echo -e "  ${CYAN}? ERR ${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((errors++))
+            finish)
+                _AUDIT_SCHED_STATS="$arg"
+                break
                 ;;
         esac
+    done 5< <("${scheduler[@]}" <&4 2>/dev/null)
 
-        results+=("$result")
-    done
-
-    echo ""
-    echo -e "${DIM}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-    echo ""
-    echo -e "  ${BOLD}Results:${NC} ${GREEN}$passed passed${NC}, ${RED}$failed failed${NC}, ${YELLOW}$warnings warnings${NC}, ${CYAN}$errors errors${NC}"
-    echo ""
-
-    # Generate report
-    local report
-    report=$(cat <<EOF
-{
-    "phase": $phase_num,
-    "timestamp": "$(date -Iseconds)",
-    "summary": {
-        "total": $audit_count,
-        "passed": $passed,
-        "failed": $failed,
-        "warnings": $warnings,
-        "errors": $errors
-    },
-    "results": $(printf '%s\n' "${results[@]}" | jq -s '.'),
-    "recommendations": $(echo "$recommendations_json" | jq '.recommendations')
+    # Wait for any remaining audit jobs (not the result collector)
+    ((${#pids[@]})) && wait "${pids[@]}" 2>/dev/null
+    exec 4>&- 2>/dev/null
+    [[ -n "$units_file" ]] && rm -f "$units_file"
+    return 0
 }
-EOF
-)
 
-    echo "$report" > "$report_file"
-    echo -e "  ${GREEN}✓${NC} Report saved: $report_file"
+# ============================================================================
+# RESULT COLLECTION
+# ============================================================================
 
-    # Register audit artifacts for downstream tasks
-    atomic_context_artifact "phase${phase_num}_audit_report" "$report_file" "Phase $phase_num audit results"
-    local recommendations_file="$output_dir/phase-$phase_num-recommendations.json"
-    [[ -f "$recommendations_file" ]] && atomic_context_artifact "phase${phase_num}_audit_recommendations" "$recommendations_file" "Phase $phase_num audit recommendations"
-    atomic_context_decision "Phase $phase_num audit: $passed passed, $failed failed, $warnings warnings" "audit"
+# Start the phase's result collector as coprocess _AUDIT_COLLECTOR. It
+# validates each result as its audit completes and keeps the phase report
+# current, so the report is final the moment the last audit finishes.
+# Python collector when available, _audit_collect_fallback otherwise.
+# Usage: _audit_collector_start "$ready_audits" "$phase_num" "$recommendations_json" "$report_file"
+_audit_collector_start() {
+    local ready_audits="$1"
+    local phase_num="$2"
+    local recommendations_json="$3"
+    local report_file="$4"
+    local prefix="$AUDIT_CACHE_DIR/result-phase${phase_num}-"
+
+    _AUDIT_COLLECT_AUDITS=$(atomic_mktemp)
+    _AUDIT_COLLECT_RECS=$(atomic_mktemp)
+    echo "$ready_audits" > "$_AUDIT_COLLECT_AUDITS"
+    echo "$recommendations_json" | jq '.recommendations' > "$_AUDIT_COLLECT_RECS"
+    _AUDIT_COLLECT_SUMMARY="{}"
+    _AUDIT_COLLECTED=()
+
+    local -a cache_args=()
+    if [[ "$AUDIT_RESULT_CACHE" != "off" && -n "$_AUDIT_DISCOVERY_DIR" ]]; then
+        cache_args=(--cache-dir "$AUDIT_CACHE_DIR/results" --discovery-dir "$_AUDIT_DISCOVERY_DIR")
+    fi
 
-    # Return status based on mode
-    local mode="${_AUDIT_CONFIG[default_mode]:-gate-high}"
-    local severity_filter="${_AUDIT_CONFIG[severity_filter]:-high+}"
+    _AUDIT_AGENT_DIR=""
+    local -a telemetry_args=()
+    local run_id=""
+    if [[ "$AUDIT_TELEMETRY" != "off" ]]; then
+        _AUDIT_AGENT_DIR="$AUDIT_CACHE_DIR/agents-phase${phase_num}"
+        rm -rf "$_AUDIT_AGENT_DIR"
+        mkdir -p "$_AUDIT_AGENT_DIR" "$(dirname "$AUDIT_TELEMETRY_FILE")"
+        run_id="$(date +%Y%m%dT%H%M%S)-p${phase_num}-$$"
+        telemetry_args=(--telemetry "$AUDIT_TELEMETRY_FILE" --agent-dir "$_AUDIT_AGENT_DIR"
+                        --run-id "$run_id")
+    fi
 
-    if [[ "$failed" -gt 0 ]]; then
-        case "$mode" in
-            gate-all)
-                return 1
-                ;;
-            gate-high|gate-critical)
-                # Check if any high/critical failures
-                local high_fails
-                high_fails=$(printf '%s\n' "${results[@]}" | jq -s '[.[] | select(.status == "fail" and (.severity == "high" or .severity == "critical"))] | length')
-                if [[ "$high_fails" -gt 0 ]]; then
-                    return 1
-                fi
-                ;;
-            report-only)
-                return 0
-                ;;
-        esac
+    if _audit_engine_available; then
+        coproc _AUDIT_COLLECTOR {
+            _audit_engine collect --phase "$phase_num" --audits "$_AUDIT_COLLECT_AUDITS" \
+                --results-prefix "$prefix" --report "$report_file" \
+                --recommendations "$_AUDIT_COLLECT_RECS" "${cache_args[@]}" "${telemetry_args[@]}" 2>/dev/null
+        }
+    else
+        coproc _AUDIT_COLLECTOR {
+            _audit_collect_fallback "$phase_num" "$_AUDIT_COLLECT_AUDITS" "$prefix" \
+                "$report_file" "$_AUDIT_COLLECT_RECS" "$run_id"
+        }
     fi
+    _AUDIT_COLLECT_PID="$_AUDIT_COLLECTOR_PID"
+}
 
-    return 0
+# Hand a completed audit to the collector and read back its validated result
+# Sets _AUDIT_RESULT_STATUS, _AUDIT_RESULT_CACHED, _AUDIT_RESULT_MESSAGE, _AUDIT_RESULT_JSON
+# Usage: _audit_collect "$index"
+_audit_collect() {
+    local index
+    echo "$1" >&"${_AUDIT_COLLECTOR[1]}"
+    IFS=$'\x1f' read -r index _AUDIT_RESULT_STATUS _AUDIT_RESULT_CACHED \
+        _AUDIT_RESULT_MESSAGE _AUDIT_RESULT_JSON <&"${_AUDIT_COLLECTOR[0]}"
+    # Downstream audits are launched after this, from a copy of this shell
+    _AUDIT_COLLECTED[$1]="$_AUDIT_RESULT_JSON"
 }
 
-# Execute a single audit via Claude agent invocation
-# Each audit gets its own Claude session with tool access to investigate the project
-_audit_execute_single() {
-    local audit_id="$1"
-    local audit_name="$2"
-    local phase_num="${3:-0}"
+# Pass extra summary fields, finalize the report and stop the collector
+# Sets _AUDIT_COLLECT_SUMMARY (the report's summary object)
+# Usage: _audit_collector_finish "$meta_json"
+_audit_collector_finish() {
+    local meta="$1"
+    local tag
+    echo "meta $meta" >&"${_AUDIT_COLLECTOR[1]}"
+    echo "end" >&"${_AUDIT_COLLECTOR[1]}"
+    IFS=$'\x1f' read -r tag _AUDIT_COLLECT_SUMMARY <&"${_AUDIT_COLLECTOR[0]}" || _AUDIT_COLLECT_SUMMARY="{}"
+    wait "$_AUDIT_COLLECT_PID" 2>/dev/null || true
+    rm -f "$_AUDIT_COLLECT_AUDITS" "$_AUDIT_COLLECT_RECS"
+}
 
-    # Look for audit YAML file in repository
-    # audit_id format: category.subcategory.audit-name
-    # file path:       audits/{NN-category}/{subcategory}/{audit-name}.yaml
-    local audit_file=""
-    if [[ -n "$_AUDIT_REPO_PATH" ]]; then
-        local audit_slug="${audit_id##*.}"  # last segment = filename
-        audit_file=$(find "$_AUDIT_REPO_PATH/audits" -name "${audit_slug}.yaml" -type f 2>/dev/null | head -1)
+# Result of audit <index> as compact JSON, extracted from raw agent output
+# and cached when fresh (fallback collector)
+_audit_collect_load() {
+    local audits_file="$1" prefix="$2" index="$3"
+    local rf="${prefix}${index}.json" audit_id audit_name result
+    if [[ -s "$rf" ]] && jq -ce 'select(type == "object" and .status)' "$rf" 2>/dev/null; then
+        return 0
     fi
-
-    if [[ -z "$audit_file" || ! -f "$audit_file" ]]; then
-        _audit_error_json "$audit_id" "$audit_name" "Audit YAML not found locally"
+    audit_id=$(jq -r ".[$index].audit_id" "$audits_file")
+    audit_name=$(jq -r ".[$index].name" "$audits_file")
+    if [[ ! -s "$rf" ]]; then
+        _audit_error_json "$audit_id" "$audit_name" "Agent produced no output" | jq -c .
         return 0
     fi
 
-    # Build prompt with audit definition + project context
-    local prompt_file output_file
-    prompt_file=$(atomic_mktemp)
-    output_file="$AUDIT_CACHE_DIR/audit-result-$(echo "$audit_id" | tr '.' '-').json"
-
-    cat > "$prompt_file" <<AUDIT_PROMPT_HEADER
-# Execute Audit: $audit_id
-## $audit_name
+    result=$(_audit_extract_result_json "$rf" "$audit_id" "$audit_name" '.audit_id // .results' 2>/dev/null |
+        jq -c --arg id "$audit_id" --arg name "$audit_name" '
+            if .audit_id then .audit_id = $id
+            else (first(.results[]? | select(.audit_id == $id)) //
+                  {audit_id: $id, name: $name, status: "error", severity: "low",
+                   message: "Missing from batch result", findings: []})
+            end
+            | .status |= (tostring | ascii_downcase
+                | {passed: "pass", ok: "pass", warning: "warn", failed: "fail", skipped: "skip"}[.] // .)' 2>/dev/null)
+    [[ -n "$result" ]] || result=$(_audit_error_json "$audit_id" "$audit_name" "Invalid result JSON" | jq -c .)
+    _audit_result_cache_put "$audit_id" "$(_audit_discovery_field "$audit_id" cache_key)" "$result"
+    echo "$result"
+}
 
-You are an expert software auditor. Execute this audit against the project.
-Follow the procedure steps, check each signal, and investigate the project using your tools.
+# Append an audit's telemetry line (fallback collector; parse strategy unknown)
+# Usage: _audit_telemetry_record "$phase_num" "$run_id" "$result_json"
+_audit_telemetry_record() {
+    local phase_num="$1" run_id="$2" result="$3"
+    local audit_id agent="{}"
+    audit_id=$(echo "$result" | jq -r '.audit_id // ""')
+    [[ -f "$_AUDIT_AGENT_DIR/$audit_id.json" ]] && agent=$(cat "$_AUDIT_AGENT_DIR/$audit_id.json")
+    echo "$result" | jq -c --arg ts "$(date -Iseconds)" --arg run "$run_id" --argjson phase "$phase_num" \
+        --argjson agent "$agent" '
+        {ts: $ts, run: $run, phase: $phase, audit_id, outcome: .status, cached: (.cached == true),
+         parse: "jq", problems: 0} + $agent' >> "$AUDIT_TELEMETRY_FILE" 2>/dev/null || true
+}
 
-## Audit Definition
+# Bash fallback for audit_engine collect: same protocol, report written once at the end
+_audit_collect_fallback() {
+    local phase_num="$1" audits_file="$2" prefix="$3" report_file="$4" recs_file="$5" run_id="${6:-}"
+    local -a results=()
+    local meta="{}" line result fields count index
+    count=$(jq 'length' "$audits_file")
 
-\`\`\`yaml
-$(cat "$audit_file")
-\`\`\`
+    while read -r line; do
+        case "$line" in
+            end) break ;;
+            meta\ *) meta="${line#meta }"; continue ;;
+        esac
+        [[ "$line" =~ ^[0-9]+$ ]] && ((line < count)) || continue
+        result=$(_audit_collect_load "$audits_file" "$prefix" "$line")
+        results[$line]="$result"
+        [[ -n "$run_id" ]] && _audit_telemetry_record "$phase_num" "$run_id" "$result"
+        fields=$(echo "$result" | jq -r '[.status, (.cached == true | tostring),
+            (.message // "" | tostring | gsub("\\s+"; " "))] | join("\u001f")')
+        printf '%s\x1f%s\x1f%s\n' "$line" "$fields" "$result"
+    done
 
-AUDIT_PROMPT_HEADER
+    for ((index=0; index<count; index++)); do
+        [[ -n "${results[$index]:-}" ]] || results[$index]=$(_audit_collect_load "$audits_file" "$prefix" "$index")
+    done
+
+    local summary
+    summary=$(printf '%s\n' "${results[@]}" | jq -sc --argjson meta "$meta" '{
+        total: length,
+        passed: map(select(.status == "pass")) | length,
+        failed: map(select(.status == "fail")) | length,
+        warnings: map(select(.status == "warn")) | length,
+        errors: map(select(.status | IN("pass", "fail", "warn", "skip") | not)) | length,
+        skipped: map(select(.status == "skip")) | length,
+        cache_hits: map(select(.cached == true)) | length
+    } | .cache_misses = .total - .cache_hits - .skipped | . + $meta')
+    printf '%s\n' "${results[@]}" | jq -s --argjson phase "$phase_num" --arg ts "$(date -Iseconds)" \
+        --argjson summary "$summary" --slurpfile recs "$recs_file" \
+        '{phase: $phase, timestamp: $ts, complete: true, summary: $summary, results: ., recommendations: $recs[0]}' \
+        > "$report_file"
+    printf 'end\x1f%s\n' "$summary"
+}
+
+# Print one audit's status line
+# Usage: _audit_print_result "$status" "$audit_id" "$message" "$progress"
+_audit_print_result() {
+    local status="$1" audit_id="$2" msg="$3" progress="${4:-}"
+    [[ -n "$progress" ]] && progress="${DIM}[$progress]${NC}  "
+    case "$status" in
+        pass) echo -e "  ${GREEN}✓ PASS${NC}  $progress$audit_id" ;;
+        fail) echo -e "  ${RED}✗ FAIL${NC}  $progress$audit_id" ;;
+        warn) echo -e "  ${YELLOW}⚠ WARN${NC}  $progress$audit_id" ;;
+        skip) echo -e "  ${DIM}- SKIP${NC}  $progress${DIM}$audit_id${NC}"; return 0 ;;
+        *)    echo -e "  ${CYAN}? ERR ${NC}  $progress$audit_id" ;;
+    esac
+    [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
+    return 0
+}
+
+# Scheduler statistics and prompt savings for the report summary
+_audit_run_meta() {
+    jq -nc --argjson saved "${_AUDIT_PROMPT_SAVED:-0}" --argjson sched "$_AUDIT_SCHED_STATS" \
+        '{prompt_tokens_saved: $saved, scheduler: $sched}'
+}
+
+# Print the phase summary lines from _AUDIT_COLLECT_SUMMARY
+_audit_print_summary() {
+    local passed failed warnings errors skipped cache_hits cache_misses
+    read -r passed failed warnings errors skipped cache_hits cache_misses < <(echo "$_AUDIT_COLLECT_SUMMARY" |
+        jq -r '[.passed, .failed, .warnings, .errors, .skipped, .cache_hits, .cache_misses] | map(. // 0) | @tsv')
+    echo -e "  ${BOLD}Results:${NC} ${GREEN}$passed passed${NC}, ${RED}$failed failed${NC}, ${YELLOW}$warnings warnings${NC}, ${CYAN}$errors errors${NC}, ${DIM}$skipped skipped${NC}"
+    if [[ "$AUDIT_RESULT_CACHE" != "off" ]]; then
+        echo -e "  ${BOLD}Cache:${NC}   ${DIM}$cache_hits hit(s), $cache_misses miss(es)${NC}"
+    fi
+    if [[ $(echo "$_AUDIT_SCHED_STATS" | jq -r '.mode // ""') == "adaptive" ]]; then
+        echo -e "  ${BOLD}Agents:${NC}  ${DIM}$(echo "$_AUDIT_SCHED_STATS" | jq -r '"concurrency \(.initial) → \(.final) (peak \(.peak)), \(.decreases) back-off(s), \(.throttled) rate-limited"')${NC}"
+    fi
+}
+
+# Execute selected audits
+audit_execute() {
+    local recommendations_json="$1"
+    local output_dir="${2:-$AUDIT_OUTPUT_DIR}"
+
+    audit_init
+
+    mkdir -p "$output_dir"
+
+    local phase_num ready_audits audit_count
+    phase_num=$(echo "$recommendations_json" | jq -r '.phase')
+    local report_file="$output_dir/phase-$phase_num-report.json"
+
+    echo ""
+    echo -e "${CYAN}╔═══════════════════════════════════════════════════════════════╗${NC}"
+    echo -e "${CYAN}║${NC} ${BOLD}EXECUTING AUDITS${NC}                                              ${CYAN}║${NC}"
+    echo -e "${CYAN}╚═══════════════════════════════════════════════════════════════╝${NC}"
+    echo ""
+
+    _audit_dependency_plan "$recommendations_json" "$phase_num"
+    ready_audits="$_AUDIT_RUN_AUDITS"
+    audit_count=$(echo "$ready_audits" | jq 'length')
+
+    _audit_project_snapshot
+    _audit_discovery_prepass "$ready_audits" "$phase_num"
+    _audit_render_prompts "$ready_audits" "$phase_num"
+    _audit_load_paths
+
+    echo -e "  ${DIM}Running $audit_count audit agents${NC}"
+    echo ""
+
+    # --- Run phase: scheduler launches agents, the collector validates each result as it lands ---
+    local completed=0
+    _audit_collector_start "$ready_audits" "$phase_num" "$recommendations_json" "$report_file"
+    _audit_batch_collect() {
+        completed=$((completed + 1))
+        _audit_collect "$1"
+        _audit_print_result "$_AUDIT_RESULT_STATUS" "$(echo "$ready_audits" | jq -r ".[$1].audit_id")" \
+            "$_AUDIT_RESULT_MESSAGE" "$completed/$audit_count"
+    }
+    _audit_run_scheduled "$ready_audits" "$phase_num" _audit_batch_collect
+    _audit_collector_finish "$(_audit_run_meta)"
+
+    local passed failed warnings
+    read -r passed failed warnings < <(echo "$_AUDIT_COLLECT_SUMMARY" | jq -r '[.passed, .failed, .warnings] | map(. // 0) | @tsv')
+
+    echo ""
+    echo -e "${DIM}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
+    echo ""
+    _audit_print_summary
+    echo ""
+
+    echo -e "  ${GREEN}✓${NC} Report saved: $report_file"
+
+    # Register audit artifacts for downstream tasks
+    atomic_context_artifact "phase${phase_num}_audit_report" "$report_file" "Phase $phase_num audit results"
+    local recommendations_file="$output_dir/phase-$phase_num-recommendations.json"
+    [[ -f "$recommendations_file" ]] && atomic_context_artifact "phase${phase_num}_audit_recommendations" "$recommendations_file" "Phase $phase_num audit recommendations"
+    atomic_context_decision "Phase $phase_num audit: $passed passed, $failed failed, $warnings warnings" "audit"
+
+    # Return status based on mode
+    local mode="${_AUDIT_CONFIG[default_mode]:-gate-high}"
+    local severity_filter="${_AUDIT_CONFIG[severity_filter]:-high+}"
+
+    if [[ "$failed" -gt 0 ]]; then
+        case "$mode" in
+            gate-all)
+                return 1
+                ;;
+            gate-high|gate-critical)
+                # Check if any high/critical failures
+                local high_fails
+                high_fails=$(jq '[.results[] | select(.status == "fail" and (.severity == "high" or .severity == "critical"))] | length' "$report_file")
+                if [[ "$high_fails" -gt 0 ]]; then
+                    return 1
+                fi
+                ;;
+            report-only)
+                return 0
+                ;;
+        esac
+    fi
+
+    return 0
+}
+
+# Resolve an audit without an agent run where possible: missing YAML (error),
+# zero-evidence skip, or a cached result. Prints the result and returns 0 if
+# resolved, 1 if the audit needs an agent.
+# Usage: _audit_short_circuit "$audit_id" "$audit_name" && return 0
+_audit_short_circuit() {
+    local audit_id="$1"
+    local audit_name="$2"
+
+    # Resolve the audit YAML by its full ID via the repository's path map
+    local audit_file=""
+    audit_file=$(_audit_resolve_file "$audit_id")
 
-    # Append project context
+    if [[ -z "$audit_file" || ! -f "$audit_file" ]]; then
+        _audit_error_json "$audit_id" "$audit_name" "Audit YAML not found locally"
+        return 0
+    fi
+
+    # Discovery pre-pass verdict: skip audits with zero evidence
+    if [[ "$AUDIT_DISCOVERY" == "skip" && $(_audit_discovery_field "$audit_id" verdict) == "none" ]]; then
+        _audit_skip_json "$audit_id" "$audit_name"
+        return 0
+    fi
+
+    # Unchanged definition, evidence and context: reuse the previous result,
+    # unless an upstream result in the prompt was produced afresh this run
+    _audit_upstream_results "$audit_id" | jq -c 'select(.cached != true)' 2>/dev/null | grep -q . && return 1
+    _audit_result_cache_get "$audit_id" "$(_audit_discovery_field "$audit_id" cache_key)" && return 0
+    return 1
+}
+
+# Turn budget of one audit: zero-evidence audits run cheaply in downgrade mode
+# Usage: max_turns=$(_audit_max_turns "$audit_id")
+_audit_max_turns() {
+    local max_turns="${AUDIT_MAX_TURNS:-30}"
+    if [[ "$AUDIT_DISCOVERY" == "downgrade" && $(_audit_discovery_field "$1" verdict) == "none" ]]; then
+        ((AUDIT_DOWNGRADE_TURNS < max_turns)) && max_turns="$AUDIT_DOWNGRADE_TURNS"
+    fi
+    echo "$max_turns"
+}
+
+# Audit definition for a prompt: the compact rendering (discovery evidence
+# folded in) or the full YAML followed by the evidence
+# Usage: _audit_definition_section "$audit_id" >> "$prompt_file"
+_audit_definition_section() {
+    local audit_id="$1"
+    local verdict
+    verdict=$(_audit_discovery_field "$audit_id" verdict)
+
+    local compact_file="$_AUDIT_PROMPT_DIR/$audit_id.md"
+    if [[ -n "$_AUDIT_PROMPT_DIR" && -f "$compact_file" ]]; then
+        cat "$compact_file"
+        echo ""
+    else
+        compact_file=""
+        echo '```yaml'
+        cat "$(_audit_resolve_file "$audit_id")"
+        echo '```'
+        echo ""
+    fi
+
+    # Discovery evidence so the agent starts from known matches
+    if [[ "$AUDIT_DISCOVERY" != "off" && -n "$verdict" && -f "$_AUDIT_DISCOVERY_DIR/$audit_id.md" ]]; then
+        if [[ -z "$compact_file" ]]; then
+            echo "## Discovery Evidence (pre-computed)"
+            echo ""
+            cat "$_AUDIT_DISCOVERY_DIR/$audit_id.md"
+            echo ""
+        fi
+        if [[ "$verdict" == "none" ]]; then
+            echo "None of this audit's discovery patterns matched. Confirm briefly whether the audit applies at all; if it does not, report pass with a one-line message."
+            echo ""
+        fi
+    fi
+}
+
+# Project configuration and architectural approach, shared by every audit prompt
+# Usage: _audit_context_section >> "$prompt_file"
+_audit_context_section() {
     local config_file="$ATOMIC_OUTPUT_DIR/0-setup/project-config.json"
     if [[ -f "$config_file" ]]; then
-        {
-            echo "## Project Configuration"
-            echo '```json'
-            cat "$config_file"
-            echo '```'
-            echo ""
-        } >> "$prompt_file"
+        echo "## Project Configuration"
+        echo '```json'
+        cat "$config_file"
+        echo '```'
+        echo ""
     fi
 
     local approach_file="$ATOMIC_OUTPUT_DIR/1-discovery/selected-approach.json"
     if [[ -f "$approach_file" ]]; then
-        {
-            echo "## Architectural Approach"
-            echo '```json'
-            cat "$approach_file"
-            echo '```'
-            echo ""
-        } >> "$prompt_file"
+        echo "## Architectural Approach"
+        echo '```json'
+        cat "$approach_file"
+        echo '```'
+        echo ""
+    fi
+}
+
+# Results of the audit's upstream audits (see AUDIT_DEPENDENCIES) that have
+# completed in this run, one JSON object per line
+# Usage: _audit_upstream_results "$audit_id"
+_audit_upstream_results() {
+    local audit_id="$1"
+    [[ -n "$_AUDIT_DEP_GRAPH" && -f "$_AUDIT_DEP_GRAPH" ]] || return 0
+
+    local -a upstream=()
+    mapfile -t upstream < <(jq -r --arg id "$audit_id" '
+        (.audits_to_run | map(.audit_id)) as $ids
+        | .upstream[$id][]? as $up | $ids | index($up) // empty' "$_AUDIT_DEP_GRAPH" 2>/dev/null)
+    local i
+    for i in "${upstream[@]}"; do
+        [[ -n "${_AUDIT_COLLECTED[$i]:-}" ]] && printf '%s\n' "${_AUDIT_COLLECTED[$i]}"
+    done
+    return 0
+}
+
+# Upstream results (see _audit_upstream_results) for the prompt, so the agent
+# builds on them instead of repeating them
+# Usage: _audit_upstream_section "$audit_id" >> "$prompt_file"
+_audit_upstream_section() {
+    local audit_id="$1"
+    local -a results=()
+    mapfile -t results < <(_audit_upstream_results "$audit_id")
+    ((${#results[@]})) || return 0
+
+    echo "## Upstream Audit Results"
+    echo ""
+    echo "These audits feed into this one and have already run against this project. Build on their findings; do not re-investigate what they established."
+    echo ""
+    printf '%s\n' "${results[@]}" | jq -r '
+        "### \(.audit_id): \(.status | ascii_upcase) (\(.severity // "low"))",
+        (.message // "" | tostring),
+        ((.findings // [])[:5][] | "- [\(.severity // "medium")] \(.finding // "" | tostring | .[:200])"),
+        ""' 2>/dev/null
+}
+
+# Invoke an audit agent with tool access and enough turns to investigate.
+# Architecture audits need many turns to read files + produce JSON output.
+# Retries are disabled — each attempt is already long; retries just triple the wait.
+# With audit IDs given, leaves the agent's telemetry record for each of them
+# in _AUDIT_AGENT_DIR (see AUDIT_TELEMETRY).
+# Usage: _audit_invoke_agent "$prompt_file" "$output_file" "$max_turns" [audit_id...] || rc=$?
+_audit_invoke_agent() {
+    local prompt_file="$1"
+    local output_file="$2"
+    local max_turns="$3"
+    shift 3
+    local started="$EPOCHREALTIME" start_iso
+    start_iso=$(date -Iseconds)
+
+    source "$ATOMIC_ROOT/lib/provider.sh"
+    local saved_max_turns="${CLAUDE_MAX_TURNS:-1}"
+    local saved_max_retries="${ATOMIC_MAX_RETRIES:-2}"
+    export CLAUDE_MAX_TURNS="$max_turns"
+    export ATOMIC_MAX_RETRIES=0
+    local invoke_rc=0
+    provider_invoke "$prompt_file" "$output_file" "bulk" --format=json --timeout="$AUDIT_AGENT_TIMEOUT" >&2 || invoke_rc=$?
+    export CLAUDE_MAX_TURNS="$saved_max_turns"
+    export ATOMIC_MAX_RETRIES="$saved_max_retries"
+
+    if (($#)) && [[ -n "$_AUDIT_AGENT_DIR" ]]; then
+        _audit_agent_record "$prompt_file" "$output_file" "$max_turns" "$invoke_rc" \
+            "$started" "$start_iso" "$@" 2>/dev/null || true
     fi
+    return "$invoke_rc"
+}
+
+# Write the telemetry record of one agent session for each audit it ran.
+# Provider and model are the ones atomic_invoke logged for this output file
+# (after model fallback); token counts are estimated at 4 bytes per token.
+# Usage: _audit_agent_record "$prompt_file" "$output_file" "$max_turns" "$rc" "$started" "$start_iso" audit_id...
+_audit_agent_record() {
+    local prompt_file="$1" output_file="$2" max_turns="$3" rc="$4" started="$5" start_iso="$6"
+    shift 6
+
+    local logged="" provider="${CLAUDE_PROVIDER:-}" model="${CLAUDE_MODEL:-}"
+    logged=$(grep -F "output=$output_file" "$(atomic_log_file)" 2>/dev/null | tail -n 1) || true
+    [[ "$logged" =~ provider=([^ ]*) ]] && provider="${BASH_REMATCH[1]}"
+    [[ "$logged" =~ model=([^ ]*) ]] && model="${BASH_REMATCH[1]}"
+
+    local prompt_bytes response_bytes hit=false
+    prompt_bytes=$(wc -c < "$prompt_file" 2>/dev/null || echo 0)
+    response_bytes=$(wc -c < "$output_file" 2>/dev/null || echo 0)
+    grep -q "Reached max turns" "$output_file" 2>/dev/null && hit=true
+
+    local record audit_id
+    record=$(jq -nc --arg started "$start_iso" --arg ended "$(date -Iseconds)" \
+        --argjson seconds "$(awk -v a="$started" -v b="$EPOCHREALTIME" 'BEGIN { printf "%.1f", b - a }')" \
+        --arg provider "$provider" --arg model "$model" --argjson max_turns "$max_turns" \
+        --argjson hit "$hit" --argjson prompt "$prompt_bytes" --argjson response "$response_bytes" \
+        --argjson rc "$rc" --argjson batch "$#" '
+        {start: $started, "end": $ended, seconds: $seconds, provider: $provider, model: $model,
+         max_turns: $max_turns, max_turns_hit: $hit, prompt_bytes: $prompt, response_bytes: $response,
+         est_tokens: (($prompt + $response) / 4 | floor), exit: $rc, batch_size: $batch}')
+    for audit_id in "$@"; do
+        echo "$record" > "$_AUDIT_AGENT_DIR/$audit_id.json"
+    done
+}
+
+# Execute a single audit via Claude agent invocation
+# Each audit gets its own Claude session with tool access to investigate the project
+_audit_execute_single() {
+    local audit_id="$1"
+    local audit_name="$2"
+    local phase_num="${3:-0}"
+
+    _audit_short_circuit "$audit_id" "$audit_name" && return 0
+
+    local max_turns
+    # Default 30 turns; complex audits (domain analysis, cohesion) need more exploration
+    max_turns=$(_audit_max_turns "$audit_id")
+
+    # Build prompt with audit definition + project context
+    local prompt_file output_file
+    prompt_file=$(atomic_mktemp)
+    output_file="$AUDIT_CACHE_DIR/audit-result-$(echo "$audit_id" | tr '.' '-').json"
+
+    {
+        _audit_snapshot_section
+        cat <<AUDIT_PROMPT_HEADER
+# Execute Audit: $audit_id
+## $audit_name
+
+You are an expert software auditor. Execute this audit against the project.
+Follow the procedure steps, check each signal, and investigate the project using your tools.
+
+## Audit Definition
+
+AUDIT_PROMPT_HEADER
+        _audit_definition_section "$audit_id"
+        _audit_upstream_section "$audit_id"
+        _audit_context_section
+    } > "$prompt_file"
 
     cat >> "$prompt_file" << 'AUDIT_PROMPT_FOOTER'
 ## Instructions
 
-1. Read the audit YAML above — understand its signals and procedure steps
+1. Read the audit definition above — understand its signals and procedure steps
 2. Use your tools to explore the project repository and its artifacts
 3. Follow the procedure steps to investigate the project state
 4. For each signal, assess whether the project exhibits or addresses it
@@ -1602,19 +2569,8 @@ Output ONLY this JSON object (no markdown fences, no extra text):
 }
 AUDIT_PROMPT_FOOTER
 
-    # Invoke Claude agent with tool access and enough turns to investigate
-    # Architecture audits need many turns to read files + produce JSON output
-    # Disable retries — each attempt is already long; retries just triple the wait
-    source "$ATOMIC_ROOT/lib/provider.sh"
-    local saved_max_turns="${CLAUDE_MAX_TURNS:-1}"
-    local saved_max_retries="${ATOMIC_MAX_RETRIES:-2}"
-    # Default 30 turns; complex audits (domain analysis, cohesion) need more exploration
-    export CLAUDE_MAX_TURNS="${AUDIT_MAX_TURNS:-30}"
-    export ATOMIC_MAX_RETRIES=0
     local invoke_rc=0
-    provider_invoke "$prompt_file" "$output_file" "bulk" --format=json --timeout=1200 >&2 || invoke_rc=$?
-    export CLAUDE_MAX_TURNS="$saved_max_turns"
-    export ATOMIC_MAX_RETRIES="$saved_max_retries"
+    _audit_invoke_agent "$prompt_file" "$output_file" "$max_turns" "$audit_id" || invoke_rc=$?
     rm -f "$prompt_file"
 
     if [[ $invoke_rc -ne 0 ]]; then
@@ -1622,8 +2578,122 @@ AUDIT_PROMPT_FOOTER
         return 0
     fi
 
-    # Extract structured JSON from agent output
-    _audit_extract_result_json "$output_file" "$audit_id" "$audit_name"
+    # Raw agent output: the phase's result collector extracts, validates and caches it
+    cat "$output_file"
+}
+
+# Execute several related audits in one agent session (see audit_engine batch)
+# and write each audit's result to its result file. Audits resolved without an
+# agent (missing, skipped, cached) are written directly; if only one audit is
+# left it runs as a normal single audit.
+# Usage: _audit_execute_batch "$phase_num" "$ready_audits_json" index...
+_audit_execute_batch() {
+    local phase_num="$1"
+    local ready_audits="$2"
+    shift 2
+
+    local -a run=()
+    local i audit_id audit_name
+    for i in "$@"; do
+        audit_id=$(echo "$ready_audits" | jq -r ".[$i].audit_id")
+        audit_name=$(echo "$ready_audits" | jq -r ".[$i].name")
+        _audit_short_circuit "$audit_id" "$audit_name" \
+            > "$AUDIT_CACHE_DIR/result-phase${phase_num}-${i}.json" || run+=("$i")
+    done
+
+    if ((${#run[@]} == 0)); then
+        return 0
+    elif ((${#run[@]} == 1)); then
+        _audit_execute_single "$(echo "$ready_audits" | jq -r ".[${run[0]}].audit_id")" \
+            "$(echo "$ready_audits" | jq -r ".[${run[0]}].name")" "$phase_num" \
+            > "$AUDIT_CACHE_DIR/result-phase${phase_num}-${run[0]}.json"
+        return 0
+    fi
+
+    # Turn budget: the most demanding audit plus half as much again per extra audit
+    local max_turns=0 turns
+    for i in "${run[@]}"; do
+        turns=$(_audit_max_turns "$(echo "$ready_audits" | jq -r ".[$i].audit_id")")
+        ((turns > max_turns)) && max_turns="$turns"
+    done
+    max_turns=$((max_turns + max_turns * (${#run[@]} - 1) / 2))
+
+    local prompt_file output_file n=0
+    prompt_file=$(atomic_mktemp)
+    output_file="$AUDIT_CACHE_DIR/audit-result-batch-phase${phase_num}-${run[0]}.json"
+
+    {
+        _audit_snapshot_section
+        cat <<AUDIT_BATCH_HEADER
+# Execute Audits: batch of ${#run[@]}
+
+You are an expert software auditor. Execute each of the following ${#run[@]} audits against the project in this one session.
+They cover related ground: explore the project once, then follow each audit's procedure steps and check each of its signals.
+
+AUDIT_BATCH_HEADER
+        for i in "${run[@]}"; do
+            n=$((n + 1))
+            echo "## Audit $n/${#run[@]}: $(echo "$ready_audits" | jq -r ".[$i].audit_id") — $(echo "$ready_audits" | jq -r ".[$i].name")"
+            echo ""
+            _audit_definition_section "$(echo "$ready_audits" | jq -r ".[$i].audit_id")"
+            _audit_upstream_section "$(echo "$ready_audits" | jq -r ".[$i].audit_id")"
+        done
+        _audit_context_section
+        cat << 'AUDIT_BATCH_FOOTER'
+## Instructions
+
+1. Read every audit definition above — understand their signals and procedure steps
+2. Use your tools to explore the project repository and its artifacts once, for all audits
+3. Follow each audit's procedure steps to investigate the project state
+4. For each signal of each audit, assess whether the project exhibits or addresses it
+5. Produce one final JSON object with a result for EVERY audit above
+
+CRITICAL: You MUST output the JSON result below as your FINAL message. If you are running low on turns, stop investigating and produce the results with what you have. An incomplete result is far better than no result.
+
+## Output Format (REQUIRED)
+
+Output ONLY this JSON object (no markdown fences, no extra text), with one entry per audit, using each audit's exact ID:
+{
+    "results": [
+        {
+            "audit_id": "the.audit.id",
+            "name": "Audit Name",
+            "status": "pass|warn|fail",
+            "severity": "critical|high|medium|low",
+            "message": "One-line summary of audit result",
+            "findings": [
+                {
+                    "signal_id": "SIGNAL-ID-001",
+                    "finding": "What was found or is missing",
+                    "severity": "critical|high|medium|low",
+                    "recommendation": "What to do about it"
+                }
+            ]
+        }
+    ]
+}
+AUDIT_BATCH_FOOTER
+    } > "$prompt_file"
+
+    local -a member_ids=()
+    for i in "${run[@]}"; do
+        member_ids+=("$(echo "$ready_audits" | jq -r ".[$i].audit_id")")
+    done
+
+    local invoke_rc=0
+    _audit_invoke_agent "$prompt_file" "$output_file" "$max_turns" "${member_ids[@]}" || invoke_rc=$?
+    rm -f "$prompt_file"
+
+    # Every member gets the combined raw output; the result collector picks
+    # each audit's entry out of .results
+    for i in "${run[@]}"; do
+        if [[ $invoke_rc -ne 0 ]]; then
+            _audit_error_json "$(echo "$ready_audits" | jq -r ".[$i].audit_id")" \
+                "$(echo "$ready_audits" | jq -r ".[$i].name")" "Audit agent failed (rc=$invoke_rc)"
+        else
+            cat "$output_file"
+        fi > "$AUDIT_CACHE_DIR/result-phase${phase_num}-${i}.json"
+    done
 }
 
 # ============================================================================
@@ -1633,9 +2703,8 @@ AUDIT_PROMPT_FOOTER
 # Execute audits with streaming results — present findings as each audit completes
 # instead of waiting for all audits to finish before showing anything.
 #
-# Uses dual FIFO approach:
-#   FD 3 = semaphore FIFO (concurrency control, same as batch)
-#   FD 4 = completion FIFO (audits signal their index when done)
+# Launch order and concurrency come from the scheduler (_audit_run_scheduled);
+# each completion is processed as soon as the audit signals it.
 #
 # Returns: 0 (accept/apply), 2 (rerun requested)
 audit_execute_streaming() {
@@ -1648,7 +2717,8 @@ audit_execute_streaming() {
     local phase_num phase_name ready_audits audit_count
     phase_num=$(echo "$recommendations_json" | jq -r '.phase')
     phase_name=$(echo "$recommendations_json" | jq -r '.phase_name // ""')
-    ready_audits=$(echo "$recommendations_json" | jq -c '[.recommendations[] | select(.dependency_status == "ready")]')
+    _audit_dependency_plan "$recommendations_json" "$phase_num"
+    ready_audits="$_AUDIT_RUN_AUDITS"
     audit_count=$(echo "$ready_audits" | jq 'length')
 
     if [[ $audit_count -eq 0 ]]; then
@@ -1664,31 +2734,16 @@ audit_execute_streaming() {
     echo -e "${CYAN}╚═══════════════════════════════════════════════════════════════╝${NC}"
     echo ""
 
-    local max_parallel="${AUDIT_PARALLEL:-5}"
-    echo -e "  ${DIM}Running $audit_count audit agents ($max_parallel concurrent, streaming results)${NC}"
-    echo ""
-
-    # --- FIFO setup ---
+    _audit_project_snapshot
+    _audit_discovery_prepass "$ready_audits" "$phase_num"
+    _audit_render_prompts "$ready_audits" "$phase_num"
+    _audit_load_paths
 
-    # Semaphore (FD 3) — concurrency control
-    local sem_fifo="$AUDIT_CACHE_DIR/.audit-sem-$$"
-    mkfifo "$sem_fifo"
-    exec 3<>"$sem_fifo"
-    rm -f "$sem_fifo"
-    for ((j=0; j<max_parallel; j++)); do echo >&3; done
-
-    # Completion FIFO (FD 4) — audits signal their index when done
-    local done_fifo="$AUDIT_CACHE_DIR/.audit-done-$$"
-    mkfifo "$done_fifo"
-    exec 4<>"$done_fifo"
-    rm -f "$done_fifo"
+    echo -e "  ${DIM}Running $audit_count audit agents (streaming results)${NC}"
+    echo ""
 
     # --- Initialize state BEFORE launch (enables interleaved consumption) ---
-    local -a result_files=()
-    local audit audit_id audit_name
     local completed=0
-    local passed=0 failed=0 warnings=0 errors=0
-    local -a results=()
 
     # Streaming remediation state
     local user_mode="remediate"  # "remediate" | "done" | "accept-rest"
@@ -1700,9 +2755,10 @@ audit_execute_streaming() {
     # Determine artifact path for discuss context
     local artifact_path
     artifact_path=$(_audit_phase_artifact "$phase_num")
+    _audit_remedy_start "$artifact_path" "$phase_num"
 
-    # Helper: process one completion (called from launch loop and drain loop)
-    # Reads done_index from caller scope, updates state via caller scope
+    # Helper: process one completion (called by the scheduler loop)
+    # Updates state via caller scope
     _process_one_completion() {
         local done_index="$1"
 
@@ -1711,51 +2767,14 @@ audit_execute_streaming() {
             return 1  # garbage on FIFO — skip
         fi
 
-        ((completed++))
-
-        # Read result
-        local rf="${result_files[$done_index]}"
-        audit=$(echo "$ready_audits" | jq -c ".[$done_index]")
-        audit_id=$(echo "$audit" | jq -r '.audit_id')
-        audit_name=$(echo "$audit" | jq -r '.name')
-
-        local result status msg
-        if [[ -s "$rf" ]]; then
-            result=$(cat "$rf")
-            if ! echo "$result" | jq -e '.status' &>/dev/null; then
-                result=$(_audit_error_json "$audit_id" "$audit_name" "Invalid result JSON")
-            fi
-        else
-            result=$(_audit_error_json "$audit_id" "$audit_name" "Agent produced no output")
-        fi
-
-        status=$(echo "$result" | jq -r '.status')
-        msg=$(echo "$result" | jq -r '.message // ""')
-        results+=("$result")
+        completed=$((completed + 1))
+        _audit_remedy_pump
 
-        # Display status line
-        case "$status" in
-            pass)
-                echo -e "  ${GREEN}✓ PASS${NC}  ${DIM}[$completed/$audit_count]${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((passed++))
-                ;;
-            fail)
-                echo -e "  ${RED}✗ FAIL${NC}  ${DIM}[$completed/$audit_count]${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((failed++))
-                ;;
-            warn)
-                echo -e "  ${YELLOW}⚠ WARN${NC}  ${DIM}[$completed/$audit_count]${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((warnings++))
-                ;;
-            *)
-                echo -e "  ${CYAN}? ERR ${NC}  ${DIM}[$completed/$audit_count]${NC}  $audit_id"
-                [[ -n "$msg" ]] && echo -e "         ${DIM}$msg${NC}"
-                ((errors++))
-                ;;
-        esac
+        # Validated by the collector, which also adds it to the report
+        _audit_collect "$done_index"
+        local result="$_AUDIT_RESULT_JSON" status="$_AUDIT_RESULT_STATUS" audit_id
+        audit_id=$(echo "$result" | jq -r '.audit_id')
+        _audit_print_result "$status" "$audit_id" "$_AUDIT_RESULT_MESSAGE" "$completed/$audit_count"
 
         # Inline remediation for FAIL/WARN
         if [[ "$status" == "fail" || "$status" == "warn" ]]; then
@@ -1779,84 +2798,28 @@ audit_execute_streaming() {
         return 0
     }
 
-    # --- Launch phase with interleaved consumption ---
-    for ((i=0; i<audit_count; i++)); do
-        audit=$(echo "$ready_audits" | jq -c ".[$i]")
-        audit_id=$(echo "$audit" | jq -r '.audit_id')
-        audit_name=$(echo "$audit" | jq -r '.name')
-
-        local rf="$AUDIT_CACHE_DIR/result-phase${phase_num}-${i}.json"
-        result_files+=("$rf")
-        : > "$rf"  # ensure file exists
-
-        read -u 3  # acquire semaphore slot
-        (
-            local _i="$i"
-            trap 'printf "%d\n" "$_i" >&4; echo >&3' EXIT
-            _audit_execute_single "$audit_id" "$audit_name" "$phase_num" \
-                > "$rf" 2>"${rf%.json}.log"
-        ) &
-
-        echo -e "  ${DIM}[launched $((i+1))/$audit_count]${NC} $audit_id"
-
-        # Non-blocking: process any completions that arrived while launching
-        local _done_idx
-        while read -t 0 -u 4; do
-            if read -u 4 _done_idx; then
-                _process_one_completion "$_done_idx"
-            fi
-        done
-    done
-
-    echo ""
-    echo -e "${DIM}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
-    echo ""
-
-    # --- Drain loop: process remaining completions after all launched ---
-    while ((completed < audit_count)); do
-        # Block until an audit finishes (10-minute timeout)
-        local done_index=""
-        if ! read -t 600 -u 4 done_index; then
-            echo -e "  ${RED}Timeout waiting for audit results. $completed/$audit_count completed.${NC}"
-            break
-        fi
+    # --- Run phase: results are processed as each audit completes ---
+    _audit_collector_start "$ready_audits" "$phase_num" "$recommendations_json" "$report_file"
+    _audit_run_scheduled "$ready_audits" "$phase_num" _process_one_completion
+    _audit_collector_finish "$(_audit_run_meta)"
 
-        _process_one_completion "$done_index"
-    done
+    local passed failed warnings
+    read -r passed failed warnings < <(echo "$_AUDIT_COLLECT_SUMMARY" | jq -r '[.passed, .failed, .warnings] | map(. // 0) | @tsv')
 
-    # Wait for any remaining background jobs
-    wait
-    exec 3>&- 2>/dev/null
-    exec 4>&- 2>/dev/null
+    echo ""
+    if ((completed < audit_count)); then
+        echo -e "  ${RED}$completed/$audit_count audits completed.${NC}"
+    fi
 
-    # --- Generate report ---
+    # --- Summary (the collector has already written the report) ---
     echo -e "${DIM}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
     echo ""
-    echo -e "  ${BOLD}Results:${NC} ${GREEN}$passed passed${NC}, ${RED}$failed failed${NC}, ${YELLOW}$warnings warnings${NC}, ${CYAN}$errors errors${NC}"
+    _audit_print_summary
     if [[ $resolved_count -gt 0 || $skipped_count -gt 0 ]]; then
         echo -e "  ${BOLD}Inline:${NC}  ${GREEN}$resolved_count resolved${NC}, ${YELLOW}$skipped_count skipped${NC}"
     fi
     echo ""
 
-    local report
-    report=$(cat <<EOF
-{
-    "phase": $phase_num,
-    "timestamp": "$(date -Iseconds)",
-    "summary": {
-        "total": $audit_count,
-        "passed": $passed,
-        "failed": $failed,
-        "warnings": $warnings,
-        "errors": $errors
-    },
-    "results": $(printf '%s\n' "${results[@]}" | jq -s '.'),
-    "recommendations": $(echo "$recommendations_json" | jq '.recommendations')
-}
-EOF
-)
-
-    echo "$report" > "$report_file"
     echo -e "  ${GREEN}✓${NC} Report saved: $report_file"
 
     # Register audit artifacts
@@ -1866,14 +2829,17 @@ EOF
     atomic_context_decision "Phase $phase_num audit: $passed passed, $failed failed, $warnings warnings" "audit"
 
     # --- Post-summary menu ---
+    local post_rc=0
     _audit_stream_post_summary "$report_file" "$phase_num" "$phase_name" \
-        "$resolution_plan" "$resolved_count" "$skipped_count"
-    return $?
+        "$resolution_plan" "$resolved_count" "$skipped_count" || post_rc=$?
+    _audit_remedy_stop
+    return "$post_rc"
 }
 
 # Present a single audit's findings for inline remediation during streaming.
 # Modifies caller variables via namerefs: finding_global_index, resolution_plan,
-# resolved_count, skipped_count, user_mode.
+# resolved_count, skipped_count, user_mode. Accepted resolutions also go to the
+# remediation pipeline (_audit_remedy_enqueue).
 _audit_stream_remediate_single() {
     local result_json="$1"
     local audit_id="$2"
@@ -1885,36 +2851,13 @@ _audit_stream_remediate_single() {
     local -n _umode="$8"        # user_mode (can be set to "done" or "accept-rest")
     local artifact_path="${9:-}"
 
-    local status_upper
-    status_upper=$(echo "$status" | tr '[:lower:]' '[:upper:]')
-
-    # Flatten findings from this single audit result
-    local flat_findings
-    flat_findings=$(echo "$result_json" | jq -c '
-        . as $parent |
-        if (.findings | length) == 0 then
-            [{
-                audit_id: $parent.audit_id,
-                status: $parent.status,
-                finding: ($parent.message // "No details"),
-                f_severity: ($parent.severity // "medium"),
-                f_recommendation: "Address the issue as described",
-                f_signal: ""
-            }]
-        else
-            [.findings[] | {
-                audit_id: $parent.audit_id,
-                status: $parent.status,
-                finding: (.finding // ""),
-                f_severity: (.severity // "medium"),
-                f_recommendation: (.recommendation // ""),
-                f_signal: (.signal_id // "")
-            }]
-        end
-    ')
+    local status_upper="${status^^}"
 
-    local count
-    count=$(echo "$flat_findings" | jq 'length')
+    # Flatten findings from this single audit result in one pass:
+    # finding, severity, recommendation, entry JSON per finding
+    local -a fields=()
+    mapfile -d '' -t fields < <(_audit_flatten_findings "$result_json")
+    local count=$((${#fields[@]} / 4))
 
     if [[ $count -eq 0 ]]; then
         return 0
@@ -1927,20 +2870,14 @@ _audit_stream_remediate_single() {
 
     local f
     for ((f=0; f<count; f++)); do
-        local entry
-        entry=$(echo "$flat_findings" | jq -c ".[$f]")
-
-        local finding f_severity f_recommendation
-        finding=$(echo "$entry" | jq -r '.finding')
-        f_severity=$(echo "$entry" | jq -r '.f_severity')
-        f_recommendation=$(echo "$entry" | jq -r '.f_recommendation')
+        local finding="${fields[f*4]}" f_severity="${fields[f*4+1]}"
+        local f_recommendation="${fields[f*4+2]}" entry="${fields[f*4+3]}"
 
-        ((_fgi++))
+        _fgi=$((_fgi + 1))
 
         # Auto-accept remaining for this audit
         if [[ "$auto_accept_this" == true ]]; then
-            _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $f_recommendation\n\n"
-            ((_rcount++))
+            _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$f_recommendation"
             echo -e "    ${GREEN}✓${NC} ${DIM}#$_fgi [${f_severity^^}] auto-accepted${NC}"
             continue
         fi
@@ -1969,26 +2906,23 @@ _audit_stream_remediate_single() {
                 return 0
                 ;;
             accept-rest)
-                _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $f_recommendation\n\n"
-                ((_rcount++))
+                _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$f_recommendation"
                 echo -e "    ${GREEN}-> Accepted (+ auto-accepting all remaining)${NC}"
                 _umode="accept-rest"
                 # Accept remaining findings in THIS audit too
                 auto_accept_this=true
                 ;;
             skip|s)
-                ((_scount++))
+                _scount=$((_scount + 1))
                 echo -e "    ${DIM}-> Skipped${NC}"
                 ;;
             all)
-                _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $f_recommendation\n\n"
-                ((_rcount++))
+                _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$f_recommendation"
                 auto_accept_this=true
                 echo -e "    ${GREEN}-> Accepted (+ all remaining for this audit)${NC}"
                 ;;
             ""|accept|a)
-                _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $f_recommendation\n\n"
-                ((_rcount++))
+                _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$f_recommendation"
                 echo -e "    ${GREEN}-> Accepted${NC}"
                 ;;
             discuss|"?")
@@ -1997,8 +2931,7 @@ _audit_stream_remediate_single() {
                 discuss_result=$(_audit_discuss_finding "$entry" "$audit_id" "$artifact_path")
                 discuss_rc=$?
                 if [[ $discuss_rc -eq 0 && -n "$discuss_result" ]]; then
-                    _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $discuss_result\n\n"
-                    ((_rcount++))
+                    _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$discuss_result"
                     echo -e "    ${GREEN}-> $discuss_result${NC}"
                 else
                     # User exited discussion without resolving — re-prompt
@@ -2014,7 +2947,7 @@ _audit_stream_remediate_single() {
                     read -e -p "  Resolution: " user_response
                     case "$user_response" in
                         skip|s)
-                            ((_scount++))
+                            _scount=$((_scount + 1))
                             echo -e "    ${DIM}-> Skipped${NC}"
                             ;;
                         done)
@@ -2022,13 +2955,11 @@ _audit_stream_remediate_single() {
                             return 0
                             ;;
                         ""|accept|a)
-                            _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $f_recommendation\n\n"
-                            ((_rcount++))
+                            _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$f_recommendation"
                             echo -e "    ${GREEN}-> Accepted${NC}"
                             ;;
                         *)
-                            _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $user_response\n\n"
-                            ((_rcount++))
+                            _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$user_response"
                             echo -e "    ${GREEN}-> $user_response${NC}"
                             ;;
                     esac
@@ -2036,8 +2967,7 @@ _audit_stream_remediate_single() {
                 ;;
             *)
                 # Custom resolution text
-                _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $user_response\n\n"
-                ((_rcount++))
+                _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$user_response"
                 echo -e "    ${GREEN}-> $user_response${NC}"
                 ;;
         esac
@@ -2053,40 +2983,239 @@ _audit_stream_auto_accept_single() {
     local -n _rplan="$5"     # resolution_plan
     local -n _rcount="$6"    # resolved_count
 
-    local status_upper
-    status_upper=$(echo "$status" | tr '[:lower:]' '[:upper:]')
+    local status_upper="${status^^}"
+
+    local -a fields=()
+    mapfile -d '' -t fields < <(_audit_flatten_findings "$result_json")
+    local count=$((${#fields[@]} / 4))
+
+    local f
+    for ((f=0; f<count; f++)); do
+        _fgi=$((_fgi + 1))
+        _audit_stream_accept "$status_upper" "$audit_id" "${fields[f*4]}" "${fields[f*4+2]}"
+    done
+
+    echo -e "         ${DIM}(auto-accepted $count findings)${NC}"
+}
 
-    # Flatten findings
-    local flat_findings count
-    flat_findings=$(echo "$result_json" | jq -c '
+# Findings of one audit result as NUL-separated fields, four per finding:
+# finding, severity, recommendation, entry JSON (for _audit_discuss_finding).
+# A result without findings yields one entry from its message.
+# Usage: mapfile -d '' -t fields < <(_audit_flatten_findings "$result_json")
+_audit_flatten_findings() {
+    echo "$1" | jq -j '
         . as $parent |
-        if (.findings | length) == 0 then
+        (if (.findings | length) == 0 then
             [{
+                audit_id: $parent.audit_id,
+                status: $parent.status,
                 finding: ($parent.message // "No details"),
-                f_recommendation: "Address the issue as described"
+                f_severity: ($parent.severity // "medium"),
+                f_recommendation: "Address the issue as described",
+                f_signal: ""
             }]
         else
             [.findings[] | {
+                audit_id: $parent.audit_id,
+                status: $parent.status,
                 finding: (.finding // ""),
-                f_recommendation: (.recommendation // "")
+                f_severity: (.severity // "medium"),
+                f_recommendation: (.recommendation // ""),
+                f_signal: (.signal_id // "")
             }]
-        end
-    ')
-    count=$(echo "$flat_findings" | jq 'length')
+        end)[]
+        | (.finding | tostring), "\u0000", (.f_severity | tostring), "\u0000",
+          (.f_recommendation | tostring), "\u0000", tojson, "\u0000"' 2>/dev/null
+}
 
-    local f
-    for ((f=0; f<count; f++)); do
-        local entry finding f_recommendation
-        entry=$(echo "$flat_findings" | jq -c ".[$f]")
-        finding=$(echo "$entry" | jq -r '.finding')
-        f_recommendation=$(echo "$entry" | jq -r '.f_recommendation')
+# Record an accepted resolution in the caller's plan (_rplan, _rcount) and
+# queue its patch in the remediation pipeline
+# Usage: _audit_stream_accept "$status_upper" "$audit_id" "$finding" "$resolution"
+_audit_stream_accept() {
+    local status_upper="$1" audit_id="$2" finding="$3" resolution="$4"
+    _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $resolution\n\n"
+    _audit_remedy_enqueue "$_rcount" "$status_upper" "$audit_id" "$finding" "$resolution"
+    _rcount=$((_rcount + 1))
+}
+
+# ============================================================================
+# REMEDIATION PIPELINE
+# ============================================================================
+
+# Accepted resolutions flow through a bounded queue to background patch
+# agents while the review continues, so review time hides LLM latency.
+# Each agent answers with exact-text edits of the artifact as it was when
+# streaming began; at "apply" audit_engine remediate merges them in
+# acceptance order and only the patches that did not apply go through a full
+# document revision. See AUDIT_REMEDIATE_PIPELINE.
+
+# Start the pipeline for a phase artifact; a no-op unless the artifact is a
+# single file and python3 is available
+# Usage: _audit_remedy_start "$artifact_path" "$phase_num"
+_audit_remedy_start() {
+    local artifact_path="$1"
+    local phase_num="$2"
 
-        ((_fgi++))
-        _rplan+="$_rcount. [${status_upper}] $audit_id\n   FINDING: $finding\n   RESOLUTION: $f_recommendation\n\n"
-        ((_rcount++))
+    _AUDIT_REMEDY_DIR=""
+    _AUDIT_REMEDY_PIDS=()
+    _AUDIT_REMEDY_QUEUE=()
+    [[ "$AUDIT_REMEDIATE_PIPELINE" == "on" && -n "$artifact_path" && -f "$artifact_path" ]] || return 0
+    _audit_engine_available || return 0
+
+    _AUDIT_REMEDY_DIR="$AUDIT_CACHE_DIR/remediation-phase${phase_num}"
+    rm -rf "$_AUDIT_REMEDY_DIR"
+    mkdir -p "$_AUDIT_REMEDY_DIR"
+    cp "$artifact_path" "$_AUDIT_REMEDY_DIR/base"
+}
+
+# Queue the patch for one accepted resolution. The queue is bounded: with
+# AUDIT_REMEDIATE_QUEUE resolutions already waiting, the resolution is left
+# to the full revision at apply time instead (review never blocks).
+# Usage: _audit_remedy_enqueue "$seq" "$status_upper" "$audit_id" "$finding" "$resolution"
+_audit_remedy_enqueue() {
+    [[ -n "$_AUDIT_REMEDY_DIR" ]] || return 0
+    local seq="$1"
+    jq -n --argjson seq "$seq" --arg status "$2" --arg id "$3" --arg finding "$4" --arg resolution "$5" \
+        '{seq: $seq, status: $status, audit_id: $id, finding: $finding, resolution: $resolution}' \
+        > "$_AUDIT_REMEDY_DIR/$(printf '%05d' "$seq").req.json"
+    _audit_remedy_pump
+    ((${#_AUDIT_REMEDY_QUEUE[@]} < AUDIT_REMEDIATE_QUEUE)) || return 0
+    _AUDIT_REMEDY_QUEUE+=("$seq")
+    _audit_remedy_pump
+}
+
+# Reap finished patch agents and start queued ones up to AUDIT_REMEDIATE_PARALLEL
+_audit_remedy_pump() {
+    [[ -n "$_AUDIT_REMEDY_DIR" ]] || return 0
+    local seq
+    for seq in "${!_AUDIT_REMEDY_PIDS[@]}"; do
+        kill -0 "${_AUDIT_REMEDY_PIDS[$seq]}" 2>/dev/null || unset '_AUDIT_REMEDY_PIDS[$seq]'
+    done
+    while ((${#_AUDIT_REMEDY_QUEUE[@]} > 0 && ${#_AUDIT_REMEDY_PIDS[@]} < AUDIT_REMEDIATE_PARALLEL)); do
+        seq="${_AUDIT_REMEDY_QUEUE[0]}"
+        _AUDIT_REMEDY_QUEUE=("${_AUDIT_REMEDY_QUEUE[@]:1}")
+        _audit_remedy_patch "$(printf '%s/%05d' "$_AUDIT_REMEDY_DIR" "$seq")" </dev/null >/dev/null 2>&1 &
+        _AUDIT_REMEDY_PIDS[$seq]=$!
     done
+}
 
-    echo -e "         ${DIM}(auto-accepted $count findings)${NC}"
+# Wait for every queued and running patch agent
+_audit_remedy_drain() {
+    [[ -n "$_AUDIT_REMEDY_DIR" ]] || return 0
+    _audit_remedy_pump
+    local total=$((${#_AUDIT_REMEDY_PIDS[@]} + ${#_AUDIT_REMEDY_QUEUE[@]}))
+    ((total > 0)) || return 0
+    atomic_waiting "Waiting for $total remediation patch(es)..."
+    while ((${#_AUDIT_REMEDY_PIDS[@]} + ${#_AUDIT_REMEDY_QUEUE[@]} > 0)); do
+        sleep 0.5
+        _audit_remedy_pump
+    done
+}
+
+# Stop patch agents still running (the user did not apply the resolutions).
+# Each job kills its agent's process group on TERM (see _audit_remedy_patch).
+_audit_remedy_stop() {
+    local seq
+    for seq in "${!_AUDIT_REMEDY_PIDS[@]}"; do
+        kill "${_AUDIT_REMEDY_PIDS[$seq]}" 2>/dev/null || true
+    done
+    _AUDIT_REMEDY_PIDS=()
+    _AUDIT_REMEDY_QUEUE=()
+}
+
+# Generate one patch: PREFIX.req.json in, raw agent output to PREFIX.out
+# Usage: _audit_remedy_patch "$prefix"  (runs in the background)
+_audit_remedy_patch() {
+    local prefix="$1"
+    local prompt_file="$prefix.prompt.md"
+    exec 4>&- 5<&- 2>/dev/null
+
+    {
+        cat << 'PATCH_PROMPT_HEADER'
+# Audit Remediation Patch
+
+You are fixing ONE audit finding in the document below. The user reviewed the
+finding and directed how to resolve it. Reply with exact-text edits, not a
+revised document.
+
+PATCH_PROMPT_HEADER
+        jq -r '"## Finding\n\n[\(.status)] \(.audit_id)\nFINDING: \(.finding)\nRESOLUTION: \(.resolution)\n"' \
+            "$prefix.req.json"
+        cat << 'PATCH_PROMPT_RULES'
+## Output Format (REQUIRED)
+
+Do NOT use any tools. Output ONLY this JSON object (no markdown fences, no extra text):
+{"edits": [{"find": "exact text copied from the document", "replace": "text to put in its place"}]}
+
+- Each "find" must be copied verbatim from the document and occur in it exactly once.
+- To add content, find the line it belongs after and replace that line with itself plus the new content.
+- Keep edits small and limited to this finding; other findings are fixed separately.
+- If the document already satisfies the resolution, output {"edits": []}.
+
+## Document
+
+PATCH_PROMPT_RULES
+        cat "$(dirname "$prefix")/base"
+    } > "$prompt_file"
+
+    # The agent gets its own process group: stopping this job (or an
+    # interrupt reaching it) then takes down the agent CLI and whatever it
+    # started, not just this subshell
+    local agent="" rc=0
+    trap '[[ -n "$agent" ]] && kill -TERM -- "-$agent" 2>/dev/null; rm -f "$prompt_file" "$prefix.out.tmp"; exit 143' \
+        TERM INT HUP
+    export CLAUDE_MAX_TURNS=3
+    set -m
+    atomic_invoke "$prompt_file" "$prefix.out.tmp" "Remediation patch" --model=opus --timeout=1200 &
+    agent=$!
+    set +m
+    wait "$agent" || rc=$?
+    trap - TERM INT HUP
+    ((rc == 0)) && mv "$prefix.out.tmp" "$prefix.out"
+    rm -f "$prompt_file" "$prefix.out.tmp"
+}
+
+# Merge the pipeline's patches into the artifact and review the result;
+# resolutions whose patches did not apply go through a full revision of the
+# merged document first
+# Usage: _audit_remedy_apply "$artifact_path" "$resolved_count" "$phase_num" "$phase_name" "$extra_instructions"
+_audit_remedy_apply() {
+    local artifact_path="$1"
+    local resolved_count="$2"
+    local phase_num="$3"
+    local phase_name="$4"
+    local extra="${5:-}"
+
+    _audit_remedy_drain
+
+    local merged="$_AUDIT_REMEDY_DIR/merged" leftover="$_AUDIT_REMEDY_DIR/leftover.txt" summary
+    if ! summary=$(_audit_engine remediate --artifact "$artifact_path" --patch-dir "$_AUDIT_REMEDY_DIR" \
+            --out "$merged" --leftover "$leftover" 2>/dev/null); then
+        return 1
+    fi
+
+    local applied edits left
+    read -r applied edits left < <(echo "$summary" | jq -r '[(.applied | length), .edits, (.leftover | length)] | @tsv')
+    echo -e "  ${DIM}Patches: $applied of $resolved_count merged in order ($edits edit(s)); $left need a full revision${NC}"
+
+    local output="$AUDIT_OUTPUT_DIR/phase-$phase_num-remediation-output.md"
+    if ((left > 0)) || [[ -n "$extra" ]]; then
+        local plan
+        plan=$(cat "$leftover")
+        [[ -n "$extra" ]] && plan+="\nADDITIONAL INSTRUCTIONS FROM USER:\n$extra\n"
+        local rc=0
+        _audit_generate_remediation "$merged" "$plan" "$((left > 0 ? left : resolved_count))" "$phase_num" \
+            "$output" || rc=$?
+        if ((rc == 2)); then
+            # The agent edited the merged copy in place
+            cp "$merged" "$output"
+        elif ((rc != 0)); then
+            return "$rc"
+        fi
+    else
+        cp "$merged" "$output"
+    fi
+    _audit_review_remediation "$artifact_path" "$output" "$resolved_count" "$phase_num"
 }
 
 # Multi-turn discussion about a specific finding with an AI agent.
@@ -2284,7 +3413,7 @@ _audit_stream_post_summary() {
                 echo -e "  ${DIM}Any additional instructions for the remediation agent? (Enter to skip):${NC}"
                 read -e -p "  > " additional_context
 
-                if [[ -n "$additional_context" ]]; then
+                if [[ -n "$additional_context" && -z "$_AUDIT_REMEDY_DIR" ]]; then
                     resolution_plan+="\nADDITIONAL INSTRUCTIONS FROM USER:\n$additional_context\n"
                 fi
 
@@ -2353,7 +3482,14 @@ _audit_stream_post_summary() {
                     return 0
                 fi
 
-                # Apply remediation via LLM
+                # Merge the patches generated during review, else revise the whole artifact
+                if [[ -n "$_AUDIT_REMEDY_DIR" ]]; then
+                    _audit_remedy_apply "$artifact_path" "$resolved_count" "$phase_num" "$phase_name" \
+                        "$additional_context" && return 0
+                    echo -e "  ${YELLOW}Patch merge failed — revising the whole artifact${NC}"
+                    [[ -n "$additional_context" ]] && \
+                        resolution_plan+="\nADDITIONAL INSTRUCTIONS FROM USER:\n$additional_context\n"
+                fi
                 _audit_apply_remediation "$artifact_path" "$resolution_plan" "$resolved_count" "$phase_num" "$phase_name"
                 return $?
                 ;;
@@ -2784,9 +3920,27 @@ _audit_apply_remediation() {
     local phase_num="$4"
     local phase_name="$5"
 
-    local prompts_dir="$AUDIT_OUTPUT_DIR"
-    local remediation_prompt="$prompts_dir/phase-$phase_num-remediation-prompt.md"
-    local remediation_output="$prompts_dir/phase-$phase_num-remediation-output.md"
+    local remediation_output="$AUDIT_OUTPUT_DIR/phase-$phase_num-remediation-output.md"
+    local rc=0
+    _audit_generate_remediation "$artifact_path" "$resolution_plan" "$resolved_count" "$phase_num" \
+        "$remediation_output" || rc=$?
+    ((rc == 2)) && return 0  # agent already edited the artifact
+    ((rc == 0)) || return "$rc"
+    _audit_review_remediation "$artifact_path" "$remediation_output" "$resolved_count" "$phase_num"
+}
+
+# Revise a document per a resolution plan with one LLM call and check the
+# output looks like the complete document. Returns 0 with the revision in
+# output_file, 1 otherwise (2 if the agent edited the document in place).
+# Usage: _audit_generate_remediation "$document" "$resolution_plan" "$count" "$phase_num" "$output_file"
+_audit_generate_remediation() {
+    local artifact_path="$1"
+    local resolution_plan="$2"
+    local resolved_count="$3"
+    local phase_num="$4"
+    local remediation_output="$5"
+
+    local remediation_prompt="$AUDIT_OUTPUT_DIR/phase-$phase_num-remediation-prompt.md"
 
     cat > "$remediation_prompt" << 'PROMPT_HEADER'
 # Audit Remediation — Applying User-Directed Fixes
@@ -2857,7 +4011,7 @@ PROMPT_HEADER
             echo -e "  ${YELLOW}LLM appears to have modified the artifact directly (+$((current_lines - orig_lines)) lines).${NC}"
             echo -e "  ${DIM}Changes are already applied.${NC}"
             atomic_context_decision "Phase $phase_num audit remediation applied (direct write)" "audit-remediation"
-            return 0
+            return 2
         fi
         return 1
     fi
@@ -2867,6 +4021,16 @@ PROMPT_HEADER
         sed -i '1d' "$remediation_output"
         tail -1 "$remediation_output" | grep -q '```' && sed -i '$d' "$remediation_output"
     fi
+    return 0
+}
+
+# Show a revision's diff summary and let the user apply, diff or discard it
+# Usage: _audit_review_remediation "$artifact_path" "$revised_file" "$resolved_count" "$phase_num"
+_audit_review_remediation() {
+    local artifact_path="$1"
+    local remediation_output="$2"
+    local resolved_count="$3"
+    local phase_num="$4"
 
     # ── Diff & Apply ──
 
@@ -2875,7 +4039,9 @@ PROMPT_HEADER
         return 0
     fi
 
-    local added removed
+    local added removed output_lines orig_lines
+    output_lines=$(wc -l < "$remediation_output" 2>/dev/null || echo 0)
+    orig_lines=$(wc -l < "$artifact_path" 2>/dev/null || echo 0)
     added=$(diff "$artifact_path" "$remediation_output" 2>/dev/null | grep -c '^>' || echo 0)
     removed=$(diff "$artifact_path" "$remediation_output" 2>/dev/null | grep -c '^<' || echo 0)
 
@@ -0,0 +1,13 @@
+"""
+ATOMIC CLAUDE - Audit Engine
+
+Python helpers for lib/audit.sh. Each module is a small, self-contained tool
+invoked from bash as a subcommand:
+
+    PYTHONPATH="$ATOMIC_ROOT/lib" python3 -m audit_engine <command> [args...]
+
+Every caller in audit.sh keeps its pure-bash path as a fallback, so hosts
+without python3 + PyYAML still run audits (just without the speedups).
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,37 @@
+"""Subcommand dispatcher: python3 -m audit_engine <command> [args...]"""
+
+import importlib
+import sys
+
+# command name -> module implementing main(argv)
+COMMANDS = {
+    "batch": "audit_engine.batching",
+    "bundle": "audit_engine.bundle",
+    "collect": "audit_engine.collector",
+    "context": "audit_engine.snapshot",
+    "discover": "audit_engine.discovery",
+    "extract": "audit_engine.extract",
+    "graph": "audit_engine.depgraph",
+    "prompt": "audit_engine.prompt",
+    "rank": "audit_engine.ranker",
+    "records": "audit_engine.records",
+    "recommend": "audit_engine.recommend",
+    "remediate": "audit_engine.remediate",
+    "schedule": "audit_engine.scheduler",
+    "scan": "audit_engine.scanner",
+    "telemetry": "audit_engine.telemetry",
+}
+
+
+def main() -> int:
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help") or sys.argv[1] not in COMMANDS:
+        print("Usage: python3 -m audit_engine <command> [args...]", file=sys.stderr)
+        print(f"Commands: {', '.join(sorted(COMMANDS))}", file=sys.stderr)
+        return 0 if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help") else 2
+
+    module = importlib.import_module(COMMANDS[sys.argv[1]])
+    return module.main(sys.argv[2:]) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Batching planner: group compatible audits into one agent session.
+
+Every agent session starts cold and explores the project before it can
+check anything, so many small audits from the same subcategory repeat the
+same exploration. The planner groups audits that would explore the same
+ground:
+
+    same category, subcategory and tier (inventory)
+    same runtime requirement (a running system or not)
+    compatible discovery evidence: audits with evidence share at least
+    MIN_SHARED of their matched files with the batch; zero-evidence audits
+    batch only with each other; audits without evaluable patterns by
+    inventory key alone
+
+Batches are filled longest-first, first-fit, within a size limit, a token
+budget (rendered prompt or raw YAML, estimated) and an estimated_duration
+budget, so one batch never turns into a session that runs out of turns.
+
+Usage:
+    python3 -m audit_engine batch --repo AUDITS_REPO --ids-file FILE
+        [--max-size N] [--max-tokens N] [--max-minutes N]
+        [--discovery-dir DIR] [--prompt-dir DIR] [--solo-verdict VERDICT]
+
+Prints {"units": [[index, ...], ...], "audits": N, "sessions": N}, where
+indices are line numbers of the IDs file and units keep first-index order.
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .corpus import AuditRepo
+from .prompt import estimate_tokens
+from .scheduler import DEFAULT_ESTIMATE, parse_duration
+
+DEFAULT_MAX_SIZE = 4
+DEFAULT_MAX_TOKENS = 8000         # combined audit definitions per session
+DEFAULT_MAX_MINUTES = 360         # summed estimated_duration per session
+MIN_SHARED = 0.3                  # evidence overlap needed to join a batch
+
+_REQUIRES = ("requires_runtime", "requires_physical_access",
+             "requires_human_evaluation", "requires_interviews")
+
+
+@dataclass
+class Member:
+    index: int
+    audit_id: str
+    key: tuple
+    verdict: str
+    files: frozenset[str]
+    tokens: int
+    minutes: float
+
+
+@dataclass
+class Batch:
+    members: list[Member] = field(default_factory=list)
+    files: set[str] = field(default_factory=set)
+    tokens: int = 0
+    minutes: float = 0.0
+
+    def accepts(self, m: Member, max_size: int, max_tokens: int, max_minutes: float) -> bool:
+        if len(self.members) >= max_size:
+            return False
+        if self.tokens + m.tokens > max_tokens or self.minutes + m.minutes > max_minutes:
+            return False
+        if m.verdict != "evidence" or not self.files:
+            return True
+        return len(m.files & self.files) >= MIN_SHARED * len(m.files)
+
+    def add(self, m: Member):
+        self.members.append(m)
+        self.files |= m.files
+        self.tokens += m.tokens
+        self.minutes += m.minutes
+
+
+def _manifest(discovery_dir: Path | None, audit_id: str) -> dict:
+    if not discovery_dir:
+        return {}
+    try:
+        return json.loads((discovery_dir / f"{audit_id}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _tokens(repo: AuditRepo, prompt_dir: Path | None, audit_id: str) -> int:
+    for path in ((prompt_dir / f"{audit_id}.md") if prompt_dir else None, repo.audit_path(audit_id)):
+        if path and path.is_file():
+            return estimate_tokens(path.read_text(encoding="utf-8"))
+    return 0
+
+
+def members(repo: AuditRepo, audit_ids: list[str], discovery_dir: Path | None = None,
+            prompt_dir: Path | None = None) -> list[Member]:
+    out = []
+    for index, audit_id in enumerate(audit_ids):
+        row = repo.inventory.get(audit_id) or {}
+        manifest = _manifest(discovery_dir, audit_id)
+        verdict = manifest.get("verdict", "n/a")
+        # Evidence-less audits of one subcategory explore the same (nothing); evidence
+        # audits are further split by file overlap in Batch.accepts
+        key = (row.get("category", ""), row.get("subcategory", ""), row.get("tier", ""),
+               tuple(row.get(flag, "").lower() == "true" for flag in _REQUIRES),
+               verdict if verdict == "none" else "")
+        minutes = (parse_duration(row.get("estimated_duration", "")) or DEFAULT_ESTIMATE) / 60
+        out.append(Member(index, audit_id, key, verdict, frozenset(manifest.get("files") or ()),
+                          _tokens(repo, prompt_dir, audit_id), minutes))
+    return out
+
+
+def plan(audits: list[Member], max_size: int = DEFAULT_MAX_SIZE,
+         max_tokens: int = DEFAULT_MAX_TOKENS, max_minutes: float = DEFAULT_MAX_MINUTES,
+         solo_verdicts: frozenset[str] = frozenset()) -> list[list[int]]:
+    """Units of audit indices; each unit runs as one agent session."""
+    groups: dict[tuple, list[Member]] = {}
+    units: list[list[int]] = []
+    for m in audits:
+        if max_size <= 1 or m.verdict in solo_verdicts or not m.key[0]:
+            units.append([m.index])
+        else:
+            groups.setdefault(m.key, []).append(m)
+
+    for group in groups.values():
+        batches: list[Batch] = []
+        for m in sorted(group, key=lambda m: (-m.minutes, m.index)):
+            target = next((b for b in batches if b.accepts(m, max_size, max_tokens, max_minutes)), None)
+            if target is None:
+                target = Batch()
+                batches.append(target)
+            target.add(m)
+        units.extend(sorted(m.index for m in b.members) for b in batches)
+
+    return sorted(units, key=lambda unit: unit[0])
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine batch",
+                                     description="Group compatible audits into shared agent sessions")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--ids-file", required=True, help="Audit IDs, one per line (- for stdin)")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE,
+                        help=f"Audits per session, 1 = no batching (default: {DEFAULT_MAX_SIZE})")
+    parser.add_argument("--max-tokens", type=int, default=DEFAULT_MAX_TOKENS,
+                        help=f"Estimated definition tokens per session (default: {DEFAULT_MAX_TOKENS})")
+    parser.add_argument("--max-minutes", type=float, default=DEFAULT_MAX_MINUTES,
+                        help=f"Summed estimated_duration per session (default: {DEFAULT_MAX_MINUTES})")
+    parser.add_argument("--discovery-dir", help="Discovery manifests (verdicts and matched files)")
+    parser.add_argument("--prompt-dir", help="Rendered compact prompts (token estimates)")
+    parser.add_argument("--solo-verdict", action="append", default=[],
+                        help="Never batch audits with this discovery verdict (repeatable)")
+    args = parser.parse_args(argv)
+
+    lines = (sys.stdin.read() if args.ids_file == "-"
+             else Path(args.ids_file).read_text(encoding="utf-8")).splitlines()
+    audits = members(AuditRepo(args.repo), [line.strip() for line in lines],
+                     Path(args.discovery_dir) if args.discovery_dir else None,
+                     Path(args.prompt_dir) if args.prompt_dir else None)
+    units = plan(audits, args.max_size, args.max_tokens, args.max_minutes,
+                 frozenset(args.solo_verdict))
+
+    json.dump({"units": units, "audits": len(audits), "sessions": len(units)}, sys.stdout)
+    print()
+    return 0
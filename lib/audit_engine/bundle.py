@@ -0,0 +1,183 @@
+"""
+Compiled audit corpus bundle.
+
+Parsing the ~2,200 audit YAMLs takes seconds even with libyaml, and every
+engine command that needs definitions (discover, prompt, rank, graph,
+scan) used to re-parse the ones it touched. This compiles the corpus once
+into AUDIT-BUNDLE.sqlite at the audits repository root; AuditRepo
+(corpus.py) reads from it transparently.
+
+Tables:
+    meta     key -> value: version, built, inventory_stamp, audits,
+             prompt_version (RENDERER_VERSION of the stored prompts)
+    audits   one row per inventory audit, in inventory order (ord):
+             audit_id, file_path, stamp (YAML mtime:size), yaml_bytes,
+             category, subcategory, tier, severity, automatable, status
+             (indexed), row (inventory row JSON), record (the parsed
+             definition as JSON; NULL if the YAML does not parse), prompt,
+             prompt_tokens, prompt_stage, prompt_truncated (the compact
+             prompt rendered at the default budget without evidence)
+
+Rebuilds are incremental: rows whose YAML stamp is unchanged are kept, only
+edited audits are parsed again, and the update is a single transaction, so
+readers see either the old or the new bundle. A version change rebuilds
+from scratch into a temporary file that replaces the old one. A change to
+the prompt renderer (prompt.py) re-renders every stored prompt from its
+stored record, without parsing the YAML again. Records are
+normalized by the JSON round trip: dates and other non-JSON scalars become
+strings.
+
+Usage:
+    python3 -m audit_engine bundle --repo AUDITS_REPO [--rebuild] [--check]
+
+Prints {"path", "audits", "parsed", "reused", "rerendered", "removed",
+"seconds"}. --check only counts the audits whose entry is missing or
+outdated (all of them after an inventory or renderer change) as {"path", "audits", "stale"} and exits
+1 if there are any.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from .corpus import BUNDLE_VERSION, AuditRepo, file_stamp, load_yaml, open_bundle
+from .prompt import RENDERER_VERSION, render
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE audits (
+    audit_id TEXT PRIMARY KEY, ord INTEGER, file_path TEXT, stamp TEXT, yaml_bytes INTEGER,
+    category TEXT, subcategory TEXT, tier TEXT, severity TEXT, automatable TEXT, status TEXT,
+    row TEXT, record TEXT, prompt TEXT, prompt_tokens INTEGER, prompt_stage INTEGER,
+    prompt_truncated INTEGER);
+CREATE INDEX audits_category ON audits (category, subcategory);
+CREATE INDEX audits_tier ON audits (tier);
+CREATE INDEX audits_severity ON audits (severity);
+CREATE INDEX audits_automatable ON audits (automatable);
+"""
+INDEXED = ("category", "subcategory", "tier", "severity", "automatable", "status")
+
+
+def compile_entry(repo: AuditRepo, audit_id: str) -> dict:
+    """Parsed, normalized and rendered columns of one audit."""
+    path = repo.audit_path(audit_id)
+    data = load_yaml(path) if path else None
+    entry = {"stamp": file_stamp(path), "yaml_bytes": path.stat().st_size if path else 0,
+             "record": None, "prompt": None, "prompt_tokens": None, "prompt_stage": None,
+             "prompt_truncated": None}
+    if data is not None:
+        record = json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+        entry.update(record=record, **prompt_columns(record))
+    return entry
+
+
+def prompt_columns(record: str) -> dict:
+    """Prompt columns rendered from a stored record."""
+    rendered = render(json.loads(record))
+    return {"prompt": rendered.text, "prompt_tokens": rendered.tokens, "prompt_stage": rendered.stage,
+            "prompt_truncated": int(rendered.truncated)}
+
+
+def stale_ids(repo: AuditRepo, db: sqlite3.Connection | None) -> list[str]:
+    """Audits whose bundle entry is missing or outdated (all of them if the inventory or renderer changed)."""
+    if db is None:
+        return list(repo.inventory)
+    inventory = db.execute("SELECT value FROM meta WHERE key = 'inventory_stamp'").fetchone()
+    if not inventory or inventory[0] != file_stamp(repo.inventory_path):
+        return list(repo.inventory)
+    renderer = db.execute("SELECT value FROM meta WHERE key = 'prompt_version'").fetchone()
+    if not renderer or renderer[0] != RENDERER_VERSION:
+        return list(repo.inventory)
+    stamps = dict(db.execute("SELECT audit_id, stamp FROM audits"))
+    return [audit_id for audit_id in repo.inventory
+            if stamps.get(audit_id) != file_stamp(repo.audit_path(audit_id))]
+
+
+def build(root: Path, rebuild: bool = False) -> dict:
+    """Bring root's bundle up to date with its inventory and YAMLs."""
+    t0 = time.monotonic()
+    repo = AuditRepo(root, use_bundle=False)
+    target = repo.bundle_path
+    existing = None if rebuild else open_bundle(target)
+    if existing is not None:
+        existing.close()
+        db = sqlite3.connect(target)
+        path = target
+    else:
+        path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        path.unlink(missing_ok=True)
+        db = sqlite3.connect(path)
+        db.executescript(SCHEMA)
+
+    stamps = dict(db.execute("SELECT audit_id, stamp FROM audits"))
+    inventory = db.execute("SELECT value FROM meta WHERE key = 'inventory_stamp'").fetchone()
+    inventory_changed = not inventory or inventory[0] != file_stamp(repo.inventory_path)
+    renderer = db.execute("SELECT value FROM meta WHERE key = 'prompt_version'").fetchone()
+    renderer_changed = not renderer or renderer[0] != RENDERER_VERSION
+    parsed = reused = rerendered = 0
+    with db:
+        for ord_, (audit_id, row) in enumerate(repo.inventory.items()):
+            columns = {"ord": ord_, "file_path": row.get("file_path", ""),
+                       "row": json.dumps(row, ensure_ascii=False, separators=(",", ":")),
+                       **{name: row.get(name, "") for name in INDEXED}}
+            if stamps.get(audit_id) == file_stamp(repo.audit_path(audit_id)):
+                reused += 1
+                if renderer_changed:
+                    record = db.execute("SELECT record FROM audits WHERE audit_id = ?", (audit_id,)).fetchone()
+                    if record and record[0] is not None:
+                        columns.update(prompt_columns(record[0]))
+                        rerendered += 1
+                elif not inventory_changed:
+                    continue
+            else:
+                columns.update(compile_entry(repo, audit_id))
+                parsed += 1
+            names = list(columns)
+            db.execute(f"INSERT INTO audits (audit_id, {', '.join(names)}) VALUES (?{', ?' * len(names)}) "
+                       f"ON CONFLICT (audit_id) DO UPDATE SET {', '.join(f'{n} = excluded.{n}' for n in names)}",
+                       (audit_id, *columns.values()))
+        gone = [a for a in stamps if a not in repo.inventory]
+        db.executemany("DELETE FROM audits WHERE audit_id = ?", [(a,) for a in gone])
+        db.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [
+            ("version", str(BUNDLE_VERSION)),
+            ("built", datetime.now().astimezone().isoformat(timespec="seconds")),
+            ("inventory_stamp", file_stamp(repo.inventory_path)),
+            ("audits", str(len(repo.inventory))),
+            ("prompt_version", RENDERER_VERSION),
+        ])
+    db.close()
+    if path != target:
+        path.replace(target)
+    return {"path": str(target), "audits": len(repo.inventory), "parsed": parsed, "reused": reused,
+            "rerendered": rerendered, "removed": len(gone), "seconds": round(time.monotonic() - t0, 2)}
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine bundle",
+                                     description="Compile the audit corpus into AUDIT-BUNDLE.sqlite")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--rebuild", action="store_true", help="Recompile every audit")
+    parser.add_argument("--check", action="store_true", help="Only report missing or outdated entries")
+    args = parser.parse_args(argv)
+
+    root = Path(args.repo)
+    if not (root / "AUDIT-INVENTORY.csv").is_file():
+        json.dump({"error": f"No AUDIT-INVENTORY.csv in {root}"}, sys.stdout)
+        print()
+        return 1
+    if args.check:
+        repo = AuditRepo(root, use_bundle=False)
+        db = open_bundle(repo.bundle_path)
+        stale = stale_ids(repo, db)
+        json.dump({"path": str(repo.bundle_path), "audits": len(repo.inventory), "stale": len(stale)}, sys.stdout)
+        print()
+        return 1 if stale else 0
+
+    json.dump(build(root, args.rebuild), sys.stdout)
+    print()
+    return 0
@@ -0,0 +1,101 @@
+"""
+Cache keys for audit results.
+
+An audit's result can be reused while four things are unchanged:
+
+    definition    the audit YAML itself (content hash)
+    evidence      the project files its discovery patterns matched
+                  (content hashes), or for audits without evaluable
+                  patterns the whole project listing (paths and sizes)
+    context       extra prompt inputs: project-config.json, the project
+                  snapshot, the prompt format and budget, the renderer
+    upstream      the cache keys of the audits whose results the prompt
+                  carries (dependency ordering, see depgraph.py)
+
+The discovery pre-pass computes the key for every audit and records it in
+the manifest. Results live under $AUDIT_CACHE_DIR/results/<audit_id>/<key>.json;
+the result collector stores them (store_result), lib/audit.sh reads them
+and applies the TTL.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable
+
+# Bump to invalidate every cached result (e.g. when the result format changes)
+CACHE_VERSION = "1"
+
+_READ_CHUNK = 1024 * 1024
+
+
+def file_digest(path: Path | str) -> str:
+    """sha256 of a file's contents; empty string if unreadable."""
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_READ_CHUNK):
+                h.update(chunk)
+    except OSError:
+        return ""
+    return h.hexdigest()
+
+
+class Fingerprinter:
+    """Fingerprints sets of project files, hashing each file at most once per run."""
+
+    def __init__(self, project: Path):
+        self.project = project
+        self._digests: dict[str, str] = {}
+
+    def digest(self, rel_path: str) -> str:
+        digest = self._digests.get(rel_path)
+        if digest is None:
+            digest = self._digests[rel_path] = file_digest(self.project / rel_path)
+        return digest
+
+    def files(self, rel_paths: Iterable[str]) -> str:
+        """Fingerprint of the given files' paths and contents."""
+        h = hashlib.sha256()
+        for rel_path in sorted(rel_paths):
+            h.update(f"{rel_path}\0{self.digest(rel_path)}\n".encode())
+        return h.hexdigest()
+
+    def listing(self, rel_paths: Iterable[str]) -> str:
+        """Cheap fingerprint of a whole tree: every path and its size."""
+        h = hashlib.sha256()
+        for rel_path in sorted(rel_paths):
+            try:
+                size = os.stat(self.project / rel_path).st_size
+            except OSError:
+                size = -1
+            h.update(f"{rel_path}\0{size}\n".encode())
+        return h.hexdigest()
+
+
+def text_digest(text: str) -> str:
+    """sha256 of a string (a prompt setting rather than a file)."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def cache_key(definition_hash: str, fingerprint: str, context_hashes: Iterable[str] = ()) -> str:
+    """Result cache key from the audit definition, evidence and prompt context."""
+    h = hashlib.sha256(f"v{CACHE_VERSION}\n{definition_hash}\n{fingerprint}\n".encode())
+    for digest in context_hashes:
+        h.update(f"{digest}\n".encode())
+    return h.hexdigest()[:32]
+
+
+def store_result(cache_dir: Path, audit_id: str, key: str, result: dict) -> bool:
+    """Cache a completed result (pass/warn/fail only), replacing older keys for the audit."""
+    if not key or result.get("status") not in ("pass", "warn", "fail") or result.get("cached"):
+        return False
+    audit_dir = cache_dir / audit_id
+    audit_dir.mkdir(parents=True, exist_ok=True)
+    for old in audit_dir.glob("*.json"):
+        old.unlink(missing_ok=True)
+    tmp = audit_dir / f"{key}.json.tmp"
+    tmp.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(audit_dir / f"{key}.json")
+    return True
@@ -0,0 +1,198 @@
+"""
+Result collector for one audit phase.
+
+Runs beside the scheduler as a coprocess of lib/audit.sh. bash hands it an
+audit index the moment that audit completes. The collector extracts the
+result from the agent's raw output and validates it in-process (extract.py;
+no per-audit jq/grep/tail chains), stores it in the result cache, keeps the
+running summary, and rewrites the phase report as results arrive, so the
+report is complete the instant the last audit finishes.
+
+Protocol (one line each way):
+    stdin   INDEX            result of audit INDEX is ready
+            meta JSON        extra summary fields (scheduler stats, ...)
+            end              finalize the report and exit
+    stdout  INDEX US STATUS US CACHED US MESSAGE US RESULT_JSON
+            end US SUMMARY_JSON
+    (US = \x1f, the ASCII unit separator: unlike a tab, bash `read` keeps
+    empty fields between two of them)
+
+The report keeps the executors' format: phase, timestamp, summary,
+results (in recommendation order), recommendations, plus "complete",
+which is false while audits are still running. Rewrites are atomic and
+throttled to one per REWRITE_INTERVAL seconds.
+
+Usage:
+    python3 -m audit_engine collect --phase N --audits READY_JSON
+        --results-prefix PREFIX --report FILE [--recommendations JSON]
+        [--cache-dir DIR --discovery-dir DIR]
+        [--telemetry FILE [--agent-dir DIR] [--run-id ID]]
+
+Output of audit i (a result, or raw agent output) is read from PREFIX<i>.json.
+With --cache-dir, fresh pass/warn/fail results are cached under the key
+from the audit's discovery manifest. With --telemetry, one JSON line per
+audit is appended to FILE: outcome, parse strategy and, if an agent ran,
+the agent record lib/audit.sh left at DIR/<audit_id>.json (timing,
+provider, model, turns, prompt/response size). See telemetry.py.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from .cache import store_result
+from .extract import extract_file
+
+REWRITE_INTERVAL = 1.0            # seconds between incremental report writes
+FIELD_SEPARATOR = "\x1f"
+STATUS_COUNTERS = {"pass": "passed", "fail": "failed", "warn": "warnings", "skip": "skipped"}
+
+
+class Collector:
+    def __init__(self, phase: int, audits: list[dict], results_prefix: str, report: Path,
+                 recommendations: list | None = None, cache_dir: Path | None = None,
+                 discovery_dir: Path | None = None, telemetry: Path | None = None,
+                 agent_dir: Path | None = None, run_id: str = ""):
+        self.phase = phase
+        self.audits = audits
+        self.results_prefix = results_prefix
+        self.report = report
+        self.recommendations = recommendations if recommendations is not None else audits
+        self.cache_dir = cache_dir
+        self.discovery_dir = discovery_dir
+        self.telemetry = telemetry
+        self.agent_dir = agent_dir
+        self.run_id = run_id
+        self.results: dict[int, dict] = {}
+        self.meta: dict = {}
+        self.counts = dict.fromkeys(("passed", "failed", "warnings", "errors", "skipped", "cache_hits"), 0)
+        self._written = 0.0
+
+    def add(self, index: int) -> dict:
+        audit = self.audits[index]
+        audit_id, name = audit.get("audit_id", ""), audit.get("name", "")
+        result, problems, strategy = extract_file(Path(f"{self.results_prefix}{index}.json"), audit_id, name)
+        if self.cache_dir and self.discovery_dir:
+            store_result(self.cache_dir, audit_id, self._cache_key(audit_id), result)
+        if self.telemetry:
+            self._record(audit_id, result, problems, strategy)
+        previous = self.results.get(index)
+        if previous is not None:
+            self._count(previous, -1)
+        self.results[index] = result
+        self._count(result, 1)
+        return result
+
+    def _cache_key(self, audit_id: str) -> str:
+        try:
+            manifest = json.loads((self.discovery_dir / f"{audit_id}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return ""
+        return manifest.get("cache_key") or ""
+
+    def _record(self, audit_id: str, result: dict, problems: list[str], strategy: str):
+        record = {"ts": datetime.now().astimezone().isoformat(timespec="seconds"), "run": self.run_id,
+                  "phase": self.phase, "audit_id": audit_id, "outcome": result.get("status"),
+                  "cached": result.get("cached") is True, "parse": strategy, "problems": len(problems)}
+        if self.agent_dir:
+            try:
+                agent = json.loads((self.agent_dir / f"{audit_id}.json").read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                agent = None
+            if isinstance(agent, dict):
+                record.update(agent)
+        with open(self.telemetry, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _count(self, result: dict, delta: int):
+        self.counts[STATUS_COUNTERS.get(result.get("status"), "errors")] += delta
+        if result.get("cached") is True:
+            self.counts["cache_hits"] += delta
+
+    def summary(self) -> dict:
+        total = len(self.audits)
+        return {"total": total, **self.counts,
+                "cache_misses": total - self.counts["cache_hits"] - self.counts["skipped"],
+                **self.meta}
+
+    def write(self, complete: bool = False):
+        """Rewrite the report (throttled unless complete)."""
+        now = time.monotonic()
+        if not complete and now - self._written < REWRITE_INTERVAL:
+            return
+        self._written = now
+        report = {
+            "phase": self.phase,
+            "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "complete": complete,
+            "summary": self.summary(),
+            "results": [self.results[i] for i in sorted(self.results)],
+            "recommendations": self.recommendations,
+        }
+        tmp = self.report.with_name(f".{self.report.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        tmp.replace(self.report)
+
+    def finish(self):
+        # Audits that never signalled (timeout) still get a result from their file
+        for index in range(len(self.audits)):
+            if index not in self.results:
+                self.add(index)
+        self.write(complete=True)
+
+
+def _line(*fields: str) -> None:
+    sys.stdout.write(FIELD_SEPARATOR.join(fields) + "\n")
+    sys.stdout.flush()
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine collect",
+                                     description="Collect audit results into the phase report")
+    parser.add_argument("--phase", type=int, required=True)
+    parser.add_argument("--audits", required=True, help="Ready audits JSON array (index order)")
+    parser.add_argument("--results-prefix", required=True, help="Result of audit i is PREFIX<i>.json")
+    parser.add_argument("--report", required=True, help="Phase report to (re)write")
+    parser.add_argument("--recommendations", help="Recommendations JSON array for the report")
+    parser.add_argument("--cache-dir", help="Result cache root (store fresh results)")
+    parser.add_argument("--discovery-dir", help="Discovery manifests (result cache keys)")
+    parser.add_argument("--telemetry", help="Append one telemetry JSON line per audit")
+    parser.add_argument("--agent-dir", help="Agent records (<audit_id>.json) written by the runner")
+    parser.add_argument("--run-id", default="", help="Run identifier for telemetry records")
+    args = parser.parse_args(argv)
+
+    audits = json.loads(Path(args.audits).read_text(encoding="utf-8"))
+    recommendations = (json.loads(Path(args.recommendations).read_text(encoding="utf-8"))
+                       if args.recommendations else None)
+    collector = Collector(args.phase, audits, args.results_prefix, Path(args.report), recommendations,
+                          Path(args.cache_dir) if args.cache_dir else None,
+                          Path(args.discovery_dir) if args.discovery_dir else None,
+                          Path(args.telemetry) if args.telemetry else None,
+                          Path(args.agent_dir) if args.agent_dir else None, args.run_id)
+
+    for line in sys.stdin:
+        command = line.strip()
+        if command == "end":
+            break
+        if command.startswith("meta "):
+            try:
+                collector.meta.update(json.loads(command[5:]))
+            except ValueError:
+                pass
+            continue
+        if not command.isdigit() or int(command) >= len(audits):
+            continue
+        index = int(command)
+        result = collector.add(index)
+        message = " ".join(str(result.get("message") or "").split())
+        _line(str(index), str(result.get("status")), "true" if result.get("cached") is True else "false",
+              message, json.dumps(result, separators=(",", ":")))
+        collector.write()
+
+    collector.finish()
+    _line("end", json.dumps(collector.summary(), separators=(",", ":")))
+    return 0
@@ -0,0 +1,182 @@
+"""
+Access to the audits repository: inventory rows and audit definitions.
+
+The audits repo layout is:
+    AUDIT-INVENTORY.csv                  one row per audit (audit_id, file_path, ...)
+    AUDIT-PATHS.tsv                      audit_id -> file_path (generated with the CSV)
+    AUDIT-BUNDLE.sqlite                  compiled corpus (optional, see bundle.py)
+    audits/{NN-category}/{sub}/{slug}.yaml
+
+When the bundle is present, inventory rows and parsed definitions are read
+from it instead of the CSV and YAML. Every entry carries the mtime:size
+stamp of its source file and is used only while that stamp still matches,
+so an outdated bundle never serves stale definitions.
+
+An audit ID listed more than once resolves to its first inventory row, and
+its YAML to the AUDIT-PATHS.tsv entry, the same file lib/audit.sh
+(_audit_load_paths) runs.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml is ~10x faster; fall back to the pure-Python loader when absent
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+INVENTORY_NAME = "AUDIT-INVENTORY.csv"
+PATHS_NAME = "AUDIT-PATHS.tsv"
+BUNDLE_NAME = "AUDIT-BUNDLE.sqlite"
+BUNDLE_VERSION = 2                # 2: first inventory row wins for duplicate IDs
+
+
+def file_stamp(path: Path | None) -> str:
+    """mtime:size of a file, "" if it does not exist."""
+    try:
+        st = os.stat(path) if path else None
+    except OSError:
+        return ""
+    return f"{st.st_mtime_ns}:{st.st_size}" if st else ""
+
+
+def open_bundle(path: Path) -> sqlite3.Connection | None:
+    """Read-only connection to a compiled bundle of the current version, else None."""
+    if not path.is_file():
+        return None
+    try:
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    except sqlite3.Error:
+        return None
+    if not row or row[0] != str(BUNDLE_VERSION):
+        db.close()
+        return None
+    return db
+
+
+def load_yaml(path: Path) -> dict[str, Any] | None:
+    """Parse one audit YAML file; None if unreadable or not a mapping."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=YAML_LOADER)
+    except (OSError, yaml.YAMLError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class AuditRepo:
+    """Read-only view of an audits repository checkout."""
+
+    def __init__(self, root: Path | str, use_bundle: bool = True):
+        self.root = Path(root)
+        self.use_bundle = use_bundle
+        self._inventory: dict[str, dict[str, str]] | None = None
+        self._paths: dict[str, str] | None = None
+        self._bundle: sqlite3.Connection | None | bool = None if use_bundle else False
+
+    @property
+    def inventory_path(self) -> Path:
+        return self.root / INVENTORY_NAME
+
+    @property
+    def bundle_path(self) -> Path:
+        return self.root / BUNDLE_NAME
+
+    @property
+    def bundle(self) -> sqlite3.Connection | None:
+        """Connection to the compiled bundle, None if absent or disabled (opened once)."""
+        if self._bundle is None:
+            self._bundle = open_bundle(self.bundle_path) or False
+        return self._bundle or None
+
+    @property
+    def paths(self) -> dict[str, str]:
+        """audit_id -> YAML path relative to root from AUDIT-PATHS.tsv, {} without one."""
+        if self._paths is None:
+            self._paths = {}
+            try:
+                with open(self.root / PATHS_NAME, "r", encoding="utf-8") as f:
+                    for line in f:
+                        audit_id, _, file_path = line.rstrip("\n").partition("\t")
+                        if audit_id and not audit_id.startswith("#") and file_path:
+                            self._paths.setdefault(audit_id, file_path)
+            except OSError:
+                pass
+        return self._paths
+
+    @property
+    def inventory(self) -> dict[str, dict[str, str]]:
+        """Inventory rows keyed by audit_id, in file order; the first of duplicates wins (loaded once)."""
+        if self._inventory is None:
+            self._inventory = self._bundled_inventory()
+        if self._inventory is None:
+            self._inventory = {}
+            if self.inventory_path.exists():
+                with open(self.inventory_path, "r", newline="", encoding="utf-8") as f:
+                    for row in csv.DictReader(f):
+                        if row.get("audit_id"):
+                            self._inventory.setdefault(row["audit_id"], row)
+        return self._inventory
+
+    def audit_path(self, audit_id: str) -> Path | None:
+        """Path of the YAML defining audit_id, or None if unknown."""
+        rel = self.paths.get(audit_id)
+        if rel is None:
+            row = self.inventory.get(audit_id)
+            rel = row.get("file_path") if row else None
+        if not rel:
+            return None
+        path = self.root / rel
+        return path if path.is_file() else None
+
+    def _bundled_inventory(self) -> dict[str, dict[str, str]] | None:
+        db = self.bundle
+        if db is None:
+            return None
+        stamp = db.execute("SELECT value FROM meta WHERE key = 'inventory_stamp'").fetchone()
+        if not stamp or stamp[0] != file_stamp(self.inventory_path):
+            return None
+        return {audit_id: json.loads(row)
+                for audit_id, row in db.execute("SELECT audit_id, row FROM audits ORDER BY ord")}
+
+    def compiled(self, audit_id: str) -> dict[str, Any] | None:
+        """Bundle entry of audit_id if it is still current: {record, prompt, prompt_tokens,
+        prompt_stage, prompt_truncated, prompt_version, yaml_bytes}; None otherwise.
+
+        prompt_version is the RENDERER_VERSION (prompt.py) the prompt was rendered by."""
+        db = self.bundle
+        if db is None:
+            return None
+        entry = db.execute("SELECT stamp, record, prompt, prompt_tokens, prompt_stage, prompt_truncated, "
+                           "yaml_bytes FROM audits WHERE audit_id = ?", (audit_id,)).fetchone()
+        if not entry or entry[1] is None or entry[0] != file_stamp(self.audit_path(audit_id)):
+            return None
+        version = db.execute("SELECT value FROM meta WHERE key = 'prompt_version'").fetchone()
+        return {"record": json.loads(entry[1]), "prompt": entry[2], "prompt_tokens": entry[3],
+                "prompt_stage": entry[4], "prompt_truncated": bool(entry[5]),
+                "prompt_version": version[0] if version else None, "yaml_bytes": entry[6]}
+
+    def load_audit(self, audit_id: str) -> dict[str, Any] | None:
+        entry = self.compiled(audit_id)
+        if entry is not None:
+            return entry["record"]
+        path = self.audit_path(audit_id)
+        return load_yaml(path) if path else None
+
+
+def read_ids(ids: list[str], ids_file: str | None) -> list[str]:
+    """Merge audit IDs from argv and an optional newline-separated file (- = stdin)."""
+    merged = list(ids)
+    if ids_file:
+        if ids_file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = Path(ids_file).read_text(encoding="utf-8").splitlines()
+        merged.extend(line.strip() for line in lines)
+    return [i for i in dict.fromkeys(merged) if i]
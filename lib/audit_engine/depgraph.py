@@ -0,0 +1,336 @@
+"""
+Audit dependency graph.
+
+Audits declare how they relate in their YAML:
+
+    relationships:
+      depends_on:        audits whose results this audit builds on
+      feeds_into:        audits that build on this audit's results
+      commonly_combined: related, no ordering (see batching.py)
+
+Both ordered kinds become edges UPSTREAM -> DOWNSTREAM over the whole
+corpus. References are resolved against the inventory: an exact audit ID,
+else a unique trailing match (subcategory.slug) or category.slug. Anything
+else is dangling; most dangling references name audits that do not exist
+(yet). Cycles are found with Tarjan's algorithm; audits on a common cycle
+are treated as independent of each other.
+
+For one run the graph is restricted to the audits being run. Ordering
+through audits outside the run is kept: A -> X -> B still orders A before
+B when X is not run. Wave 0 holds audits with no upstream in the run,
+wave k those whose upstream finishes by wave k-1. Recommendations marked
+needs-deps are admitted to the run when at least one of their upstream
+audits is run as well (the dependency is satisfied within the run);
+the others are held back as before.
+
+Relationship sections are cached per audit at --cache, keyed by YAML
+mtime and size, so only edited audits are re-parsed.
+
+Usage:
+    python3 -m audit_engine graph --repo AUDITS_REPO [--cache FILE]
+        [--recommendations JSON|-] [--check]
+
+Without --recommendations prints the corpus report {audits, edges,
+cycles, dangling}. With it, also {audits_to_run, held, upstream, after,
+waves} for the run, where after[i] lists the positions in audits_to_run
+of audit i's upstream audits. --check prints cycles and dangling
+references to stderr and exits 1 if there is a cycle.
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Iterable
+
+from .corpus import AuditRepo
+
+GRAPH_VERSION = 1
+EDGE_KINDS = ("depends_on", "feeds_into")
+
+
+def relationship_refs(data: dict[str, Any] | None) -> dict[str, list[str]]:
+    """Ordered relationship references of one audit YAML, by kind."""
+    relationships = (data or {}).get("relationships")
+    if not isinstance(relationships, dict):
+        return {}
+    refs = {}
+    for kind in EDGE_KINDS:
+        values = relationships.get(kind)
+        if isinstance(values, str):
+            values = [values]
+        if isinstance(values, list):
+            cleaned = [v.strip() for v in values if isinstance(v, str) and v.strip()]
+            if cleaned:
+                refs[kind] = cleaned
+    return refs
+
+
+class RelationshipIndex:
+    """Per-audit relationship references, cached on disk by YAML mtime/size."""
+
+    def __init__(self, repo: AuditRepo, cache_path: Path | None = None):
+        self.repo = repo
+        self.cache_path = cache_path
+        self.entries: dict[str, dict] = {}
+        self.reindexed = 0
+        if cache_path and cache_path.is_file():
+            try:
+                cached = json.loads(cache_path.read_text(encoding="utf-8"))
+                if cached.get("version") == GRAPH_VERSION:
+                    self.entries = cached.get("audits") or {}
+            except (OSError, ValueError):
+                pass
+
+    def get(self, audit_id: str) -> dict[str, list[str]]:
+        path = self.repo.audit_path(audit_id)
+        try:
+            st = path.stat() if path else None
+        except OSError:
+            st = None
+        stamp = f"{st.st_mtime_ns}:{st.st_size}" if st else ""
+        entry = self.entries.get(audit_id)
+        if entry is None or entry.get("stamp") != stamp:
+            entry = {"stamp": stamp, "refs": relationship_refs(self.repo.load_audit(audit_id))}
+            self.entries[audit_id] = entry
+            self.reindexed += 1
+        return entry["refs"]
+
+    def save(self):
+        if not self.cache_path or not self.reindexed:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_name(f".{self.cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": GRAPH_VERSION, "audits": self.entries}), encoding="utf-8")
+        tmp.replace(self.cache_path)
+
+
+class DependencyGraph:
+    """Upstream/downstream edges between audits of one corpus."""
+
+    def __init__(self, audit_ids: Iterable[str]):
+        self.ids = list(dict.fromkeys(audit_ids))
+        self.upstream: dict[str, set[str]] = {i: set() for i in self.ids}
+        self.downstream: dict[str, set[str]] = {i: set() for i in self.ids}
+        self.dangling: list[dict[str, str]] = []
+        self._aliases = self._alias_table()
+        self._components: dict[str, int] | None = None
+
+    def _alias_table(self) -> dict[str, str | None]:
+        """Short forms (subcategory.slug, category.slug) -> audit ID, None if ambiguous."""
+        aliases: dict[str, str | None] = {}
+        for audit_id in self.ids:
+            parts = audit_id.split(".")
+            if len(parts) < 3:
+                continue
+            for alias in {".".join(parts[1:]), f"{parts[0]}.{parts[-1]}"}:
+                aliases[alias] = None if alias in aliases and aliases[alias] != audit_id else audit_id
+        return aliases
+
+    def resolve(self, ref: str) -> str | None:
+        if ref in self.upstream:
+            return ref
+        return self._aliases.get(ref)
+
+    def add_refs(self, audit_id: str, refs: dict[str, list[str]]):
+        for kind, values in refs.items():
+            for ref in values:
+                target = self.resolve(ref)
+                if target is None:
+                    self.dangling.append({"audit_id": audit_id, "kind": kind, "ref": ref})
+                elif target != audit_id:
+                    up, down = (target, audit_id) if kind == "depends_on" else (audit_id, target)
+                    self.upstream[down].add(up)
+                    self.downstream[up].add(down)
+        self._components = None
+
+    @classmethod
+    def from_repo(cls, repo: AuditRepo, cache_path: Path | None = None) -> "DependencyGraph":
+        graph = cls(repo.inventory)
+        index = RelationshipIndex(repo, cache_path)
+        for audit_id in graph.ids:
+            graph.add_refs(audit_id, index.get(audit_id))
+        index.save()
+        return graph
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(ups) for ups in self.upstream.values())
+
+    def components(self) -> dict[str, int]:
+        """Strongly connected component of every audit (iterative Tarjan)."""
+        if self._components is not None:
+            return self._components
+        order: dict[str, int] = {}
+        low: dict[str, int] = {}
+        on_stack: set[str] = set()
+        stack: list[str] = []
+        component: dict[str, int] = {}
+        count = 0
+        for root in self.ids:
+            if root in order:
+                continue
+            work = [(root, iter(sorted(self.downstream[root])))]
+            order[root] = low[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in order:
+                        order[child] = low[child] = len(order)
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.downstream[child]))))
+                    elif child in on_stack:
+                        low[node] = min(low[node], order[child])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = count
+                        if member == node:
+                            break
+                    count += 1
+        self._components = component
+        return component
+
+    def cycles(self) -> list[list[str]]:
+        """Audits that (transitively) depend on each other, one list per cycle."""
+        groups: dict[int, list[str]] = {}
+        for audit_id, number in self.components().items():
+            groups.setdefault(number, []).append(audit_id)
+        return sorted(sorted(g) for g in groups.values() if len(g) > 1)
+
+    def upstream_in(self, audit_id: str, members: set[str]) -> set[str]:
+        """Upstream audits of audit_id among members, following paths through non-members.
+
+        Audits on a common cycle do not constrain each other, but what is
+        upstream of one of them is upstream of all of them:
+
+        >>> g = DependencyGraph(["a", "c", "x"])
+        >>> g.add_refs("a", {"depends_on": ["c"]})
+        >>> g.add_refs("c", {"depends_on": ["a", "x"]})
+        >>> sorted(g.upstream_in("a", {"a", "c", "x"}))
+        ['x']
+        """
+        component = self.components()
+        found: set[str] = set()
+        seen = {audit_id}
+        frontier = list(self.upstream.get(audit_id, ()))
+        while frontier:
+            node = frontier.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if component[node] == component[audit_id]:
+                frontier.extend(self.upstream[node])
+            elif node in members:
+                found.add(node)
+            else:
+                frontier.extend(self.upstream[node])
+        return found
+
+    def restrict(self, selected: Iterable[str]) -> dict[str, list[str]]:
+        """Upstream audits of each selected audit among the selected ones (always acyclic)."""
+        chosen = list(dict.fromkeys(s for s in selected if s in self.upstream))
+        members = set(chosen)
+        result = {}
+        for audit_id in chosen:
+            found = self.upstream_in(audit_id, members)
+            result[audit_id] = [a for a in chosen if a in found]
+        return result
+
+
+def waves(upstream: dict[str, list[str]]) -> list[list[str]]:
+    """Execution waves of an acyclic upstream map, each in input order."""
+    level: dict[str, int] = {}
+
+    def depth(audit_id: str) -> int:
+        if audit_id not in level:
+            stack = [audit_id]
+            while stack:
+                node = stack[-1]
+                pending = [u for u in upstream.get(node, ()) if u not in level]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                level[node] = 1 + max((level[u] for u in upstream.get(node, ())), default=-1)
+        return level[audit_id]
+
+    result: list[list[str]] = []
+    for audit_id in upstream:
+        k = depth(audit_id)
+        while len(result) <= k:
+            result.append([])
+        result[k].append(audit_id)
+    return result
+
+
+def plan_run(graph: DependencyGraph, recommendations: list[dict]) -> dict:
+    """Audits to run (ready + admitted needs-deps) with their upstream audits and waves."""
+    ready = {r.get("audit_id") for r in recommendations if r.get("dependency_status") == "ready"}
+    candidates = [r.get("audit_id") for r in recommendations if r.get("dependency_status") == "needs-deps"]
+    admitted = set(ready)
+    # A candidate may depend on another admitted candidate: admit until nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for audit_id in candidates:
+            if audit_id not in admitted and audit_id in graph.upstream and graph.upstream_in(audit_id, admitted):
+                admitted.add(audit_id)
+                changed = True
+
+    run = [r for r in recommendations if r.get("audit_id") in admitted
+           and r.get("dependency_status") in ("ready", "needs-deps")]
+    ids = [r["audit_id"] for r in run]
+    upstream = graph.restrict(ids)
+    position = {audit_id: i for i, audit_id in enumerate(ids)}
+    members = set(ids)
+    return {
+        "audits_to_run": run,
+        "held": [a for a in candidates if a not in admitted],
+        "upstream": {a: ups for a, ups in upstream.items() if ups},
+        "after": [[position[u] for u in upstream.get(a, [])] for a in ids],
+        "waves": waves({a: upstream.get(a, []) for a in ids}),
+        "dependencies": sum(len(ups) for ups in upstream.values()),
+        "dangling": [d for d in graph.dangling if d["audit_id"] in members],
+    }
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine graph",
+                                     description="Audit dependency graph and execution waves")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--cache", help="Relationship cache file (re-parse only changed YAML)")
+    parser.add_argument("--recommendations", help="Recommendations JSON (object or array; - for stdin)")
+    parser.add_argument("--check", action="store_true", help="List cycles and dangling references; exit 1 on a cycle")
+    args = parser.parse_args(argv)
+
+    graph = DependencyGraph.from_repo(AuditRepo(args.repo), Path(args.cache) if args.cache else None)
+    cycles = graph.cycles()
+    report: dict[str, Any] = {"audits": len(graph.ids), "edges": graph.edge_count, "cycles": cycles,
+                              "dangling": graph.dangling}
+    if args.recommendations:
+        text = sys.stdin.read() if args.recommendations == "-" else Path(args.recommendations).read_text(encoding="utf-8")
+        recommendations = json.loads(text)
+        if isinstance(recommendations, dict):
+            recommendations = recommendations.get("recommendations") or []
+        report.update(plan_run(graph, recommendations))
+
+    if args.check:
+        for cycle in cycles:
+            print(f"cycle: {' -> '.join(cycle)}", file=sys.stderr)
+        for d in report["dangling"]:
+            print(f"dangling: {d['audit_id']} {d['kind']} {d['ref']}", file=sys.stderr)
+    json.dump(report, sys.stdout, indent=2)
+    print()
+    return 1 if args.check and cycles else 0
@@ -0,0 +1,291 @@
+"""
+Deterministic discovery pre-pass for audits.
+
+Evaluates every selected audit's discovery.file_patterns (globs) and
+discovery.code_patterns (regex/keyword) against the project in ONE shared
+walk of the tree (globs via globset, code patterns via scanner), and writes
+a match manifest per audit. The runner uses the verdicts to skip, or run
+cheaply, audits whose patterns find nothing.
+
+Usage:
+    python3 -m audit_engine discover --repo AUDITS_REPO --project DIR \\
+        --out MANIFEST_DIR [--jobs N] [--context FILE ...] [--setting TEXT ...]
+        [--plan PLAN_JSON] [--ids-file FILE] [AUDIT_ID ...]
+
+Writes MANIFEST_DIR/<audit_id>.json (full manifest) and <audit_id>.md
+(compact summary for prompts), and prints a JSON summary to stdout:
+    {"files_scanned": N, "elapsed_ms": N,
+     "audits": {"<id>": {"verdict": "evidence|none|n/a", "files": N, "hits": N,
+                         "cache_key": "..."}}}
+
+Each manifest also carries the audit's result cache key (see cache.py).
+With --plan (audit_engine graph --recommendations), each audit's key also
+covers the keys of its upstream audits, wave by wave.
+
+Verdicts:
+    evidence  at least one pattern matched
+    none      patterns were evaluated and nothing matched
+    n/a       the audit has no mechanically evaluable patterns (interviews,
+              ast-only, ...) — always run it
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .cache import Fingerprinter, cache_key, file_digest, text_digest
+from .corpus import AuditRepo, read_ids
+from .globset import GlobSet
+from .prompt import RENDERER_VERSION
+from .scanner import PatternSpec, code_pattern_specs, scan, walk_project
+
+MAX_LISTED_FILES = 50             # per manifest
+MAX_SNIPPETS = 5                  # per code pattern
+
+
+@dataclass
+class FilePattern:
+    glob: str
+    valid: bool = True
+    files: list[str] = field(default_factory=list)
+    count: int = 0
+
+
+@dataclass
+class CodePattern:
+    spec: PatternSpec
+    evaluated: bool
+    hits: int = 0
+    files: int = 0
+    snippets: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class AuditPatterns:
+    """Compiled discovery patterns of one audit plus the evidence found so far."""
+    audit_id: str
+    file_patterns: list[FilePattern] = field(default_factory=list)
+    code_patterns: list[CodePattern] = field(default_factory=list)
+    unevaluated: int = 0
+    matched_files: set[str] = field(default_factory=set)
+    definition_hash: str = ""
+    cache_key: str = ""
+
+    @property
+    def evaluable(self) -> int:
+        return (sum(1 for p in self.file_patterns if p.valid)
+                + sum(1 for p in self.code_patterns if p.evaluated))
+
+    @property
+    def hit_count(self) -> int:
+        return sum(p.count for p in self.file_patterns) + sum(p.hits for p in self.code_patterns)
+
+    @property
+    def verdict(self) -> str:
+        if not self.evaluable:
+            return "n/a"
+        return "evidence" if self.hit_count else "none"
+
+
+def compile_audit(audit_id: str, data: dict) -> AuditPatterns:
+    """Compile the discovery section of a parsed audit YAML."""
+    compiled = AuditPatterns(audit_id)
+    discovery = data.get("discovery") or {}
+    if not isinstance(discovery, dict):
+        return compiled
+
+    for entry in discovery.get("file_patterns") or []:
+        glob = entry.get("glob") if isinstance(entry, dict) else entry
+        if not isinstance(glob, str) or not glob.strip():
+            continue
+        compiled.file_patterns.append(FilePattern(glob))
+
+    for spec in code_pattern_specs(audit_id, data):
+        evaluated = spec.compile() is not None
+        if not evaluated:
+            compiled.unevaluated += 1
+        compiled.code_patterns.append(CodePattern(spec, evaluated))
+
+    return compiled
+
+
+def build_globset(audits: list[AuditPatterns]) -> GlobSet:
+    """One matcher for every audit's file patterns, keyed (audit index, pattern index)."""
+    globs = GlobSet()
+    for a_idx, audit in enumerate(audits):
+        for p_idx, fp in enumerate(audit.file_patterns):
+            fp.valid = globs.add(fp.glob, (a_idx, p_idx))
+            if not fp.valid:
+                audit.unevaluated += 1
+    return globs.compile()
+
+
+def discover(project: Path, audits: list[AuditPatterns], jobs: int | None = None) -> list[str]:
+    """Evaluate every audit's patterns with one walk of the project. Returns the files seen."""
+    globs = build_globset(audits)
+    paths = []
+
+    for rel_path in walk_project(project):
+        paths.append(rel_path)
+        for a_idx, p_idx in globs.match(rel_path):
+            audit = audits[a_idx]
+            fp = audit.file_patterns[p_idx]
+            fp.count += 1
+            audit.matched_files.add(rel_path)
+            if len(fp.files) < MAX_LISTED_FILES:
+                fp.files.append(rel_path)
+
+    by_id = {audit.audit_id: audit for audit in audits}
+    by_key = {(cp.spec.audit_id, cp.spec.pattern_id): cp
+              for audit in audits for cp in audit.code_patterns if cp.evaluated}
+    specs = [cp.spec for cp in by_key.values()]
+    # Workers finish out of order; sort so manifests keep the earliest snippets
+    records = sorted(scan(project, paths, specs, jobs),
+                     key=lambda r: (r["file"], r["audit_id"], r["pattern_id"]))
+    for record in records:
+        audit = by_id[record["audit_id"]]
+        cp = by_key[record["audit_id"], record["pattern_id"]]
+        cp.hits += record["hits"]
+        cp.files += 1
+        audit.matched_files.add(record["file"])
+        for match in record["matches"]:
+            if len(cp.snippets) >= MAX_SNIPPETS:
+                break
+            cp.snippets.append({"file": record["file"], **match})
+
+    return paths
+
+
+def assign_cache_keys(project: Path, audits: list[AuditPatterns], paths: list[str],
+                      context_hashes: list[str], plan: dict | None = None):
+    """Key each audit's result on its definition, matched files, prompt context and upstream audits."""
+    fingerprinter = Fingerprinter(project)
+    listing = None
+    fingerprints = {}
+    for audit in audits:
+        if audit.verdict == "n/a":
+            # Nothing to narrow the evidence down: any change to the tree invalidates
+            if listing is None:
+                listing = fingerprinter.listing(paths)
+            fingerprint = listing
+        else:
+            fingerprint = fingerprinter.files(audit.matched_files)
+        fingerprints[audit.audit_id] = fingerprint
+        audit.cache_key = cache_key(audit.definition_hash, fingerprint, context_hashes)
+
+    if not plan:
+        return
+    # Upstream results go into the prompt: a downstream key changes with theirs.
+    # Waves run upstream first, so their keys are final when folded in.
+    by_id = {audit.audit_id: audit for audit in audits}
+    upstream = plan.get("upstream") or {}
+    for wave in plan.get("waves") or []:
+        for audit_id in wave:
+            audit = by_id.get(audit_id)
+            ups = [by_id[u].cache_key for u in upstream.get(audit_id, []) if u in by_id]
+            if audit is not None and ups:
+                audit.cache_key = cache_key(audit.definition_hash, fingerprints[audit_id],
+                                            [*context_hashes, *ups])
+
+
+def manifest(audit: AuditPatterns) -> dict:
+    return {
+        "audit_id": audit.audit_id,
+        "verdict": audit.verdict,
+        "hit_count": audit.hit_count,
+        "unevaluated_patterns": audit.unevaluated,
+        "cache_key": audit.cache_key,
+        "files": sorted(audit.matched_files)[:MAX_LISTED_FILES],
+        "file_count": len(audit.matched_files),
+        "file_patterns": [
+            {"glob": p.glob, "matches": p.count, "files": p.files}
+            for p in audit.file_patterns
+        ],
+        "code_patterns": [
+            {"pattern": p.spec.pattern, "type": p.spec.type, "scope": p.spec.scope,
+             "evaluated": p.evaluated, "hits": p.hits, "files": p.files,
+             "snippets": p.snippets}
+            for p in audit.code_patterns
+        ],
+    }
+
+
+def render_markdown(m: dict) -> str:
+    """Compact evidence summary suitable for pasting into an agent prompt."""
+    lines = [f"Verdict: {m['verdict']} — {m['hit_count']} hit(s) across {m['file_count']} file(s)"]
+    for p in m["file_patterns"]:
+        if p["matches"]:
+            shown = ", ".join(p["files"][:5])
+            more = f" (+{p['matches'] - 5} more)" if p["matches"] > 5 else ""
+            lines.append(f"- glob `{p['glob']}`: {shown}{more}")
+    for p in m["code_patterns"]:
+        if p["hits"]:
+            lines.append(f"- {p['type']} `{p['pattern']}`: {p['hits']} hit(s) in {p['files']} file(s)")
+            for s in p["snippets"][:3]:
+                lines.append(f"    {s['file']}:{s['line']}: {s['text']}")
+    if m["verdict"] == "none":
+        lines.append("- No file or code pattern matched anywhere in the project.")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine discover",
+                                     description="Deterministic discovery pre-pass for audits")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--project", default=".", help="Project root to scan (default: cwd)")
+    parser.add_argument("--out", required=True, help="Directory for per-audit manifests")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="Code scan worker processes (default: CPU count)")
+    parser.add_argument("--context", action="append", default=[], metavar="FILE",
+                        help="Prompt input folded into cache keys (repeatable)")
+    parser.add_argument("--setting", action="append", default=[], metavar="TEXT",
+                        help="Prompt setting folded into cache keys, e.g. format and budget (repeatable)")
+    parser.add_argument("--plan", help="Dependency run plan: fold upstream audits' keys into cache keys")
+    parser.add_argument("--ids-file", help="Newline-separated audit IDs (- for stdin)")
+    parser.add_argument("ids", nargs="*", help="Audit IDs")
+    args = parser.parse_args(argv)
+
+    t0 = time.monotonic()
+    repo = AuditRepo(args.repo)
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    audits = []
+    missing = []
+    for audit_id in read_ids(args.ids, args.ids_file):
+        path = repo.audit_path(audit_id)
+        data = repo.load_audit(audit_id)
+        if data is None or path is None:
+            missing.append(audit_id)
+            continue
+        audit = compile_audit(audit_id, data)
+        audit.definition_hash = file_digest(path)
+        audits.append(audit)
+
+    project = Path(args.project)
+    paths = discover(project, audits, args.jobs or None)
+    context_hashes = [file_digest(f) for f in args.context]
+    context_hashes += [text_digest(s) for s in [*args.setting, f"renderer {RENDERER_VERSION}"]]
+    plan = json.loads(Path(args.plan).read_text(encoding="utf-8")) if args.plan else None
+    assign_cache_keys(project, audits, paths, context_hashes, plan)
+
+    summary = {}
+    for audit in audits:
+        m = manifest(audit)
+        (out_dir / f"{audit.audit_id}.json").write_text(json.dumps(m, indent=2), encoding="utf-8")
+        (out_dir / f"{audit.audit_id}.md").write_text(render_markdown(m), encoding="utf-8")
+        summary[audit.audit_id] = {"verdict": m["verdict"], "files": m["file_count"],
+                                   "hits": m["hit_count"], "cache_key": audit.cache_key}
+
+    json.dump({
+        "project": str(project.resolve()),
+        "files_scanned": len(paths),
+        "elapsed_ms": int((time.monotonic() - t0) * 1000),
+        "missing": missing,
+        "audits": summary,
+    }, sys.stdout, indent=2)
+    print()
+    return 0
@@ -0,0 +1,204 @@
+"""
+Result extraction from audit agent output.
+
+Agents are asked for a bare JSON object but often wrap it in a markdown
+fence, precede it with narration, or print intermediate objects before the
+final one. The output is scanned once: every '{' is a candidate offset for
+an incremental decode (json raw_decode), a successful decode skips past
+the whole object, and the last object carrying "audit_id" wins. Objects
+with the prompt template's placeholder ID ("the.audit.id"), which agents
+sometimes echo after their real result, are used only when there is no
+other candidate. Batch output ({"results": [...]}, see batching.py) is
+split by audit_id.
+
+The result is then checked against the result schema the prompts ask for
+(status, severity, message, findings) and normalized; anything unusable
+becomes an error result with the reason. How the result was found is
+reported as the parse strategy (telemetry): json (the output is the
+object), embedded (found in surrounding text), batch (picked from a batch
+result), none (no output or nothing usable).
+
+Usage:
+    python3 -m audit_engine extract --audits READY_JSON --results-prefix PREFIX [--write]
+    python3 -m audit_engine extract --audit-id ID [--name NAME] FILE
+
+The first form processes every result file of a phase (PREFIX<i>.json for
+audit i of READY_JSON) in one run and prints one JSON line per audit
+({audit_id, status, parse, problems, result});
+--write replaces each file with its normalized result.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterator
+
+STATUSES = ("pass", "warn", "fail", "skip", "error")
+SEVERITIES = ("critical", "high", "medium", "low")
+_STATUS_ALIASES = {"passed": "pass", "ok": "pass", "warning": "warn", "failed": "fail",
+                   "failure": "fail", "skipped": "skip"}
+_PLACEHOLDER_IDS = ("", "the.audit.id")
+
+_decoder = json.JSONDecoder()
+
+
+def error_result(audit_id: str, name: str, message: str) -> dict:
+    """Same shape as _audit_error_json in lib/audit.sh."""
+    return {"audit_id": audit_id, "name": name, "status": "error", "severity": "low",
+            "message": message, "findings": []}
+
+
+def iter_objects(text: str) -> Iterator[dict]:
+    """Top-level JSON objects embedded anywhere in text, in order."""
+    pos = text.find("{")
+    while pos != -1:
+        try:
+            obj, end = _decoder.raw_decode(text, pos)
+        except ValueError:
+            pos = text.find("{", pos + 1)
+            continue
+        if isinstance(obj, dict):
+            yield obj
+        pos = text.find("{", end)
+
+
+def _is_result(obj: dict) -> bool:
+    return "audit_id" in obj or isinstance(obj.get("results"), list)
+
+
+def find_result(text: str, audit_id: str) -> tuple[dict | None, str, str]:
+    """The audit's result object in agent output (or None and the reason), and the parse strategy."""
+    found, strategy = None, "embedded"
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        # Clean output: one decode, no scan
+        try:
+            whole = json.loads(stripped)
+        except ValueError:
+            whole = None
+        if isinstance(whole, dict) and _is_result(whole):
+            found, strategy = whole, "json"
+    if found is None:
+        placeholder = None
+        for obj in iter_objects(text):
+            if not _is_result(obj):
+                continue
+            if "audit_id" in obj and obj["audit_id"] in _PLACEHOLDER_IDS:
+                placeholder = obj
+            else:
+                found = obj
+        found = found or placeholder
+    if found is None:
+        first = stripped.split("\n", 1)[0].strip()
+        if "Reached max turns" in first:
+            return None, "Audit agent exceeded turn limit (try AUDIT_MAX_TURNS=40)", "none"
+        if first.lower().startswith("error"):
+            return None, first[:100], "none"
+        return None, "Could not parse audit agent output", "none"
+    if "audit_id" in found:
+        return found, "", strategy
+    member = next((r for r in found["results"] if isinstance(r, dict) and r.get("audit_id") == audit_id), None)
+    return (member, "", "batch") if member is not None else (None, "Missing from batch result", "batch")
+
+
+def _severity(value, default: str) -> str:
+    value = str(value or "").strip().lower()
+    return value if value in SEVERITIES else default
+
+
+def normalize(result: dict, audit_id: str, name: str) -> tuple[dict, list[str]]:
+    """Check a result against the schema; returns the fixed-up result and what was fixed."""
+    problems = []
+    status = str(result.get("status") or "").strip().lower()
+    status = _STATUS_ALIASES.get(status, status)
+    if status not in STATUSES:
+        return error_result(audit_id, name, f"Invalid result: unknown status {result.get('status')!r}"), \
+            [f"status {result.get('status')!r}"]
+
+    findings = result.get("findings")
+    if findings is None:
+        findings = []
+    elif not isinstance(findings, list):
+        problems.append("findings is not a list")
+        findings = []
+    kept = []
+    for finding in findings:
+        if not isinstance(finding, dict):
+            problems.append("non-object finding dropped")
+            continue
+        if "severity" in finding:
+            finding["severity"] = _severity(finding["severity"], "medium")
+        kept.append(finding)
+
+    severity = _severity(result.get("severity"), "")
+    if not severity:
+        # Most severe finding, else low
+        ranks = [SEVERITIES.index(f["severity"]) for f in kept if f.get("severity") in SEVERITIES]
+        severity = SEVERITIES[min(ranks)] if ranks else "low"
+        problems.append(f"severity {result.get('severity')!r} -> {severity}")
+
+    message = result.get("message")
+    if message is None:
+        message = ""
+    elif not isinstance(message, str):
+        problems.append("message is not a string")
+        message = json.dumps(message) if isinstance(message, (dict, list)) else str(message)
+
+    if audit_id and result.get("audit_id") != audit_id:
+        if result.get("audit_id") not in _PLACEHOLDER_IDS:
+            problems.append(f"audit_id {result.get('audit_id')!r} -> {audit_id!r}")
+        result["audit_id"] = audit_id
+    if not result.get("name"):
+        result["name"] = name
+    result.update(status=status, severity=severity, message=message, findings=kept)
+    return result, problems
+
+
+def extract_result(text: str, audit_id: str, name: str = "") -> tuple[dict, list[str], str]:
+    """Validated result of audit_id from raw agent output (or an already clean result),
+    what was fixed, and the parse strategy."""
+    if not text.strip():
+        return error_result(audit_id, name, "Agent produced no output"), ["empty output"], "none"
+    result, reason, strategy = find_result(text, audit_id)
+    if result is None:
+        return error_result(audit_id, name, reason), [reason], strategy
+    return (*normalize(result, audit_id, name), strategy)
+
+
+def extract_file(path: Path, audit_id: str, name: str = "") -> tuple[dict, list[str], str]:
+    try:
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        text = ""
+    return extract_result(text, audit_id, name)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine extract",
+                                     description="Extract and validate audit results from agent output")
+    parser.add_argument("--audits", help="Ready audits JSON array (index order)")
+    parser.add_argument("--results-prefix", help="Output of audit i is PREFIX<i>.json")
+    parser.add_argument("--write", action="store_true", help="Replace each file with its normalized result")
+    parser.add_argument("--audit-id", default="", help="Audit ID (single file)")
+    parser.add_argument("--name", default="", help="Audit name (single file)")
+    parser.add_argument("file", nargs="?", help="Agent output file (single file)")
+    args = parser.parse_args(argv)
+
+    if args.audits and args.results_prefix:
+        audits = json.loads(Path(args.audits).read_text(encoding="utf-8"))
+        jobs = [(Path(f"{args.results_prefix}{i}.json"), a.get("audit_id", ""), a.get("name", ""))
+                for i, a in enumerate(audits)]
+    elif args.file:
+        jobs = [(Path(args.file), args.audit_id, args.name)]
+    else:
+        parser.error("give --audits and --results-prefix, or a FILE")
+
+    for path, audit_id, name in jobs:
+        result, problems, strategy = extract_file(path, audit_id, name)
+        if args.write:
+            path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        json.dump({"audit_id": audit_id, "status": result["status"], "parse": strategy, "problems": problems,
+                   "result": result}, sys.stdout, separators=(",", ":"))
+        print()
+    return 0
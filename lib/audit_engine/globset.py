@@ -0,0 +1,237 @@
+"""
+Glob-set matcher: test a path once against thousands of discovery globs.
+
+Globs are brace-expanded ({a,b} -> two globs) and indexed by what must be
+literally true of a matching path:
+
+    **/Dockerfile           basename index     dict lookup, no regex
+    **/*.tf, *.config.js    suffix index       dict lookup per '.' in the basename
+    **/api/*.yaml           extension bucket   regexes sharing the literal extension
+    **/migrations/**        generic bucket     everything else
+
+Regex buckets are split into chunks, each guarded by one combined
+alternation, so a path that matches nothing in a chunk costs a single regex
+call. Only on a guard hit are the chunk's individual regexes run to find out
+which keys matched.
+
+Usage:
+    gs = GlobSet()
+    gs.add("**/*.{yaml,yml}", ("audit.id", 0))
+    gs.compile()
+    gs.match("deploy/values.yaml")   # -> [("audit.id", 0)]
+"""
+
+import re
+from collections import defaultdict
+from typing import Hashable
+
+_GLOB_CHARS = set("*?[{")
+_LITERAL_SUFFIX = re.compile(r"^\*(\.[^*?\[{}/]+)$")
+_FINAL_EXT = re.compile(r"\.([^*?\[{}/.]+)$")
+
+
+def expand_braces(glob: str) -> list[str]:
+    """Expand {a,b} alternations (nested allowed) into plain globs."""
+    start = glob.find("{")
+    if start == -1:
+        return [glob]
+
+    depth = 0
+    options = []
+    last = start + 1
+    for i in range(start, len(glob)):
+        c = glob[i]
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                options.append(glob[last:i])
+                head, tail = glob[:start], glob[i + 1:]
+                expanded = []
+                for option in options:
+                    expanded.extend(expand_braces(head + option + tail))
+                return expanded
+        elif c == "," and depth == 1:
+            options.append(glob[last:i])
+            last = i + 1
+
+    return [glob]  # unbalanced: leave the brace literal
+
+
+def normalize_glob(glob: str) -> str:
+    """Strip ./ prefixes; a glob without '/' matches the basename at any depth."""
+    glob = glob.strip()
+    while glob.startswith("./"):
+        glob = glob[2:]
+    glob = glob.lstrip("/")
+    if "/" not in glob:
+        glob = "**/" + glob
+    return glob
+
+
+def glob_to_regex(glob: str) -> str:
+    """Translate a discovery glob into an anchored regex over a relative path.
+
+    Supports ** (any number of directories), *, ?, [...] classes and {a,b}
+    alternation. A glob without '/' matches the basename at any depth.
+    """
+    glob = normalize_glob(glob)
+
+    out = []
+    i, n, depth = 0, len(glob), 0
+    while i < n:
+        c = glob[i]
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = glob.find("]", i + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = glob[i + 1:j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j
+        elif c == "{":
+            depth += 1
+            out.append("(?:")
+        elif c == "}" and depth:
+            depth -= 1
+            out.append(")")
+        elif c == "," and depth:
+            out.append("|")
+        else:
+            out.append(re.escape(c))
+        i += 1
+    out.extend(")" * depth)
+    return "".join(out) + r"\Z"
+
+
+class _RegexBucket:
+    """Globs sharing an index key, guarded in chunks by combined alternations.
+
+    Chunking keeps one broad glob (e.g. **/docs/**) from forcing every
+    regex in the bucket to be tried individually.
+    """
+
+    __slots__ = ("entries", "chunks")
+
+    CHUNK_SIZE = 32
+
+    def __init__(self):
+        self.entries: list[tuple[re.Pattern, Hashable]] = []
+        self.chunks: list[tuple[re.Pattern, list[tuple[re.Pattern, Hashable]]]] = []
+
+    def compile(self):
+        self.chunks = []
+        for start in range(0, len(self.entries), self.CHUNK_SIZE):
+            chunk = self.entries[start:start + self.CHUNK_SIZE]
+            sources = dict.fromkeys(p.pattern for p, _ in chunk)
+            guard = re.compile("|".join(f"(?:{s})" for s in sources))
+            self.chunks.append((guard, chunk))
+
+    def match(self, path: str, out: list):
+        for guard, chunk in self.chunks:
+            if guard.match(path):
+                for regex, key in chunk:
+                    if regex.match(path):
+                        out.append(key)
+
+
+class GlobSet:
+    """A set of globs, each tagged with a key, matched in one pass per path."""
+
+    def __init__(self):
+        self._by_name: dict[str, list[Hashable]] = defaultdict(list)
+        self._by_suffix: dict[str, list[Hashable]] = defaultdict(list)
+        self._by_ext: dict[str, _RegexBucket] = defaultdict(_RegexBucket)
+        self._generic = _RegexBucket()
+        self._regex_cache: dict[str, re.Pattern] = {}
+        self.invalid: list[tuple[str, Hashable]] = []
+        self.size = 0
+
+    def add(self, glob: str, key: Hashable) -> bool:
+        """Index glob under key; False if the glob could not be compiled."""
+        added = False
+        for expanded in expand_braces(glob.strip()):
+            added |= self._add_one(normalize_glob(expanded), key)
+        if not added:
+            self.invalid.append((glob, key))
+        return added
+
+    def _add_one(self, glob: str, key: Hashable) -> bool:
+        if glob.startswith("**/") and "/" not in glob[3:]:
+            name = glob[3:]
+            if not _GLOB_CHARS & set(name):
+                self._by_name[name].append(key)
+                self.size += 1
+                return True
+            suffix = _LITERAL_SUFFIX.match(name)
+            if suffix:
+                self._by_suffix[suffix.group(1)].append(key)
+                self.size += 1
+                return True
+
+        regex = self._regex_cache.get(glob)
+        if regex is None:
+            try:
+                regex = re.compile(glob_to_regex(glob))
+            except re.error:
+                return False
+            self._regex_cache[glob] = regex
+
+        ext = _FINAL_EXT.search(glob.rsplit("/", 1)[-1])
+        bucket = self._by_ext[ext.group(0)] if ext else self._generic
+        bucket.entries.append((regex, key))
+        self.size += 1
+        return True
+
+    def compile(self) -> "GlobSet":
+        """Build bucket guards; call after the last add()."""
+        for bucket in self._by_ext.values():
+            bucket.compile()
+        if self._generic.entries:
+            self._generic.compile()
+        self._regex_cache.clear()
+        return self
+
+    def match(self, path: str) -> list[Hashable]:
+        """Keys of every glob matching path (POSIX, project-relative), deduplicated."""
+        out: list[Hashable] = []
+        base = path.rsplit("/", 1)[-1]
+
+        keys = self._by_name.get(base)
+        if keys:
+            out.extend(keys)
+
+        # Every dotted suffix of the basename; the last one is the extension
+        ext = None
+        dot = base.find(".")
+        while dot != -1:
+            ext = base[dot:]
+            keys = self._by_suffix.get(ext)
+            if keys:
+                out.extend(keys)
+            dot = base.find(".", dot + 1)
+
+        if ext is not None:
+            bucket = self._by_ext.get(ext)
+            if bucket:
+                bucket.match(path, out)
+
+        if self._generic.entries:
+            self._generic.match(path, out)
+
+        return list(dict.fromkeys(out)) if len(out) > 1 else out
@@ -0,0 +1,248 @@
+"""
+Compact audit prompt renderer.
+
+Projects an audit YAML down to what an agent needs to execute it: the
+signals to check, the procedure steps, the discovery evidence already
+found, and how to grade confidence. Governance, knowledge-source URLs,
+profiles, offline manifests and other catalogue metadata are dropped, and
+what remains is rendered densely rather than as YAML.
+
+If the result exceeds the token budget, detail is shed in stages: signal
+explanations, then step commands, expected findings and the closeout
+checklist, then low/positive signals and long descriptions. As a last
+resort the text is cut at a line boundary.
+
+Usage:
+    python3 -m audit_engine prompt --repo AUDITS_REPO --out DIR
+        [--budget TOKENS] [--evidence-dir DIR] [--ids-file FILE] [AUDIT_ID ...]
+
+Writes DIR/<audit_id>.md per audit and prints a JSON summary with
+original vs rendered token estimates.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .corpus import AuditRepo, load_yaml, read_ids
+
+# Renderings stored in the corpus bundle are tagged with this, so any edit
+# to the renderer makes them re-render (see bundle.py)
+RENDERER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+DEFAULT_BUDGET = 2500             # tokens
+CHARS_PER_TOKEN = 4               # rough estimate for English + code
+
+SIGNAL_LEVELS = ["critical", "high", "medium", "low", "positive"]
+
+# Detail shed per stage when over budget
+STAGES = [
+    {"explanations": True, "commands": True, "checklist": True, "minor_signals": True, "text_limit": 0},
+    {"explanations": False, "commands": True, "checklist": True, "minor_signals": True, "text_limit": 0},
+    {"explanations": False, "commands": False, "checklist": False, "minor_signals": True, "text_limit": 0},
+    {"explanations": False, "commands": False, "checklist": False, "minor_signals": False, "text_limit": 160},
+]
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def clean(value: Any, limit: int = 0) -> str:
+    """Collapse a scalar/list to one line of text, optionally truncated."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        text = "; ".join(clean(v) for v in value if v is not None)
+    elif isinstance(value, dict):
+        text = "; ".join(f"{k}: {clean(v)}" for k, v in value.items())
+    else:
+        text = " ".join(str(value).split())
+    if limit and len(text) > limit:
+        text = text[:limit - 1].rstrip() + "…"
+    return text
+
+
+def _header(data: dict) -> list[str]:
+    audit = data.get("audit") or {}
+    execution = data.get("execution") or {}
+    lines = [f"# {audit.get('id', '')} — {audit.get('name', '')}"]
+    facts = [f"{key}: {execution[key]}" for key in ("severity", "scope", "automatable")
+             if execution.get(key)]
+    if audit.get("requires_runtime"):
+        facts.append("needs running system")
+    if facts:
+        lines.append(" | ".join(facts))
+    return lines
+
+
+def _signals(data: dict, stage: dict) -> list[str]:
+    signals = data.get("signals") or {}
+    if not isinstance(signals, dict):
+        return []
+    limit = stage["text_limit"]
+    lines = ["## Signals"]
+    for level in SIGNAL_LEVELS:
+        entries = signals.get(level) or []
+        if not entries or (not stage["minor_signals"] and level in ("low", "positive")):
+            continue
+        lines.append(f"{level}:")
+        for entry in entries:
+            if not isinstance(entry, dict):
+                lines.append(f"- {clean(entry, limit)}")
+                continue
+            head = f"- {entry.get('id', '?')} {clean(entry.get('signal'), limit)}"
+            if entry.get("cwe_id"):
+                head += f" [{entry['cwe_id']}]"
+            lines.append(head)
+            evidence = entry.get("evidence_pattern") or entry.get("evidence_indicators")
+            if evidence:
+                lines.append(f"  evidence: {clean(evidence, limit)}")
+            if stage["explanations"] and entry.get("explanation"):
+                lines.append(f"  why: {clean(entry['explanation'], limit)}")
+            if entry.get("remediation"):
+                lines.append(f"  fix: {clean(entry['remediation'], limit)}")
+    return lines if len(lines) > 1 else []
+
+
+def _procedure(data: dict, stage: dict) -> list[str]:
+    procedure = data.get("procedure") or {}
+    steps = procedure.get("steps") if isinstance(procedure, dict) else None
+    if not steps:
+        return []
+    limit = stage["text_limit"]
+    lines = ["## Procedure"]
+    for n, step in enumerate(steps, 1):
+        if not isinstance(step, dict):
+            lines.append(f"{n}. {clean(step, limit)}")
+            continue
+        title = clean(step.get("name")) or f"Step {step.get('id', n)}"
+        lines.append(f"{n}. {title}: {clean(step.get('description'), limit)}")
+        if stage["commands"]:
+            for command in step.get("commands") or []:
+                text = command.get("command") if isinstance(command, dict) else command
+                if text:
+                    lines.append(f"   $ {clean(text)}")
+            if step.get("expected_findings"):
+                lines.append(f"   expect: {clean(step['expected_findings'], limit)}")
+    return lines
+
+
+def _checklist(data: dict, stage: dict) -> list[str]:
+    items = data.get("closeout_checklist") or []
+    if not stage["checklist"] or not isinstance(items, list) or not items:
+        return []
+    lines = ["## Closeout Checklist"]
+    for item in items:
+        if isinstance(item, dict):
+            level = f"[{item['level']}] " if item.get("level") else ""
+            lines.append(f"- {level}{clean(item.get('item'), stage['text_limit'])}")
+    return lines if len(lines) > 1 else []
+
+
+def _confidence(data: dict) -> list[str]:
+    output = data.get("output") or {}
+    guidance = output.get("confidence_guidance") if isinstance(output, dict) else None
+    if not isinstance(guidance, dict) or not guidance:
+        return []
+    return ["## Confidence", " | ".join(f"{k}: {clean(v)}" for k, v in guidance.items())]
+
+
+@dataclass
+class Rendered:
+    text: str
+    tokens: int
+    stage: int
+    truncated: bool
+
+
+def render_stage(data: dict, evidence: str, stage: dict) -> str:
+    description = data.get("description") or {}
+    what = clean(description.get("what") if isinstance(description, dict) else description,
+                 stage["text_limit"] * 2)
+    sections = [_header(data)]
+    if what:
+        sections.append([f"What: {what}"])
+    sections += [_signals(data, stage), _procedure(data, stage)]
+    if evidence.strip():
+        sections.append(["## Discovery Evidence", evidence.strip()])
+    sections += [_checklist(data, stage), _confidence(data)]
+    return "\n\n".join("\n".join(lines) for lines in sections if lines) + "\n"
+
+
+def render(data: dict, evidence: str = "", budget: int = DEFAULT_BUDGET) -> Rendered:
+    """Render an audit within budget tokens (0 = unlimited), shedding detail as needed."""
+    text = ""
+    for index, stage in enumerate(STAGES):
+        text = render_stage(data, evidence, stage)
+        tokens = estimate_tokens(text)
+        if not budget or tokens <= budget:
+            return Rendered(text, tokens, index, False)
+
+    cut = text.rfind("\n", 0, budget * CHARS_PER_TOKEN)
+    text = text[:cut if cut > 0 else budget * CHARS_PER_TOKEN] + "\n[… truncated to fit the prompt budget]\n"
+    return Rendered(text, estimate_tokens(text), len(STAGES) - 1, True)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine prompt",
+                                     description="Render compact audit prompts")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--out", required=True, help="Directory for rendered prompts")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET,
+                        help=f"Token budget per audit, 0 = unlimited (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--evidence-dir", help="Discovery manifest directory (<audit_id>.md)")
+    parser.add_argument("--ids-file", help="Newline-separated audit IDs (- for stdin)")
+    parser.add_argument("ids", nargs="*", help="Audit IDs")
+    args = parser.parse_args(argv)
+
+    repo = AuditRepo(args.repo)
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    evidence_dir = Path(args.evidence_dir) if args.evidence_dir else None
+
+    audits = {}
+    original_total = rendered_total = 0
+    missing = []
+    for audit_id in read_ids(args.ids, args.ids_file):
+        path = repo.audit_path(audit_id)
+        compiled = repo.compiled(audit_id)
+        data = compiled["record"] if compiled else load_yaml(path) if path else None
+        if data is None or path is None:
+            missing.append(audit_id)
+            continue
+
+        evidence = ""
+        if evidence_dir and (evidence_dir / f"{audit_id}.md").is_file():
+            evidence = (evidence_dir / f"{audit_id}.md").read_text(encoding="utf-8")
+
+        if compiled and compiled["prompt_version"] == RENDERER_VERSION \
+                and not evidence.strip() and args.budget == DEFAULT_BUDGET:
+            # The bundle holds exactly this rendering (see bundle.py)
+            rendered = Rendered(compiled["prompt"], compiled["prompt_tokens"], compiled["prompt_stage"],
+                                compiled["prompt_truncated"])
+        else:
+            rendered = render(data, evidence, args.budget)
+        (out_dir / f"{audit_id}.md").write_text(rendered.text, encoding="utf-8")
+
+        # Baseline is what the runner used to send: the raw YAML plus evidence
+        original = estimate_tokens(path.read_text(encoding="utf-8") + evidence)
+        original_total += original
+        rendered_total += rendered.tokens
+        audits[audit_id] = {"original_tokens": original, "tokens": rendered.tokens,
+                            "stage": rendered.stage, "truncated": rendered.truncated}
+
+    json.dump({
+        "budget": args.budget,
+        "original_tokens": original_total,
+        "tokens": rendered_total,
+        "saved_tokens": original_total - rendered_total,
+        "missing": missing,
+        "audits": audits,
+    }, sys.stdout, indent=2)
+    print()
+    return 0
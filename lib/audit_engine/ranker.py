@@ -0,0 +1,316 @@
+"""
+Offline relevance ranker for audit preselection.
+
+Scores every phase-applicable audit against the project so the selection
+prompt carries a short, ranked top-K instead of the first rows of the
+inventory. Two signals:
+
+    text   BM25 over each audit's name, category, description, signals
+           and discovery patterns (fields weighted, BM25F-style), queried
+           with the project context (gathered context, project snapshot)
+    files  the audit's discovery file globs matched against the project
+           tree, each matched glob weighted by its rarity among the
+           candidates (**/*.js says little, **/terraform/*.tf a lot)
+
+Both are normalized to the best candidate and summed. Discovery manifests,
+when given, add their verdicts: evidence raises an audit, none halves it.
+A per-subcategory cap keeps one dense subcategory from filling the list.
+
+Audit term vectors are cached in --index-cache, keyed by each YAML's
+mtime and size, so only changed audits are re-parsed.
+
+Usage:
+    python3 -m audit_engine rank --repo AUDITS_REPO --ids-file FILE
+        --context FILE [--context FILE ...] [--project DIR]
+        [--discovery-dir DIR] [--top K] [--per-subcategory N]
+        [--index-cache FILE]
+
+Prints {"candidates": N, "reindexed": N, "ranked": [{"audit_id", "name",
+"category", "tier", "automatable", "score", "file_hits"}, ...]}.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from .corpus import AuditRepo, read_ids
+from .globset import GlobSet
+from .scanner import walk_project
+
+INDEX_VERSION = 1
+DEFAULT_TOP = 60
+DEFAULT_PER_SUBCATEGORY = 6
+
+K1 = 1.2
+B = 0.75
+FILE_WEIGHT = 0.35                # matched globs vs. text relevance
+EVIDENCE_BONUS = 0.25             # discovery manifest verdict "evidence"
+NO_EVIDENCE_FACTOR = 0.5          # discovery manifest verdict "none"
+
+# Term frequency multiplier per field
+FIELD_WEIGHTS = {"name": 3, "taxonomy": 2, "description": 1, "signals": 1, "patterns": 1}
+
+STOPWORDS = frozenset("""
+    a about above after all also an and any are as at be been before being both but by can
+    could did do does each for from had has have how if in into is it its may more most must
+    no not of on only or other our over per should so some such than that the their them then
+    there these they this those through to under up use used uses using via was were what when
+    where whether which while who will with within without would you your
+""".split())
+
+_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+_WORD = re.compile(r"[a-z][a-z0-9]+")
+_SUFFIXES = (("ies", "y"), ("ing", ""), ("ed", ""), ("es", ""), ("s", ""))
+
+
+def stem(word: str) -> str:
+    """Light suffix stripping: policies/policy, caching/cache -> same stem."""
+    for suffix, repl in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3 and not word.endswith("ss"):
+            return word[:-len(suffix)] + repl
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    words = _WORD.findall(_CAMEL.sub(r"\1 \2", text).lower())
+    return [stem(w) for w in words if w not in STOPWORDS]
+
+
+def _text(value) -> str:
+    if isinstance(value, dict):
+        return " ".join(_text(v) for v in value.values())
+    if isinstance(value, list):
+        return " ".join(_text(v) for v in value)
+    return "" if value is None else str(value)
+
+
+def audit_fields(row: dict[str, str], data: dict | None) -> tuple[dict[str, str], list[str]]:
+    """Indexable text per field, and the audit's discovery file globs."""
+    fields = {"name": row.get("audit_name", ""),
+              "taxonomy": f"{row.get('category', '')} {row.get('subcategory', '')}".replace("-", " ")}
+    globs: list[str] = []
+    if not data:
+        return fields, globs
+
+    description = data.get("description") or {}
+    if isinstance(description, dict):
+        fields["description"] = _text([description.get("what"), description.get("why_it_matters")])
+    else:
+        fields["description"] = _text(description)
+
+    signals = data.get("signals") or {}
+    if isinstance(signals, dict):
+        fields["signals"] = _text([entry.get("signal") if isinstance(entry, dict) else entry
+                                   for entries in signals.values() if isinstance(entries, list)
+                                   for entry in entries])
+
+    discovery = data.get("discovery") or {}
+    if isinstance(discovery, dict):
+        patterns = []
+        for entry in discovery.get("code_patterns") or []:
+            if isinstance(entry, dict):
+                # Regex syntax tokenizes into its literal words: X-Frame-Options|frameOptions
+                patterns += [str(entry.get("pattern") or ""), str(entry.get("purpose") or "")]
+        for entry in discovery.get("file_patterns") or []:
+            if isinstance(entry, dict) and entry.get("glob"):
+                globs.append(str(entry["glob"]))
+                patterns += [str(entry["glob"]), str(entry.get("purpose") or "")]
+        fields["patterns"] = " ".join(patterns)
+    return fields, globs
+
+
+def index_entry(fields: dict[str, str]) -> dict:
+    """Field-weighted term frequencies and weighted document length."""
+    terms: Counter = Counter()
+    for name, text in fields.items():
+        weight = FIELD_WEIGHTS.get(name, 1)
+        for term in tokenize(text):
+            terms[term] += weight
+    return {"terms": dict(terms), "length": sum(terms.values())}
+
+
+class AuditIndex:
+    """Per-audit term vectors and globs, cached on disk by YAML mtime/size."""
+
+    def __init__(self, repo: AuditRepo, cache_path: Path | None = None):
+        self.repo = repo
+        self.cache_path = cache_path
+        self.entries: dict[str, dict] = {}
+        self.reindexed = 0
+        if cache_path and cache_path.is_file():
+            try:
+                cached = json.loads(cache_path.read_text(encoding="utf-8"))
+                if cached.get("version") == INDEX_VERSION:
+                    self.entries = cached.get("audits") or {}
+            except (OSError, ValueError):
+                pass
+
+    def get(self, audit_id: str) -> dict:
+        path = self.repo.audit_path(audit_id)
+        try:
+            st = path.stat() if path else None
+        except OSError:
+            st = None
+        stamp = f"{st.st_mtime_ns}:{st.st_size}" if st else ""
+        entry = self.entries.get(audit_id)
+        if entry is None or entry.get("stamp") != stamp:
+            fields, globs = audit_fields(self.repo.inventory.get(audit_id) or {},
+                                         self.repo.load_audit(audit_id))
+            entry = {"stamp": stamp, **index_entry(fields), "globs": globs}
+            self.entries[audit_id] = entry
+            self.reindexed += 1
+        return entry
+
+    def save(self):
+        if not self.cache_path or not self.reindexed:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_name(f".{self.cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "audits": self.entries}), encoding="utf-8")
+        tmp.replace(self.cache_path)
+
+
+def bm25_scores(docs: dict[str, dict], query: Counter) -> dict[str, float]:
+    n = len(docs)
+    if not n:
+        return {}
+    avg_length = sum(d["length"] for d in docs.values()) / n or 1.0
+    df: Counter = Counter()
+    for d in docs.values():
+        df.update(term for term in d["terms"] if term in query)
+
+    scores = {}
+    for audit_id, d in docs.items():
+        norm = K1 * (1 - B + B * d["length"] / avg_length)
+        score = 0.0
+        for term, qtf in query.items():
+            tf = d["terms"].get(term)
+            if tf:
+                idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+                # Repeated context terms count, but sub-linearly
+                score += (1 + math.log(qtf)) * idf * tf * (K1 + 1) / (tf + norm)
+        scores[audit_id] = score
+    return scores
+
+
+def file_scores(docs: dict[str, dict], project: Path) -> tuple[dict[str, float], dict[str, int]]:
+    """Rarity-weighted matched globs per audit, and matched file counts."""
+    globset = GlobSet()
+    for audit_id, d in docs.items():
+        for glob in d["globs"]:
+            globset.add(glob, (audit_id, glob))
+    if not globset.size:
+        return {}, {}
+    globset.compile()
+
+    matched: dict[str, set[str]] = {}
+    files: Counter = Counter()
+    for rel_path in walk_project(project):
+        for audit_id, glob in set(globset.match(rel_path)):
+            matched.setdefault(audit_id, set()).add(glob)
+            files[audit_id] += 1
+
+    n = len(docs)
+    glob_df = Counter(glob for globs in matched.values() for glob in globs)
+    scores = {audit_id: sum(math.log(1 + n / glob_df[glob]) for glob in globs)
+              for audit_id, globs in matched.items()}
+    return scores, dict(files)
+
+
+def _normalized(scores: dict[str, float]) -> dict[str, float]:
+    top = max(scores.values(), default=0.0)
+    return {k: v / top for k, v in scores.items()} if top > 0 else {}
+
+
+def _verdict(discovery_dir: Path | None, audit_id: str) -> str:
+    if not discovery_dir:
+        return ""
+    try:
+        return json.loads((discovery_dir / f"{audit_id}.json").read_text(encoding="utf-8")).get("verdict", "")
+    except (OSError, ValueError):
+        return ""
+
+
+def rank(repo: AuditRepo, audit_ids: list[str], context: str, project: Path | None = None,
+         discovery_dir: Path | None = None, index: AuditIndex | None = None) -> list[tuple[str, float, int]]:
+    """(audit_id, score, matched files) for every candidate, best first."""
+    index = index or AuditIndex(repo)
+    docs = {audit_id: index.get(audit_id) for audit_id in audit_ids}
+
+    text = _normalized(bm25_scores(docs, Counter(tokenize(context))))
+    globs, files = file_scores(docs, project) if project else ({}, {})
+    globs = _normalized(globs)
+
+    ranked = []
+    for audit_id in audit_ids:
+        score = text.get(audit_id, 0.0) + FILE_WEIGHT * globs.get(audit_id, 0.0)
+        verdict = _verdict(discovery_dir, audit_id)
+        if verdict == "evidence":
+            score += EVIDENCE_BONUS
+        elif verdict == "none":
+            score *= NO_EVIDENCE_FACTOR
+        ranked.append((audit_id, score, files.get(audit_id, 0)))
+    # Stable: ties keep inventory order
+    ranked.sort(key=lambda item: -item[1])
+    return ranked
+
+
+def select(repo: AuditRepo, ranked: list[tuple[str, float, int]], top: int,
+           per_subcategory: int = 0) -> list[tuple[str, float, int]]:
+    """Best top entries, at most per_subcategory from any one subcategory (0 = no cap)."""
+    chosen, overflow = [], []
+    taken: Counter = Counter()
+    for item in ranked:
+        row = repo.inventory.get(item[0]) or {}
+        key = (row.get("category", ""), row.get("subcategory", ""))
+        if per_subcategory and taken[key] >= per_subcategory:
+            overflow.append(item)
+            continue
+        taken[key] += 1
+        chosen.append(item)
+        if len(chosen) >= top:
+            return chosen
+    # Fewer subcategories than needed to fill the list: top up in rank order
+    return chosen + overflow[:top - len(chosen)]
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine rank",
+                                     description="Rank candidate audits by relevance to the project")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--ids-file", required=True, help="Candidate audit IDs, one per line (- for stdin)")
+    parser.add_argument("--context", action="append", default=[],
+                        help="Project context text file (repeatable)")
+    parser.add_argument("--project", help="Project root, matched against discovery file globs")
+    parser.add_argument("--discovery-dir", help="Discovery manifests (verdicts)")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help=f"Audits to return (default: {DEFAULT_TOP})")
+    parser.add_argument("--per-subcategory", type=int, default=DEFAULT_PER_SUBCATEGORY,
+                        help=f"Cap per subcategory, 0 = none (default: {DEFAULT_PER_SUBCATEGORY})")
+    parser.add_argument("--index-cache", help="Term index cache file (reused across runs)")
+    args = parser.parse_args(argv)
+
+    repo = AuditRepo(args.repo)
+    audit_ids = [i for i in read_ids([], args.ids_file) if i in repo.inventory]
+    context = "\n".join(Path(p).read_text(encoding="utf-8", errors="replace")
+                        for p in args.context if Path(p).is_file())
+    index = AuditIndex(repo, Path(args.index_cache) if args.index_cache else None)
+
+    ranked = rank(repo, audit_ids, context, Path(args.project) if args.project else None,
+                  Path(args.discovery_dir) if args.discovery_dir else None, index)
+    index.save()
+
+    out = []
+    for audit_id, score, files in select(repo, ranked, args.top, args.per_subcategory):
+        row = repo.inventory[audit_id]
+        out.append({"audit_id": audit_id, "name": row.get("audit_name", ""),
+                    "category": row.get("category", ""), "tier": row.get("tier", ""),
+                    "automatable": row.get("automatable", ""), "score": round(score, 4),
+                    "file_hits": files})
+    json.dump({"candidates": len(audit_ids), "reindexed": index.reindexed, "ranked": out}, sys.stdout)
+    print()
+    return 0
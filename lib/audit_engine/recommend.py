@@ -0,0 +1,133 @@
+"""
+Run-all recommendation builder.
+
+Turns the inventory into the recommendations JSON that audit_execute
+consumes (same shape as the LLM selection output) for every audit
+applicable to a phase, in one pass over the CSV. Optional filters (tier,
+severity, automatable, category) and ordering are applied in the same
+pass, so run-all planning over thousands of audits needs no LLM call and
+no per-row shell work.
+
+Usage:
+    python3 -m audit_engine recommend --inventory CSV|- --column PHASE_COLUMN
+        --phase N [--phase-name NAME] [--tier LIST] [--severity LIST]
+        [--automatable LIST] [--category LIST] [--order KEYS] [--limit N]
+
+LIST is comma-separated; KEYS is a comma-separated list of inventory
+(default), severity, duration, tier, category. Exits 1 with {"error": ...}
+if the phase column is missing.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+from pathlib import Path
+
+from .scheduler import DEFAULT_ESTIMATE, parse_duration
+
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+TIER_ORDER = {"phd": 0, "expert": 1, "focused": 2, "basic": 3}
+PRIORITY = {"critical": "high", "high": "high", "medium": "medium", "low": "low"}
+# Inventory spellings of the automatable column, folded for filtering
+AUTOMATABLE_ALIASES = {"full": "yes", "minimal": "partial", "none": "manual", "no": "manual"}
+
+ORDER_KEYS = {
+    "inventory": lambda row: 0,
+    "severity": lambda row: SEVERITY_ORDER.get(row.get("severity", "").lower(), len(SEVERITY_ORDER)),
+    "duration": lambda row: -(parse_duration(row.get("estimated_duration", "")) or DEFAULT_ESTIMATE),
+    "tier": lambda row: TIER_ORDER.get(row.get("tier", "").lower(), len(TIER_ORDER)),
+    "category": lambda row: (row.get("category", ""), row.get("subcategory", "")),
+}
+
+
+def _set(values: str | None, aliases: dict[str, str] | None = None) -> frozenset[str]:
+    items = (v.strip().lower() for v in (values or "").split(","))
+    return frozenset((aliases or {}).get(v, v) for v in items if v)
+
+
+def automatable(row: dict[str, str]) -> str:
+    value = row.get("automatable", "").strip().lower()
+    return AUTOMATABLE_ALIASES.get(value, value)
+
+
+def build(rows: list[dict[str, str]], column: str, filters: dict[str, frozenset[str]],
+          order: list[str], limit: int = 0) -> tuple[int, list[dict[str, str]]]:
+    """(phase-applicable count, selected rows in order)."""
+    applicable = [row for row in rows if row.get(column, "").strip().lower() == "yes"]
+    selected = []
+    for row in applicable:
+        values = {"tier": row.get("tier", "").lower(), "severity": row.get("severity", "").lower(),
+                  "automatable": automatable(row), "category": row.get("category", "").lower()}
+        if all(not allowed or values[field] in allowed for field, allowed in filters.items()):
+            selected.append(row)
+    keys = [ORDER_KEYS[key] for key in order if key != "inventory"]
+    if keys:
+        # Stable sort: inventory order breaks ties
+        selected.sort(key=lambda row: tuple(key(row) for key in keys))
+    return len(applicable), selected[:limit] if limit > 0 else selected
+
+
+def recommendation(row: dict[str, str]) -> dict[str, str]:
+    severity = row.get("severity", "").lower()
+    return {
+        "audit_id": row["audit_id"],
+        "name": row.get("audit_name", ""),
+        "category": row.get("category", ""),
+        "tier": row.get("tier", ""),
+        "severity": severity,
+        "automatable": automatable(row),
+        "relevance": "Phase-applicable audit (run-all mode)",
+        "dependency_status": "ready",
+        "priority": PRIORITY.get(severity, "medium"),
+    }
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine recommend",
+                                     description="Recommendations for every phase-applicable audit")
+    parser.add_argument("--inventory", required=True, help="AUDIT-INVENTORY.csv (- for stdin)")
+    parser.add_argument("--column", required=True, help="Phase column of the inventory (e.g. implementation)")
+    parser.add_argument("--phase", type=int, required=True)
+    parser.add_argument("--phase-name", default="")
+    parser.add_argument("--tier", help="Only these tiers")
+    parser.add_argument("--severity", help="Only these severities")
+    parser.add_argument("--automatable", help="Only these automatable values (yes, partial, manual)")
+    parser.add_argument("--category", help="Only these categories")
+    parser.add_argument("--order", default="inventory",
+                        help=f"Sort keys, comma-separated: {', '.join(ORDER_KEYS)} (default: inventory)")
+    parser.add_argument("--limit", type=int, default=0, help="At most N audits (0 = all)")
+    args = parser.parse_args(argv)
+
+    order = [key.strip() for key in args.order.split(",") if key.strip()]
+    unknown = [key for key in order if key not in ORDER_KEYS]
+    if unknown:
+        parser.error(f"unknown --order key(s): {', '.join(unknown)}")
+
+    text = sys.stdin.read() if args.inventory == "-" else Path(args.inventory).read_text(encoding="utf-8")
+    reader = csv.DictReader(io.StringIO(text))
+    if args.column not in (reader.fieldnames or []):
+        json.dump({"error": f"Phase column not found: {args.column}"}, sys.stdout)
+        print()
+        return 1
+
+    filters = {"tier": _set(args.tier), "severity": _set(args.severity),
+               "automatable": _set(args.automatable, AUTOMATABLE_ALIASES), "category": _set(args.category)}
+    total, selected = build([row for row in reader if row.get("audit_id")], args.column,
+                            filters, order, args.limit)
+
+    described = ", ".join(f"{field} {','.join(sorted(allowed))}" for field, allowed in filters.items() if allowed)
+    count = f"ALL {total}" if len(selected) == total else f"{len(selected)} of {total}"
+    summary = f"Running {count} audits applicable to phase {args.phase} ({args.phase_name})"
+    summary += f", filtered by {described}" if described else ""
+    json.dump({
+        "phase": args.phase,
+        "phase_name": args.phase_name,
+        "total_available": total,
+        "run_all": True,
+        "recommendations": [recommendation(row) for row in selected],
+        "summary": summary + ". No LLM prioritization.",
+    }, sys.stdout, indent=2)
+    print()
+    return 0
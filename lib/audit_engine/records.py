@@ -0,0 +1,226 @@
+"""
+Compact audit records.
+
+AuditRepo.inventory holds each inventory row as a dict of ~25 strings, and
+a parsed definition is a tree of dicts and lists, so holding a whole corpus
+either way costs several times its text. AuditRecord keeps one audit in a
+slotted object instead:
+
+    tier, severity, automatable, status   enum members shared by every record
+                                          (unrecognized values become UNKNOWN)
+    category, subcategory, duration       interned strings
+    phases                                bitmask over PHASES (inventory columns)
+    sections                              everything of the definition besides
+                                          the header, one compact UTF-8 JSON
+                                          blob per section, decoded on access
+
+Heavy sections (procedure, signals, governance, knowledge_sources, ...)
+therefore cost their serialized size until asked for, and section(name)
+decodes only the section asked for. Nothing decoded is cached (that would
+give back the saving): callers keep what they need.
+
+Usage:
+    python3 -m audit_engine records --repo AUDITS_REPO [--definitions]
+
+Measures with tracemalloc what the corpus costs held as inventory dict
+rows (with --definitions: plus parsed definitions) versus as AuditRecords,
+and prints {"audits", "dict_bytes", "record_bytes", "reduction"}.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from enum import Enum
+from typing import Any, Iterable
+
+from .corpus import AuditRepo
+
+PHASES = ("discovery", "prd", "task_decomposition", "specification", "implementation",
+          "testing", "integration", "deployment", "post_production")
+HEADER_SECTION = "audit"
+
+
+class _Interned(str, Enum):
+    """String enum whose members compare equal to their inventory spelling."""
+
+    @classmethod
+    def parse(cls, value: Any) -> "_Interned":
+        text = str(value or "").strip().lower()
+        return cls._value2member_map_.get(cls._aliases().get(text, text), cls.UNKNOWN)  # type: ignore[attr-defined]
+
+    @classmethod
+    def _aliases(cls) -> dict[str, str]:
+        return {}
+
+
+class Tier(_Interned):
+    PHD = "phd"
+    EXPERT = "expert"
+    FOCUSED = "focused"
+    BASIC = "basic"
+    UNKNOWN = ""
+
+
+class Severity(_Interned):
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+    UNKNOWN = ""
+
+
+class Automatable(_Interned):
+    YES = "yes"
+    PARTIAL = "partial"
+    MANUAL = "manual"
+    UNKNOWN = ""
+
+    @classmethod
+    def _aliases(cls) -> dict[str, str]:
+        # Same folding as recommend.AUTOMATABLE_ALIASES, plus YAML booleans
+        return {"full": "yes", "true": "yes", "minimal": "partial", "hybrid": "partial",
+                "none": "manual", "no": "manual", "false": "manual"}
+
+
+class Status(_Interned):
+    ACTIVE = "active"
+    DRAFT = "draft"
+    DEPRECATED = "deprecated"
+    UNKNOWN = ""
+
+
+def _intern(value: Any) -> str:
+    return sys.intern(str(value or "").strip())
+
+
+class AuditRecord:
+    """One audit: typed header fields plus lazily decoded definition sections."""
+
+    __slots__ = ("audit_id", "name", "file_path", "category", "subcategory", "tier", "severity",
+                 "automatable", "status", "estimated_duration", "phases", "_sections")
+
+    def __init__(self, audit_id: str, name: str = "", file_path: str = "", category: str = "",
+                 subcategory: str = "", tier: Tier = Tier.UNKNOWN, severity: Severity = Severity.UNKNOWN,
+                 automatable: Automatable = Automatable.UNKNOWN, status: Status = Status.UNKNOWN,
+                 estimated_duration: str = "", phases: int = 0,
+                 sections: dict[str, bytes] | None = None):
+        self.audit_id = sys.intern(audit_id)
+        self.name = name
+        self.file_path = file_path
+        self.category = _intern(category)
+        self.subcategory = _intern(subcategory)
+        self.tier = tier
+        self.severity = severity
+        self.automatable = automatable
+        self.status = status
+        self.estimated_duration = _intern(estimated_duration)
+        self.phases = phases
+        self._sections = sections
+
+    @classmethod
+    def from_row(cls, row: dict[str, str]) -> "AuditRecord":
+        """Record of an inventory row (no definition sections)."""
+        phases = 0
+        for bit, column in enumerate(PHASES):
+            if row.get(column, "").strip().lower() == "yes":
+                phases |= 1 << bit
+        return cls(row.get("audit_id", ""), row.get("audit_name", ""), row.get("file_path", ""),
+                   row.get("category", ""), row.get("subcategory", ""), Tier.parse(row.get("tier")),
+                   Severity.parse(row.get("severity")), Automatable.parse(row.get("automatable")),
+                   Status.parse(row.get("status")), row.get("estimated_duration", ""), phases)
+
+    @classmethod
+    def from_document(cls, data: dict[str, Any], row: dict[str, str] | None = None) -> "AuditRecord":
+        """Record of a parsed definition; header fields come from the inventory row when given."""
+        header = data.get(HEADER_SECTION) if isinstance(data.get(HEADER_SECTION), dict) else {}
+        if row is not None:
+            record = cls.from_row(row)
+        else:
+            execution = data.get("execution") if isinstance(data.get("execution"), dict) else {}
+            record = cls(str(header.get("id") or ""), str(header.get("name") or ""), "",
+                         header.get("category"), header.get("subcategory"), Tier.parse(header.get("tier")),
+                         Severity.parse(execution.get("severity")),
+                         Automatable.parse(execution.get("automatable")), Status.parse(header.get("status")),
+                         header.get("estimated_duration"))
+        record._sections = {sys.intern(str(key)): json.dumps(value, default=str, ensure_ascii=False,
+                                                              separators=(",", ":")).encode("utf-8")
+                            for key, value in data.items() if key != HEADER_SECTION}
+        return record
+
+    def applies_to(self, phase_column: str) -> bool:
+        return phase_column in PHASES and bool(self.phases >> PHASES.index(phase_column) & 1)
+
+    @property
+    def has_sections(self) -> bool:
+        return self._sections is not None
+
+    def sections(self) -> dict[str, Any]:
+        """All definition sections besides the header, decoded now ({} if none were kept)."""
+        return {name: json.loads(blob) for name, blob in (self._sections or {}).items()}
+
+    def section(self, name: str, default: Any = None) -> Any:
+        """One definition section, decoded now (default if absent)."""
+        blob = self._sections.get(name) if self._sections is not None else None
+        return default if blob is None else json.loads(blob)
+
+    def __repr__(self) -> str:
+        return f"AuditRecord({self.audit_id!r}, tier={self.tier.value!r}, severity={self.severity.value!r})"
+
+
+def load_records(repo: AuditRepo, ids: Iterable[str] | None = None,
+                 definitions: bool = False) -> dict[str, AuditRecord]:
+    """Records of the given (default: all) inventory audits, in inventory order."""
+    inventory = repo.inventory
+    records = {}
+    for audit_id in (ids if ids is not None else inventory):
+        row = inventory.get(audit_id)
+        if row is None:
+            continue
+        data = repo.load_audit(audit_id) if definitions else None
+        records[audit_id] = AuditRecord.from_document(data, row) if data else AuditRecord.from_row(row)
+    return records
+
+
+def _held_bytes(build) -> tuple[Any, int]:
+    """(result of build(), bytes it still holds once built)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, held
+
+
+def measure(root: str, definitions: bool = False) -> dict[str, Any]:
+    def as_dicts():
+        repo = AuditRepo(root)
+        rows = {audit_id: dict(row) for audit_id, row in repo.inventory.items()}
+        docs = {audit_id: repo.load_audit(audit_id) for audit_id in rows} if definitions else {}
+        return rows, docs
+
+    def as_records():
+        return load_records(AuditRepo(root), definitions=definitions)
+
+    (rows, _), dict_bytes = _held_bytes(as_dicts)
+    del _
+    records, record_bytes = _held_bytes(as_records)
+    return {"audits": len(records), "definitions": definitions, "dict_bytes": dict_bytes,
+            "record_bytes": record_bytes,
+            "reduction": round(1 - record_bytes / dict_bytes, 3) if dict_bytes else None}
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine records",
+                                     description="Measure the memory of compact audit records")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--definitions", action="store_true",
+                        help="Include parsed definitions (reads the corpus bundle or every YAML)")
+    args = parser.parse_args(argv)
+
+    json.dump(measure(args.repo, args.definitions), sys.stdout)
+    print()
+    return 0
@@ -0,0 +1,123 @@
+"""
+Remediation patch merger for the streaming remediation pipeline.
+
+While findings are reviewed during audit_execute_streaming, every accepted
+resolution is sent to a patch agent in the background (lib/audit.sh,
+AUDIT_REMEDIATE_PIPELINE). Each agent sees the artifact as it was when
+streaming began and answers with exact-text edits instead of a rewritten
+document:
+
+    {"edits": [{"find": "exact text of the document", "replace": "new text"}]}
+
+This merges those patches into the artifact in acceptance order. A patch
+applies only as a whole: each "find" must occur exactly once in the
+document as patched so far. A patch that is missing, unparseable or
+conflicts with an earlier one is left over; its resolution is written back
+in the resolution plan format so one full-document revision can cover
+whatever the patches could not.
+
+Patch directory layout (SEQ zero-padded, acceptance order):
+    SEQ.req.json    {"seq", "status", "audit_id", "finding", "resolution"}
+    SEQ.out         raw patch agent output (absent while still running)
+
+Usage:
+    python3 -m audit_engine remediate --artifact FILE --patch-dir DIR --out FILE
+        [--leftover FILE]
+
+Writes the merged document to --out and the left-over resolution plan to
+--leftover; prints {"applied": [...], "leftover": [{"seq", "reason"}],
+"edits": N} with patch sequence numbers.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .extract import iter_objects
+
+
+def parse_edits(text: str) -> list[dict[str, str]] | None:
+    """Edits of the last {"edits": [...]} object in agent output; None if there is none."""
+    found = None
+    for obj in iter_objects(text):
+        if isinstance(obj.get("edits"), list):
+            found = obj["edits"]
+    if found is None:
+        return None
+    edits = []
+    for edit in found:
+        if not isinstance(edit, dict) or not isinstance(edit.get("find"), str) or not edit["find"]:
+            return None
+        replace = edit.get("replace", "")
+        edits.append({"find": edit["find"], "replace": replace if isinstance(replace, str) else str(replace)})
+    return edits
+
+
+def apply_edits(document: str, edits: list[dict[str, str]]) -> tuple[str | None, str]:
+    """The document with every edit applied, or None and why not (all or nothing)."""
+    for edit in edits:
+        count = document.count(edit["find"])
+        if count != 1:
+            what = "not found" if count == 0 else f"ambiguous ({count} matches)"
+            return None, f"edit target {what}: {edit['find'][:60]!r}"
+        document = document.replace(edit["find"], edit["replace"], 1)
+    return document, ""
+
+
+def plan_entry(request: dict) -> str:
+    """One item of the resolution plan, as lib/audit.sh accumulates it."""
+    return (f"{request.get('seq')}. [{request.get('status', '')}] {request.get('audit_id', '')}\n"
+            f"   FINDING: {request.get('finding', '')}\n"
+            f"   RESOLUTION: {request.get('resolution', '')}\n\n")
+
+
+def merge(document: str, patch_dir: Path) -> tuple[str, list[int], list[dict], str, int]:
+    """(merged document, applied seqs, leftovers, left-over plan, edits applied)."""
+    applied, leftover = [], []
+    plan = []
+    edit_count = 0
+    for request_path in sorted(patch_dir.glob("*.req.json")):
+        try:
+            request = json.loads(request_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        seq = request.get("seq")
+        output = request_path.with_name(request_path.name.replace(".req.json", ".out"))
+        try:
+            text = output.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            text = ""
+        edits = parse_edits(text) if text.strip() else None
+        if edits is None:
+            reason = "no patch output" if not text.strip() else "unparseable patch"
+            patched = None
+        else:
+            patched, reason = apply_edits(document, edits)
+        if patched is None:
+            leftover.append({"seq": seq, "reason": reason})
+            plan.append(plan_entry(request))
+            continue
+        document = patched
+        applied.append(seq)
+        edit_count += len(edits)
+    return document, applied, leftover, "".join(plan), edit_count
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine remediate",
+                                     description="Merge remediation patches into an artifact in order")
+    parser.add_argument("--artifact", required=True, help="Artifact the patches were generated against")
+    parser.add_argument("--patch-dir", required=True, help="SEQ.req.json / SEQ.out pairs")
+    parser.add_argument("--out", required=True, help="Merged document")
+    parser.add_argument("--leftover", help="Resolution plan of the patches that did not apply")
+    args = parser.parse_args(argv)
+
+    document = Path(args.artifact).read_text(encoding="utf-8")
+    merged, applied, leftover, plan, edits = merge(document, Path(args.patch_dir))
+    Path(args.out).write_text(merged, encoding="utf-8")
+    if args.leftover:
+        Path(args.leftover).write_text(plan, encoding="utf-8")
+    json.dump({"applied": applied, "leftover": leftover, "edits": edits}, sys.stdout)
+    print()
+    return 0
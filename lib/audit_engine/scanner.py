@@ -0,0 +1,493 @@
+"""
+Multi-regex scanner for discovery.code_patterns.
+
+All evaluable code patterns of an audit set are compiled once. The literals
+each regex requires (from its parse tree) are combined into one trie-shaped
+regex. Searching the file with that regex, lower-cased one window at a time,
+selects the patterns that can possibly match it, and only those run. Each
+pattern's scope restricts it to source/config/docs/test files. Files are
+memory-mapped rather than copied into Python strings, binaries and files
+over the size cap are skipped, and batches of files are fanned out across
+a process pool.
+
+Usage:
+    python3 -m audit_engine scan --repo AUDITS_REPO [--project DIR]
+        [--jobs N] [--max-bytes N] [--ids-file FILE] [AUDIT_ID ...]
+
+Output is one JSON line per (file, pattern) with at least one hit, streamed
+as batches complete:
+    {"audit_id": "...", "pattern_id": 3, "file": "src/app.py", "hits": 2,
+     "matches": [{"line": 12, "text": "..."}]}
+
+pattern_id is the index into the audit's discovery.code_patterns list.
+Pattern types follow audits/schema/AUDIT-TEMPLATE-BLANK.yaml: regex is used
+as-is, keyword is a case-insensitive literal alternation (a|b), and ast
+needs an agent, so it is reported as unevaluated and never scanned.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .corpus import AuditRepo, read_ids
+
+try:
+    from re import _constants as _C, _parser as _sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants as _C
+    import sre_parse as _sre_parse
+
+# Directories never worth walking for evidence
+PRUNE_DIRS = {
+    ".git", ".hg", ".svn", "node_modules", "__pycache__", ".venv", "venv",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache", ".next",
+    ".cache", ".state", ".outputs", ".logs",
+}
+
+MAX_FILE_BYTES = 1024 * 1024      # skip larger files
+BINARY_SNIFF_BYTES = 8192
+MAX_MATCHES = 5                   # line snippets kept per (file, pattern)
+SNIPPET_CHARS = 160
+MIN_LITERAL = 3                   # shortest literal worth prefiltering on
+PREFILTER_WINDOW = 64 * 1024      # bytes lower-cased at a time for the prefilter
+BATCH_FILES = 64                  # files per worker task
+MIN_PARALLEL_FILES = 256          # below this, scan in-process
+
+SOURCE_EXTS = {
+    ".py", ".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs", ".go", ".rs", ".java",
+    ".kt", ".kts", ".scala", ".rb", ".php", ".cs", ".c", ".h", ".cc", ".cpp",
+    ".hpp", ".swift", ".m", ".mm", ".ex", ".exs", ".erl", ".clj", ".hs", ".ml",
+    ".lua", ".pl", ".r", ".jl", ".dart", ".sol", ".vue", ".svelte", ".sh",
+    ".bash", ".zsh", ".ps1", ".sql", ".graphql", ".proto", ".html", ".css",
+    ".scss", ".sass", ".less",
+}
+CONFIG_EXTS = {
+    ".yaml", ".yml", ".json", ".toml", ".ini", ".cfg", ".conf", ".env",
+    ".properties", ".xml", ".tf", ".tfvars", ".hcl", ".gradle", ".lock",
+}
+CONFIG_NAMES = {
+    "dockerfile", "makefile", "procfile", "jenkinsfile", "vagrantfile",
+    "codeowners", ".env", ".gitignore", ".dockerignore", ".editorconfig",
+}
+DOC_EXTS = {".md", ".rst", ".txt", ".adoc", ".org"}
+
+# code_patterns[].scope -> file kinds it applies to (unlisted scopes: any text file)
+SCOPE_KINDS = {
+    "source": {"source"}, "code": {"source"}, "comments": {"source"},
+    "scripts": {"source"}, "identifiers": {"source"}, "strings": {"source"},
+    "config": {"config"}, "configuration": {"config"}, "env_vars": {"config"},
+    "docs": {"docs"}, "documentation": {"docs"},
+    "test": {"test"}, "testing": {"test"},
+}
+
+_TEST_PATH = re.compile(r"(^|/)(tests?|__tests__|spec)/|(^|/)test_[^/]*$|_test\.[^/]+$|\.(spec|test)\.[^/]+$")
+
+_NEWLINE = re.compile(b"\n")
+
+
+def walk_project(root: Path) -> Iterator[str]:
+    """Yield project-relative file paths (POSIX separators), pruning vendored/VCS dirs."""
+    root_str = str(root)
+    for dirpath, dirnames, filenames in os.walk(root_str):
+        dirnames[:] = sorted(d for d in dirnames if d not in PRUNE_DIRS)
+        rel_dir = os.path.relpath(dirpath, root_str)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        for name in sorted(filenames):
+            yield prefix + name
+
+
+def file_kinds(rel_path: str) -> frozenset[str]:
+    """Classify a project-relative path as source/config/docs/test."""
+    name = rel_path.rsplit("/", 1)[-1].lower()
+    ext = os.path.splitext(name)[1]
+    kinds = set()
+    if ext in SOURCE_EXTS:
+        kinds.add("source")
+    if ext in CONFIG_EXTS or name in CONFIG_NAMES or name.startswith("dockerfile"):
+        kinds.add("config")
+    if ext in DOC_EXTS:
+        kinds.add("docs")
+    if _TEST_PATH.search(rel_path):
+        kinds.add("test")
+    return frozenset(kinds)
+
+
+@dataclass(frozen=True)
+class PatternSpec:
+    """One discovery.code_patterns entry, addressable as (audit_id, pattern_id)."""
+    audit_id: str
+    pattern_id: int
+    pattern: str
+    type: str
+    scope: str
+
+    @property
+    def kinds(self) -> frozenset[str] | None:
+        kinds = SCOPE_KINDS.get(self.scope)
+        return frozenset(kinds) if kinds else None
+
+    def source(self) -> bytes | None:
+        """Regex source with the type's flags scoped inline; None if not evaluable."""
+        if self.type == "keyword":
+            words = [re.escape(w.strip()) for w in self.pattern.split("|") if w.strip()]
+            return ("(?i:" + "|".join(words) + ")").encode() if words else None
+        if self.type in ("regex", ""):
+            return b"(?m:" + self.pattern.encode() + b")"
+        return None
+
+    def compile(self) -> re.Pattern | None:
+        source = self.source()
+        if source is None:
+            return None
+        try:
+            return re.compile(source)
+        except re.error:
+            pass
+        if self.type == "regex":
+            # Patterns carrying their own global flags, e.g. (?i)foo
+            try:
+                return re.compile(self.pattern.encode(), re.MULTILINE)
+            except re.error:
+                pass
+        return None
+
+
+def code_pattern_specs(audit_id: str, data: dict[str, Any]) -> list[PatternSpec]:
+    """PatternSpecs for every code_patterns entry of a parsed audit YAML."""
+    discovery = data.get("discovery") or {}
+    if not isinstance(discovery, dict):
+        return []
+    specs = []
+    for i, entry in enumerate(discovery.get("code_patterns") or []):
+        if not isinstance(entry, dict) or not isinstance(entry.get("pattern"), str):
+            continue
+        specs.append(PatternSpec(
+            audit_id=audit_id,
+            pattern_id=i,
+            pattern=entry["pattern"],
+            type=str(entry.get("type") or "regex"),
+            scope=str(entry.get("scope") or "all"),
+        ))
+    return specs
+
+
+def _better(a: set[bytes] | None, b: set[bytes] | None) -> set[bytes] | None:
+    """Prefer the literal set whose shortest member is longest, then the smaller set."""
+    if a is None or b is None:
+        return b if a is None else a
+    return a if (min(map(len, a)), -len(a)) >= (min(map(len, b)), -len(b)) else b
+
+
+def _required(items) -> set[bytes] | None:
+    """Literal set of which at least one must occur for the parsed items to match."""
+    best = None
+    run = bytearray()
+    for op, av in items:
+        if op is _C.LITERAL:
+            run.append(av)
+            continue
+        if run:
+            best = _better(best, {bytes(run)})
+            run = bytearray()
+        if op is _C.SUBPATTERN:
+            candidate = _required(av[3])
+        elif op is _C.ATOMIC_GROUP:
+            candidate = _required(av)
+        elif op is _C.BRANCH:
+            alternatives = [_required(branch) for branch in av[1]]
+            candidate = (None if any(alt is None for alt in alternatives)
+                         else set().union(*alternatives))
+        elif op in (_C.MAX_REPEAT, _C.MIN_REPEAT, _C.POSSESSIVE_REPEAT):
+            candidate = _required(av[2]) if av[0] >= 1 else None
+        else:
+            candidate = None
+        best = _better(best, candidate)
+    if run:
+        best = _better(best, {bytes(run)})
+    return best
+
+
+def required_literals(regex: re.Pattern) -> set[bytes] | None:
+    """Lower-cased literals, one of which must appear in any text regex matches.
+
+    None when no literal of at least MIN_LITERAL bytes is implied; such
+    patterns are run against every applicable file.
+    """
+    try:
+        literals = _required(_sre_parse.parse(regex.pattern, regex.flags))
+    except Exception:  # private parser API: never let it break scanning
+        return None
+    if not literals or min(map(len, literals)) < MIN_LITERAL:
+        return None
+    return {lit.lower() for lit in literals}
+
+
+def literal_trie_regex(literals: Iterable[bytes]) -> re.Pattern:
+    """One regex matching the longest of the (lower-case) literals at a position.
+
+    The alternation is factored into a trie, so each position costs a
+    branch on the next byte rather than a try of every literal. It is
+    case-sensitive and meant for lower-cased text: IGNORECASE, or a
+    lookahead wrapper to get overlapping hits from findall, keeps re from
+    skipping ahead to the trie's possible first bytes and made it several
+    times slower.
+    """
+    trie: dict = {}
+    for lit in literals:
+        node = trie
+        for byte in lit:
+            node = node.setdefault(byte, {})
+        node[-1] = True
+
+    def emit(node: dict) -> bytes:
+        alternatives = [re.escape(bytes([byte])) + emit(child)
+                        for byte, child in sorted(node.items()) if byte != -1]
+        if not alternatives:
+            return b""
+        body = alternatives[0] if len(alternatives) == 1 else b"(?:" + b"|".join(alternatives) + b")"
+        return b"(?:" + body + b")?" if -1 in node else body
+
+    return re.compile(emit(trie))
+
+
+def literals_in(prefilter: re.Pattern, data, longest: int,
+                window: int = PREFILTER_WINDOW) -> set[bytes]:
+    """Every literal of a literal_trie_regex occurring in data (any case), overlaps included.
+
+    data (bytes or an mmap) is lower-cased one window at a time, so a mapped
+    file is never copied whole; windows overlap by longest - 1 bytes so a
+    literal across a boundary is still found. Within a window, one search
+    per occurrence, resuming one byte after its start; a window without any
+    literal costs a single search.
+    """
+    found = set()
+    search = prefilter.search
+    size = len(data)
+    for start in range(0, size, window):
+        text = data[start:min(size, start + window + longest - 1)].lower()
+        match = search(text)
+        while match is not None:
+            found.add(match.group())
+            match = search(text, match.start() + 1)
+    return found
+
+
+class Matcher:
+    """Compiled code patterns plus a combined literal prefilter; scans one file at a time.
+
+    Patterns are split into two groups. Gated patterns imply required
+    literals; their literals are compiled together into a single trie regex.
+    Searching the file with it, lower-cased window by window (literals_in),
+    tells which gated patterns can possibly match, and only those run.
+    Ungated patterns (too short or no literal) run on every file their scope
+    applies to.
+    """
+
+    def __init__(self, specs: Iterable[PatternSpec]):
+        self.entries: list[tuple[re.Pattern, PatternSpec]] = []
+        self.unevaluated: list[PatternSpec] = []
+        self._ungated: list[int] = []
+        # literal -> entries it (or any literal that is its prefix) gates
+        self._triggers: dict[bytes, list[int]] = defaultdict(list)
+        self._applicable: dict[frozenset[str], tuple[set[int], bool]] = {}
+
+        for spec in specs:
+            regex = spec.compile()
+            if regex is None:
+                self.unevaluated.append(spec)
+                continue
+            index = len(self.entries)
+            self.entries.append((regex, spec))
+            literals = required_literals(regex)
+            if literals is None:
+                self._ungated.append(index)
+            else:
+                for lit in literals:
+                    self._triggers[lit].append(index)
+
+        # The trie reports only the longest literal at a position, so a hit
+        # on "foobar" must also trigger patterns gated on "foo"
+        literals = sorted(self._triggers)
+        for lit in literals:
+            for i in range(MIN_LITERAL, len(lit)):
+                shorter = self._triggers.get(lit[:i])
+                if shorter:
+                    self._triggers[lit] = self._triggers[lit] + shorter
+        self._prefilter = literal_trie_regex(literals) if literals else None
+        self._longest = max(map(len, literals), default=0)
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def applicable(self, kinds: frozenset[str]) -> tuple[set[int], bool]:
+        """(entry indices whose scope applies to these file kinds, any of them gated?)"""
+        cached = self._applicable.get(kinds)
+        if cached is None:
+            indices = {i for i, (_, spec) in enumerate(self.entries)
+                       if spec.kinds is None or spec.kinds & kinds}
+            cached = (indices, bool(indices.difference(self._ungated)))
+            self._applicable[kinds] = cached
+        return cached
+
+    def scan_file(self, root: str, rel_path: str, max_bytes: int = MAX_FILE_BYTES,
+                  max_matches: int = MAX_MATCHES) -> list[dict]:
+        """Hit records for one file; [] for binaries, oversized or unreadable files."""
+        applicable, gated = self.applicable(file_kinds(rel_path))
+        if not applicable:
+            return []
+        try:
+            with open(os.path.join(root, rel_path), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0 or size > max_bytes:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if data.find(b"\0", 0, BINARY_SNIFF_BYTES) != -1:
+                        return []
+                    candidates = applicable.intersection(self._ungated)
+                    if gated:
+                        for lit in literals_in(self._prefilter, data, self._longest):
+                            candidates.update(self._triggers[lit])
+                        candidates &= applicable
+                    return self._scan(data, rel_path, sorted(candidates), max_matches)
+        except (OSError, ValueError):
+            return []
+
+    def _scan(self, data, rel_path: str, candidates: list[int], max_matches: int) -> list[dict]:
+        records = []
+        lines = _LineIndex(data)
+        for index in candidates:
+            regex, spec = self.entries[index]
+            hits = 0
+            matches = []
+            for m in regex.finditer(data):
+                if m.end() == m.start():
+                    continue  # zero-width matches are not evidence
+                hits += 1
+                if len(matches) < max_matches:
+                    matches.append(lines.snippet(m.start()))
+            if hits:
+                records.append({
+                    "audit_id": spec.audit_id,
+                    "pattern_id": spec.pattern_id,
+                    "file": rel_path,
+                    "hits": hits,
+                    "matches": matches,
+                })
+        return records
+
+
+class _LineIndex:
+    """Newline offsets of a mapped file, built on first use."""
+
+    __slots__ = ("data", "newlines")
+
+    def __init__(self, data):
+        self.data = data
+        self.newlines: list[int] | None = None
+
+    def snippet(self, pos: int) -> dict:
+        if self.newlines is None:
+            self.newlines = [m.start() for m in _NEWLINE.finditer(self.data)]
+        line = bisect_left(self.newlines, pos)
+        start = self.newlines[line - 1] + 1 if line else 0
+        end = self.newlines[line] if line < len(self.newlines) else len(self.data)
+        text = self.data[start:min(end, start + SNIPPET_CHARS * 4)].decode("utf-8", errors="replace")
+        return {"line": line + 1, "text": text.strip()[:SNIPPET_CHARS]}
+
+
+# Worker process state, set once per process by _init_worker
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(specs: list[PatternSpec], root: str, max_bytes: int, max_matches: int):
+    _worker.update(matcher=Matcher(specs), root=root, max_bytes=max_bytes, max_matches=max_matches)
+
+
+def _scan_batch(rel_paths: list[str]) -> list[dict]:
+    matcher = _worker["matcher"]
+    records = []
+    for rel_path in rel_paths:
+        records.extend(matcher.scan_file(_worker["root"], rel_path,
+                                         _worker["max_bytes"], _worker["max_matches"]))
+    return records
+
+
+def _batches(paths: list[str], size: int) -> Iterator[list[str]]:
+    for start in range(0, len(paths), size):
+        yield paths[start:start + size]
+
+
+def scan(project: Path, rel_paths: Iterable[str], specs: list[PatternSpec],
+         jobs: int | None = None, max_bytes: int = MAX_FILE_BYTES,
+         max_matches: int = MAX_MATCHES) -> Iterator[dict]:
+    """Scan files for all specs, yielding hit records as batches complete.
+
+    jobs=None uses every CPU; small file sets are scanned in-process since
+    pool start-up would dominate.
+    """
+    root = str(project)
+    paths = list(rel_paths)
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs <= 1 or len(paths) < MIN_PARALLEL_FILES:
+        matcher = Matcher(specs)
+        if not matcher:
+            return
+        for rel_path in paths:
+            yield from matcher.scan_file(root, rel_path, max_bytes, max_matches)
+        return
+
+    with Pool(jobs, initializer=_init_worker,
+              initargs=(specs, root, max_bytes, max_matches)) as pool:
+        for records in pool.imap_unordered(_scan_batch, _batches(paths, BATCH_FILES)):
+            yield from records
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine scan",
+                                     description="Scan a project for audits' code_patterns")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--project", default=".", help="Project root to scan (default: cwd)")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-bytes", type=int, default=MAX_FILE_BYTES,
+                        help=f"Skip files larger than this (default: {MAX_FILE_BYTES})")
+    parser.add_argument("--ids-file", help="Newline-separated audit IDs (- for stdin)")
+    parser.add_argument("ids", nargs="*", help="Audit IDs")
+    args = parser.parse_args(argv)
+
+    t0 = time.monotonic()
+    repo = AuditRepo(args.repo)
+    specs = []
+    for audit_id in read_ids(args.ids, args.ids_file):
+        data = repo.load_audit(audit_id)
+        if data is None:
+            print(f"Warning: audit not found: {audit_id}", file=sys.stderr)
+            continue
+        specs.extend(code_pattern_specs(audit_id, data))
+
+    project = Path(args.project)
+    paths = list(walk_project(project))
+    records = 0
+    try:
+        for record in scan(project, paths, specs, args.jobs or None, args.max_bytes):
+            print(json.dumps(record), flush=True)
+            records += 1
+    except BrokenPipeError:
+        # Consumer stopped reading (e.g. piped into head)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+
+    print(f"Scanned {len(paths)} files for {len(specs)} patterns: {records} hit records "
+          f"in {time.monotonic() - t0:.2f}s", file=sys.stderr)
+    return 0
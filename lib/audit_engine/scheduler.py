@@ -0,0 +1,303 @@
+"""
+Adaptive audit scheduler.
+
+Decides which unit (one audit, or a batch of audits sharing an agent
+session) lib/audit.sh launches next and how many run at once.
+bash keeps running the agents; the scheduler only talks to it over a
+line protocol, so there is no polling on either side:
+
+    stdout (to bash)         launch IDX        start unit IDX now
+                             done IDX          unit IDX finished, collect it
+                             info TEXT         status line to display
+                             finish JSON       all audits done; run statistics
+    stdin (from the audits)  IDX KIND SECONDS  completion event, KIND one of
+                                               ok | error | throttled | local
+                             quit              stop early (caller gave up)
+
+Order: longest estimated audits first (estimated_duration from the
+inventory), weighted by severity. With independent jobs this
+longest-processing-time order keeps phase wall time close to the longest
+single audit instead of leaving it for last.
+
+Dependencies (--graph, the output of `audit_engine graph`): a unit is
+launched only once every unit holding one of its upstream audits is done,
+so downstream audits can be given upstream results. Priority then is the
+unit's own weight plus the heaviest chain of units waiting on it (critical
+path first); independent units still run concurrently. Should batching
+put two units on a cycle, the highest-priority waiting unit is released
+rather than stalling the run.
+
+Concurrency (adaptive mode) is AIMD, the way TCP treats a shared link:
+    +1 slot per window of clean completions, up to --max
+    x0.5 on a rate-limit or provider error, at most once per window (audits
+         already in flight when the limit dropped do not count again)
+    hold (no increase) while observed latency, relative to the audit's
+         estimate, is inflated over the warm-up baseline
+Completions with KIND local (cached or skipped, no agent run) carry no
+provider signal and are ignored.
+
+Usage:
+    python3 -m audit_engine schedule --repo AUDITS_REPO --ids-file UNITS_FILE
+        [--parallel N] [--max N] [--mode adaptive|fixed] [--discovery-dir DIR]
+        [--graph GRAPH_JSON]
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from .corpus import AuditRepo
+
+DEFAULT_ESTIMATE = 2.5 * 3600     # seconds; median of the inventory
+SEVERITY_WEIGHT = {"critical": 2.0, "high": 1.5, "medium": 1.0, "low": 0.75}
+NO_EVIDENCE_FACTOR = 0.25         # downgraded audits (discovery verdict none) run short
+
+DECREASE = 0.5
+LATENCY_WARMUP = 3                # clean completions that set the latency baseline
+LATENCY_INFLATION = 2.0           # hold increases above this multiple of the baseline
+LATENCY_SMOOTHING = 0.3           # EWMA weight of the newest sample
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?\s*(min|h|hour|day|week)", re.I)
+_UNIT_SECONDS = {"min": 60, "h": 3600, "hour": 3600, "day": 8 * 3600, "week": 40 * 3600}
+
+
+def parse_duration(text: str) -> float | None:
+    """'2-3 hours' -> 9000.0 (midpoint, seconds); None if unparseable."""
+    m = _DURATION.search(text or "")
+    if not m:
+        return None
+    low = float(m.group(1))
+    high = float(m.group(2)) if m.group(2) else low
+    return (low + high) / 2 * _UNIT_SECONDS[m.group(3).lower()]
+
+
+@dataclass
+class Job:
+    index: int
+    audit_id: str
+    severity: str
+    estimate: float
+    launch_seq: int = 0
+    after: frozenset[int] = frozenset()   # units that must finish first
+    rank: float = 0.0                     # priority plus the heaviest chain waiting on this unit
+
+    @property
+    def priority(self) -> float:
+        return self.estimate * SEVERITY_WEIGHT.get(self.severity, 1.0)
+
+
+def build_jobs(repo: AuditRepo, units: list[list[str]], discovery_dir: Path | None = None,
+               upstream: dict[str, list[str]] | None = None) -> list[Job]:
+    """Jobs in launch order: highest rank first, ties in recommendation order.
+
+    A unit is one agent session: a single audit, or a batch (see batching.py)
+    estimated at its summed duration and its most severe member. upstream
+    maps audit IDs to the audits that must finish before them.
+    """
+    jobs = []
+    for index, audit_ids in enumerate(units):
+        estimate = 0.0
+        severity = ""
+        for audit_id in audit_ids:
+            row = repo.inventory.get(audit_id) or {}
+            seconds = parse_duration(row.get("estimated_duration", "")) or DEFAULT_ESTIMATE
+            if discovery_dir and _verdict(discovery_dir, audit_id) == "none":
+                seconds *= NO_EVIDENCE_FACTOR
+            estimate += seconds
+            member = (row.get("severity") or "").lower()
+            if SEVERITY_WEIGHT.get(member, 1.0) > SEVERITY_WEIGHT.get(severity, 1.0):
+                severity = member
+        jobs.append(Job(index, " ".join(audit_ids), severity, estimate or DEFAULT_ESTIMATE))
+    if upstream:
+        _link(jobs, units, upstream)
+    for job in jobs:
+        job.rank = job.rank or job.priority
+    return sorted(jobs, key=lambda j: (-j.rank, j.index))
+
+
+def _link(jobs: list[Job], units: list[list[str]], upstream: dict[str, list[str]]):
+    """Set each job's upstream units and its critical-path rank."""
+    unit_of: dict[str, set[int]] = {}
+    for index, audit_ids in enumerate(units):
+        for audit_id in audit_ids:
+            unit_of.setdefault(audit_id, set()).add(index)
+    waiting: dict[int, set[int]] = {job.index: set() for job in jobs}
+    for job, audit_ids in zip(jobs, units):
+        after = {u for a in audit_ids for up in upstream.get(a, ()) for u in unit_of.get(up, ())}
+        after.discard(job.index)
+        job.after = frozenset(after)
+        for u in after:
+            waiting[u].add(job.index)
+
+    by_index = {job.index: job for job in jobs}
+    visiting: set[int] = set()
+
+    def rank(index: int) -> float:
+        job = by_index[index]
+        if not job.rank:
+            visiting.add(index)
+            # A unit-level cycle (batching) is cut where it closes
+            job.rank = job.priority + max((rank(w) for w in waiting[index] if w not in visiting), default=0.0)
+            visiting.discard(index)
+        return job.rank
+
+    for job in jobs:
+        rank(job.index)
+
+
+def _verdict(discovery_dir: Path, audit_id: str) -> str:
+    try:
+        return json.loads((discovery_dir / f"{audit_id}.json").read_text(encoding="utf-8")).get("verdict", "")
+    except (OSError, ValueError):
+        return ""
+
+
+class AimdController:
+    """Additive-increase / multiplicative-decrease concurrency limit."""
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int | None = None,
+                 adaptive: bool = True):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum or initial)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.adaptive = adaptive
+        self.launches = 0
+        self.recovery_seq = 0
+        self.decreases = 0
+        self.peak = int(self.limit)
+        self._samples: list[float] = []
+        self._baseline = 0.0
+        self._latency = 0.0
+
+    @property
+    def slots(self) -> int:
+        return int(self.limit)
+
+    def launched(self, job: Job):
+        self.launches += 1
+        job.launch_seq = self.launches
+
+    def completed(self, job: Job, kind: str, seconds: float):
+        if not self.adaptive or kind == "local":
+            return
+        if kind in ("error", "throttled"):
+            # Only the first signal of a window counts; the rest were in flight at the old limit
+            if job.launch_seq > self.recovery_seq and self.limit > self.minimum:
+                self.limit = max(float(self.minimum), self.limit * DECREASE)
+                self.recovery_seq = self.launches
+                self.decreases += 1
+            return
+        if not self._latency_inflated(seconds / max(job.estimate, 1.0)):
+            self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            self.peak = max(self.peak, self.slots)
+
+    def _latency_inflated(self, ratio: float) -> bool:
+        if len(self._samples) < LATENCY_WARMUP:
+            self._samples.append(ratio)
+            self._baseline = self._latency = sum(self._samples) / len(self._samples)
+            return False
+        self._latency += LATENCY_SMOOTHING * (ratio - self._latency)
+        return self._latency > LATENCY_INFLATION * self._baseline
+
+    def stats(self) -> dict:
+        return {"final": self.slots, "peak": self.peak, "decreases": self.decreases}
+
+
+def _emit(line: str):
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+def run(jobs: list[Job], controller: AimdController, events=None) -> dict:
+    """Drive the launch/done protocol until every job has completed."""
+    events = events or sys.stdin
+    pending = list(jobs)
+    running: dict[int, Job] = {}
+    finished: set[int] = set()
+    throttled = errors = held = 0
+
+    def next_job() -> Job | None:
+        for position, job in enumerate(pending):
+            if job.after <= finished:
+                return pending.pop(position)
+        # Everything left waits on a unit that cannot finish first (cycle): release one
+        return pending.pop(0) if pending and not running else None
+
+    def fill():
+        nonlocal held
+        while pending and len(running) < controller.slots:
+            job = next_job()
+            if job is None:
+                held += 1
+                break
+            running[job.index] = job
+            controller.launched(job)
+            _emit(f"launch {job.index}")
+
+    fill()
+    while running:
+        line = events.readline()
+        if not line or line.strip() == "quit":
+            break
+        parts = line.split()
+        try:
+            index, kind, seconds = int(parts[0]), parts[1], float(parts[2])
+        except (IndexError, ValueError):
+            continue
+        job = running.pop(index, None)
+        if job is None:
+            continue
+        finished.add(index)
+        _emit(f"done {index}")
+        throttled += kind == "throttled"
+        errors += kind == "error"
+        before = controller.slots
+        controller.completed(job, kind, seconds)
+        if controller.slots < before:
+            _emit(f"info Scheduler: {kind} — concurrency {before} → {controller.slots}")
+        fill()
+
+    return {**controller.stats(), "throttled": throttled, "errors": errors,
+            "dependencies": sum(len(job.after) for job in jobs), "held": held,
+            "unfinished": len(running) + len(pending)}
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine schedule",
+                                     description="Adaptive audit scheduler (line protocol on stdin/stdout)")
+    parser.add_argument("--repo", required=True, help="Audits repository root")
+    parser.add_argument("--ids-file", required=True,
+                        help="One unit per line: audit ID(s) of one agent session, index = line")
+    parser.add_argument("--parallel", type=int, default=5, help="Initial concurrency (default: 5)")
+    parser.add_argument("--max", type=int, default=0, help="Concurrency ceiling (default: --parallel)")
+    parser.add_argument("--mode", choices=["adaptive", "fixed"], default="adaptive")
+    parser.add_argument("--discovery-dir", help="Discovery manifests; zero-evidence audits are estimated short")
+    parser.add_argument("--graph", help="Run plan of `audit_engine graph`; units wait for their upstream units")
+    args = parser.parse_args(argv)
+
+    if args.ids_file == "-":
+        parser.error("--ids-file must be a file; stdin carries completion events")
+    # One unit per line (space-separated IDs), duplicates kept: the line number is the job index bash uses
+    units = [line.split() for line in Path(args.ids_file).read_text(encoding="utf-8").splitlines()]
+    repo = AuditRepo(args.repo)
+    upstream = None
+    if args.graph:
+        try:
+            upstream = json.loads(Path(args.graph).read_text(encoding="utf-8")).get("upstream")
+        except (OSError, ValueError):
+            upstream = None
+    jobs = build_jobs(repo, units, Path(args.discovery_dir) if args.discovery_dir else None, upstream)
+    controller = AimdController(args.parallel, maximum=args.max or args.parallel,
+                                adaptive=args.mode == "adaptive")
+
+    try:
+        order = "dependencies first, then longest/critical" if upstream else "longest/critical audits first"
+        _emit(f"info Scheduler: {args.mode}, {controller.slots}–{controller.maximum} concurrent, {order}")
+        stats = run(jobs, controller)
+        _emit("finish " + json.dumps({"mode": args.mode, "initial": args.parallel, **stats}))
+    except BrokenPipeError:
+        sys.stderr.close()  # caller stopped reading
+    return 0
@@ -0,0 +1,341 @@
+"""
+Project-context snapshot shared by every audit agent of a phase.
+
+Each agent used to start by exploring the repository with its tools
+(listing directories, reading package manifests) before it could check a
+single signal. The snapshot does that exploration once: layout by
+top-level directory, languages, manifests and their dependencies, entry
+points and the largest files, as compact markdown that opens every audit
+prompt.
+
+Inside git the snapshot covers tracked and untracked files but not ignored
+ones, so generated artifacts (build output, local databases) neither top
+the largest files nor inflate the totals.
+
+Snapshots are cached by the project's git tree hash plus the working-tree
+status and the size and mtime of every changed file, so repeated phases on
+an unchanged checkout reuse it without walking the tree. Outside git, the
+key is the file listing (paths and sizes, see cache.py).
+
+Usage:
+    python3 -m audit_engine context --project DIR --cache-dir DIR
+
+Writes CACHE_DIR/<key>.md and prints {"key", "path", "cached", "tokens"}.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import stat
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: no TOML manifests
+    tomllib = None
+
+from .cache import Fingerprinter
+from .prompt import estimate_tokens
+from .scanner import PRUNE_DIRS, walk_project
+
+SNAPSHOT_VERSION = "3"
+
+MAX_DIRS = 20
+MAX_LANGUAGES = 10
+MAX_MANIFESTS = 25
+MAX_DEP_MANIFESTS = 8             # shallowest manifests whose dependencies are listed
+MAX_DEPS = 40                     # per manifest
+MAX_ENTRY_POINTS = 15
+MAX_LARGEST = 8
+
+LANGUAGES = {
+    ".py": "Python", ".js": "JavaScript", ".jsx": "JavaScript", ".mjs": "JavaScript",
+    ".cjs": "JavaScript", ".ts": "TypeScript", ".tsx": "TypeScript", ".go": "Go",
+    ".rs": "Rust", ".java": "Java", ".kt": "Kotlin", ".kts": "Kotlin", ".scala": "Scala",
+    ".rb": "Ruby", ".php": "PHP", ".cs": "C#", ".c": "C", ".h": "C/C++ header",
+    ".cc": "C++", ".cpp": "C++", ".hpp": "C++", ".swift": "Swift", ".m": "Objective-C",
+    ".ex": "Elixir", ".exs": "Elixir", ".erl": "Erlang", ".clj": "Clojure",
+    ".hs": "Haskell", ".lua": "Lua", ".pl": "Perl", ".r": "R", ".dart": "Dart",
+    ".sol": "Solidity", ".vue": "Vue", ".svelte": "Svelte", ".sh": "Shell",
+    ".bash": "Shell", ".zsh": "Shell", ".ps1": "PowerShell", ".sql": "SQL",
+    ".tf": "Terraform", ".hcl": "HCL", ".html": "HTML", ".css": "CSS", ".scss": "CSS",
+    ".proto": "Protobuf", ".graphql": "GraphQL", ".yaml": "YAML", ".yml": "YAML",
+    ".md": "Markdown",
+}
+
+MANIFESTS = {
+    "package.json": "npm", "pyproject.toml": "python", "setup.py": "python",
+    "requirements.txt": "pip", "Pipfile": "pipenv", "Cargo.toml": "cargo",
+    "go.mod": "go", "pom.xml": "maven", "build.gradle": "gradle",
+    "build.gradle.kts": "gradle", "Gemfile": "bundler", "composer.json": "composer",
+    "mix.exs": "mix", "pubspec.yaml": "dart", "CMakeLists.txt": "cmake",
+    "Makefile": "make", "Dockerfile": "docker", "docker-compose.yml": "compose",
+    "docker-compose.yaml": "compose", "compose.yaml": "compose", "Chart.yaml": "helm",
+    "serverless.yml": "serverless", "main.tf": "terraform",
+}
+
+ENTRY_NAMES = {
+    "main.py", "__main__.py", "app.py", "manage.py", "wsgi.py", "asgi.py", "server.py",
+    "index.js", "index.ts", "main.js", "main.ts", "server.js", "server.ts", "app.js",
+    "app.ts", "main.go", "main.rs", "Main.java", "Application.java", "Program.cs",
+    "main.c", "main.cpp", "main.swift", "main.dart",
+}
+
+_GO_CMD = re.compile(r"(^|/)cmd/[^/]+/main\.go$")
+_REQ_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_GEM = re.compile(r"""^\s*gem\s+['"]([^'"]+)""", re.M)
+_GO_REQUIRE = re.compile(r"^\s*(?:require\s+)?([a-z0-9.-]+\.[a-z]+/\S+)\s+v\S+", re.M)
+
+
+def _size(n: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return ""
+
+
+def _git(project: Path, *args: str) -> str | None:
+    try:
+        out = subprocess.run(["git", "-C", str(project), *args], capture_output=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.decode("utf-8", "replace") if out.returncode == 0 else None
+
+
+def _dirty_stamps(top: Path, status: str) -> str:
+    """Each path of a `git status --porcelain -z` listing with its size and mtime.
+
+    The status alone names the modified files, not their contents, so a
+    file edited again after it was first modified would keep the key.
+    """
+    stamps = []
+    entries = iter(status.split("\0"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        if entry[0] in "RC":
+            next(entries, None)  # rename/copy source
+        try:
+            st = os.stat(top / entry[3:])
+            stamp = f"{st.st_size}:{st.st_mtime_ns}"
+        except OSError:
+            stamp = "-"
+        stamps.append(f"{entry}\0{stamp}")
+    return "\n".join(stamps)
+
+
+def snapshot_key(project: Path) -> tuple[str, str | None]:
+    """(cache key, git tree hash or None outside git)."""
+    tree = _git(project, "rev-parse", "HEAD:./")
+    top = _git(project, "rev-parse", "--show-toplevel") if tree else None
+    status = (_git(project, "status", "--porcelain", "-z", "--untracked-files=all", "--", ".")
+              if top else None)
+    h = hashlib.sha256(f"v{SNAPSHOT_VERSION}\n".encode())
+    if tree is not None and top is not None and status is not None:
+        tree = tree.strip()
+        h.update(f"{tree}\n{_dirty_stamps(Path(top.strip()), status)}".encode())
+        return h.hexdigest()[:32], tree
+    h.update(Fingerprinter(project).listing(walk_project(project)).encode())
+    return h.hexdigest()[:32], None
+
+
+def _read(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return ""
+
+
+def _toml(path: Path) -> dict:
+    if tomllib is None:
+        return {}
+    try:
+        return tomllib.loads(_read(path))
+    except tomllib.TOMLDecodeError:
+        return {}
+
+
+def manifest_details(path: Path, rel_path: str) -> tuple[list[str], list[str]]:
+    """(dependency names, entry points) declared by one manifest."""
+    name = path.name
+    deps: list[str] = []
+    entries: list[str] = []
+    if name in ("package.json", "composer.json"):
+        try:
+            data = json.loads(_read(path))
+        except ValueError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        for section in ("dependencies", "devDependencies", "require", "require-dev"):
+            deps.extend((data.get(section) or {}).keys())
+        if isinstance(data.get("main"), str):
+            entries.append(f"{rel_path} main: {data['main']}")
+        bins = data.get("bin")
+        if isinstance(bins, str):
+            entries.append(f"{rel_path} bin: {bins}")
+        elif isinstance(bins, dict):
+            entries.extend(f"{rel_path} bin {k}: {v}" for k, v in bins.items())
+        scripts = data.get("scripts") or {}
+        for script in ("start", "serve", "dev"):
+            if isinstance(scripts.get(script), str):
+                entries.append(f"{rel_path} scripts.{script}: {scripts[script]}")
+    elif name == "requirements.txt":
+        for line in _read(path).splitlines():
+            m = _REQ_NAME.match(line)
+            if m and not line.lstrip().startswith(("#", "-")):
+                deps.append(m.group(1))
+    elif name == "pyproject.toml":
+        data = _toml(path)
+        project = data.get("project") or {}
+        for spec in project.get("dependencies") or []:
+            m = _REQ_NAME.match(spec)
+            if m:
+                deps.append(m.group(1))
+        poetry = (data.get("tool") or {}).get("poetry") or {}
+        deps.extend(k for k in (poetry.get("dependencies") or {}) if k != "python")
+        for script, target in (project.get("scripts") or poetry.get("scripts") or {}).items():
+            entries.append(f"{rel_path} script {script}: {target}")
+    elif name == "Cargo.toml":
+        data = _toml(path)
+        deps.extend((data.get("dependencies") or {}).keys())
+    elif name == "go.mod":
+        deps.extend(_GO_REQUIRE.findall(_read(path)))
+    elif name == "Gemfile":
+        deps.extend(_GEM.findall(_read(path)))
+    return list(dict.fromkeys(deps)), entries
+
+
+def project_files(project: Path, tree: str | None = None) -> Iterable[str]:
+    """Files to describe: inside git (tree given) those not ignored, else all walk_project yields."""
+    listing = _git(project, "ls-files", "-co", "--exclude-standard", "-z") if tree else None
+    if listing is None:
+        return walk_project(project)
+    return sorted(p for p in listing.split("\0")
+                  if p and not PRUNE_DIRS.intersection(p.split("/")[:-1]))
+
+
+def build_snapshot(project: Path, tree: str | None = None) -> str:
+    files: list[tuple[str, int]] = []
+    for rel_path in project_files(project, tree):
+        try:
+            st = os.stat(project / rel_path)
+        except OSError:
+            continue  # deleted in the working tree
+        if stat.S_ISREG(st.st_mode):  # not a submodule
+            files.append((rel_path, st.st_size))
+
+    total = sum(size for _, size in files)
+    languages: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    dirs: dict[str, list] = defaultdict(lambda: [0, 0, Counter()])
+    manifests: list[str] = []
+    entry_points: list[str] = []
+
+    for rel_path, size in files:
+        base = rel_path.rsplit("/", 1)[-1]
+        ext = os.path.splitext(base)[1].lower()
+        language = LANGUAGES.get(ext)
+        if language:
+            languages[language][0] += 1
+            languages[language][1] += size
+
+        top = rel_path.split("/", 1)[0] + "/" if "/" in rel_path else "."
+        dirs[top][0] += 1
+        dirs[top][1] += size
+        if ext:
+            dirs[top][2][ext] += 1
+
+        if base in MANIFESTS or base.endswith(".csproj"):
+            manifests.append(rel_path)
+        # index.* is everywhere in JS trees; only near the top is it an entry point
+        if (base in ENTRY_NAMES and (not base.startswith("index.") or rel_path.count("/") <= 2)) \
+                or _GO_CMD.search(rel_path):
+            entry_points.append(rel_path)
+
+    depth = lambda p: (p.count("/"), p)  # noqa: E731 — shallowest first
+    manifests.sort(key=depth)
+    entry_points.sort(key=depth)
+
+    dependencies = []
+    for rel_path in manifests[:MAX_DEP_MANIFESTS]:
+        deps, entries = manifest_details(project / rel_path, rel_path)
+        entry_points.extend(entries)
+        if deps:
+            more = f" (+{len(deps) - MAX_DEPS} more)" if len(deps) > MAX_DEPS else ""
+            dependencies.append(f"- {rel_path}: {', '.join(deps[:MAX_DEPS])}{more}")
+
+    name = project.resolve().name
+    origin = f"git tree {tree[:12]}" if tree else "not a git checkout"
+    lines = [
+        "# Project Snapshot",
+        "",
+        f"{name} — {len(files)} files, {_size(total)} ({origin}). Pre-computed once for "
+        "all audits: use it instead of re-listing the tree or re-reading manifests.",
+        "",
+    ]
+
+    ranked = sorted(languages.items(), key=lambda kv: -kv[1][1])[:MAX_LANGUAGES]
+    if ranked:
+        lines.append("Languages: " + ", ".join(
+            f"{lang} {count} files ({_size(size)})" for lang, (count, size) in ranked))
+    if manifests:
+        shown = ", ".join(
+            f"{p} ({MANIFESTS.get(p.rsplit('/', 1)[-1], 'nuget')})" for p in manifests[:MAX_MANIFESTS])
+        more = f" (+{len(manifests) - MAX_MANIFESTS} more)" if len(manifests) > MAX_MANIFESTS else ""
+        lines.append(f"Manifests: {shown}{more}")
+    if entry_points:
+        lines.append("Entry points: " + "; ".join(entry_points[:MAX_ENTRY_POINTS]))
+    if dependencies:
+        lines += ["", "Dependencies:"] + dependencies
+
+    lines += ["", "Layout:"]
+    for top, (count, size, exts) in sorted(dirs.items(), key=lambda kv: -kv[1][0])[:MAX_DIRS]:
+        mix = ", ".join(f"{ext[1:]} {n}" for ext, n in exts.most_common(4))
+        lines.append(f"- {top} {count} files, {_size(size)}" + (f" — {mix}" if mix else ""))
+    if len(dirs) > MAX_DIRS:
+        lines.append(f"- (+{len(dirs) - MAX_DIRS} more top-level entries)")
+
+    largest = sorted(files, key=lambda f: -f[1])[:MAX_LARGEST]
+    if largest:
+        lines += ["", "Largest files: " + ", ".join(f"{p} ({_size(s)})" for p, s in largest)]
+
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine context",
+                                     description="Build (or reuse) the shared project-context snapshot")
+    parser.add_argument("--project", default=".", help="Project root (default: cwd)")
+    parser.add_argument("--cache-dir", required=True, help="Directory of cached snapshots")
+    args = parser.parse_args(argv)
+
+    project = Path(args.project)
+    cache_dir = Path(args.cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    key, tree = snapshot_key(project)
+    path = cache_dir / f"{key}.md"
+    cached = path.is_file()
+    if cached:
+        text = path.read_text(encoding="utf-8")
+    else:
+        text = build_snapshot(project, tree)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(path)
+        # Only the current tree's snapshot is worth keeping
+        for old in cache_dir.glob("*.md"):
+            if old != path:
+                old.unlink(missing_ok=True)
+
+    json.dump({"key": key, "path": str(path), "cached": cached, "tokens": estimate_tokens(text)},
+              sys.stdout)
+    print()
+    return 0
@@ -0,0 +1,197 @@
+"""
+Audit execution telemetry summarizer.
+
+Every audit of a phase run leaves one JSON line in the telemetry file
+(lib/audit.sh AUDIT_TELEMETRY; written by the collector, see collector.py):
+
+    {"ts", "run", "phase", "audit_id", "outcome", "cached", "parse", "problems",
+     and when an agent ran: "start", "end", "seconds", "provider", "model",
+     "max_turns", "max_turns_hit", "prompt_bytes", "response_bytes",
+     "est_tokens", "exit", "batch_size"}
+
+This turns the records into latency percentiles (p50/p95, nearest rank)
+per category and tier, outcome and parse-strategy counts, and a list of
+audits whose estimated_duration is badly off. A batched agent session's
+time is split evenly across its audits.
+
+Inventory estimates are human effort ("2-3 hours") while agents take
+minutes, so estimates are judged relative to each other: the median
+actual/estimated ratio over all measured audits is the calibration, and
+an audit is flagged when its own ratio is more than --factor times above
+or below it. That relative error is what misorders the scheduler's
+longest-first launches.
+
+Usage:
+    python3 -m audit_engine telemetry --file TELEMETRY_JSONL [--repo AUDITS_REPO]
+        [--runs N] [--factor X] [--format json|text]
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from .corpus import AuditRepo
+from .records import AuditRecord, load_records
+from .scheduler import parse_duration
+
+DEFAULT_FACTOR = 3.0
+MIN_CALIBRATION = 5               # measured audits needed before flagging estimates
+
+
+def read_records(path: Path, runs: int = 0) -> list[dict]:
+    """Telemetry records, optionally only those of the last N runs."""
+    records = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get("audit_id"):
+                    records.append(record)
+    except OSError:
+        return []
+    if runs > 0:
+        keep = set(list(dict.fromkeys(r.get("run", "") for r in records))[-runs:])
+        records = [r for r in records if r.get("run", "") in keep]
+    return records
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of non-empty values."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def agent_seconds(record: dict) -> float | None:
+    """This audit's share of its agent session, None if no agent ran."""
+    seconds = record.get("seconds")
+    if not isinstance(seconds, (int, float)) or record.get("cached"):
+        return None
+    return float(seconds) / max(int(record.get("batch_size") or 1), 1)
+
+
+def latency_groups(records: list[dict], key) -> dict[str, dict]:
+    groups: dict[str, list[dict]] = defaultdict(list)
+    for record in records:
+        groups[key(record)].append(record)
+    summary = {}
+    for name, members in sorted(groups.items()):
+        times = [t for t in map(agent_seconds, members) if t is not None]
+        summary[name] = {
+            "audits": len(members),
+            "agent_runs": len(times),
+            "p50": round(percentile(times, 50), 1) if times else None,
+            "p95": round(percentile(times, 95), 1) if times else None,
+            "max_turns_hit": sum(1 for r in members if r.get("max_turns_hit")),
+            "errors": sum(1 for r in members if r.get("outcome") not in ("pass", "warn", "fail", "skip")),
+        }
+    return summary
+
+
+def misestimated(records: list[dict], inventory: dict[str, AuditRecord],
+                 factor: float) -> tuple[float | None, list[dict]]:
+    """(calibration ratio, audits whose relative estimate error exceeds factor)."""
+    actual: dict[str, list[float]] = defaultdict(list)
+    for record in records:
+        seconds = agent_seconds(record)
+        if seconds is not None and seconds > 0:
+            actual[record["audit_id"]].append(seconds)
+
+    ratios = {}
+    for audit_id, times in actual.items():
+        audit = inventory.get(audit_id)
+        estimate = parse_duration(audit.estimated_duration) if audit else None
+        if estimate:
+            ratios[audit_id] = (statistics.median(times), estimate)
+    if len(ratios) < MIN_CALIBRATION:
+        return None, []
+
+    calibration = statistics.median(seconds / estimate for seconds, estimate in ratios.values())
+    flagged = []
+    for audit_id, (seconds, estimate) in ratios.items():
+        relative = seconds / estimate / calibration
+        if relative > factor or relative < 1 / factor:
+            flagged.append({"audit_id": audit_id,
+                            "estimated_duration": inventory[audit_id].estimated_duration,
+                            "median_seconds": round(seconds, 1), "runs": len(actual[audit_id]),
+                            "relative": round(relative, 2),
+                            "verdict": "underestimated" if relative > 1 else "overestimated"})
+    flagged.sort(key=lambda f: -abs(math.log(f["relative"])))
+    return calibration, flagged
+
+
+def summarize(records: list[dict], inventory: dict[str, AuditRecord], factor: float = DEFAULT_FACTOR) -> dict:
+    def category(record: dict) -> str:
+        audit = inventory.get(record["audit_id"])
+        return audit.category if audit and audit.category else record["audit_id"].split(".")[0]
+
+    def tier(record: dict) -> str:
+        audit = inventory.get(record["audit_id"])
+        return audit.tier.value if audit and audit.tier.value else "unknown"
+
+    calibration, flagged = misestimated(records, inventory, factor)
+    return {
+        "records": len(records),
+        "runs": len({r.get("run", "") for r in records}),
+        "agent_runs": sum(1 for r in records if agent_seconds(r) is not None),
+        "outcomes": dict(Counter(r.get("outcome") or "unknown" for r in records)),
+        "parse": dict(Counter(r.get("parse") or "unknown" for r in records)),
+        "max_turns_hit": sum(1 for r in records if r.get("max_turns_hit")),
+        "by_category": latency_groups(records, category),
+        "by_tier": latency_groups(records, tier),
+        "calibration": round(calibration, 5) if calibration is not None else None,
+        "misestimated": flagged,
+    }
+
+
+def render_text(summary: dict) -> str:
+    lines = [f"{summary['records']} audit record(s) from {summary['runs']} run(s), "
+             f"{summary['agent_runs']} agent run(s), {summary['max_turns_hit']} hit max turns",
+             "Outcomes: " + ", ".join(f"{k} {v}" for k, v in sorted(summary["outcomes"].items())),
+             "Parse:    " + ", ".join(f"{k} {v}" for k, v in sorted(summary["parse"].items()))]
+    for title, groups in (("Category", summary["by_category"]), ("Tier", summary["by_tier"])):
+        lines += ["", f"{title:<36} {'runs':>5} {'p50 s':>8} {'p95 s':>8} {'max-t':>6} {'err':>4}"]
+        for name, g in groups.items():
+            p50 = f"{g['p50']:.0f}" if g["p50"] is not None else "-"
+            p95 = f"{g['p95']:.0f}" if g["p95"] is not None else "-"
+            lines.append(f"{name[:36]:<36} {g['agent_runs']:>5} {p50:>8} {p95:>8} "
+                         f"{g['max_turns_hit']:>6} {g['errors']:>4}")
+    lines.append("")
+    if summary["calibration"] is None:
+        lines.append(f"Estimates: fewer than {MIN_CALIBRATION} measured audits, not judged yet")
+    elif not summary["misestimated"]:
+        lines.append("Estimates: none badly off")
+    else:
+        lines.append(f"Estimates badly off ({len(summary['misestimated'])}):")
+        for f in summary["misestimated"]:
+            lines.append(f"  {f['verdict']:<15} x{f['relative']:<6} {f['audit_id']} "
+                         f"(estimated {f['estimated_duration']}, median {f['median_seconds']:.0f}s "
+                         f"over {f['runs']} run(s))")
+    return "\n".join(lines)
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="audit_engine telemetry",
+                                     description="Summarize audit execution telemetry")
+    parser.add_argument("--file", required=True, help="Telemetry JSON lines")
+    parser.add_argument("--repo", help="Audits repository root (category, tier, estimated_duration)")
+    parser.add_argument("--runs", type=int, default=0, help="Only the last N runs (0 = all)")
+    parser.add_argument("--factor", type=float, default=DEFAULT_FACTOR,
+                        help=f"Flag estimates off by more than this factor (default: {DEFAULT_FACTOR})")
+    parser.add_argument("--format", choices=["json", "text"], default="json")
+    args = parser.parse_args(argv)
+
+    inventory = load_records(AuditRepo(args.repo)) if args.repo else {}
+    summary = summarize(read_records(Path(args.file), args.runs), inventory, args.factor)
+    if args.format == "text":
+        print(render_text(summary))
+    else:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+    return 0
@@ -13,101 +13,838 @@ Usage:
       --server "cd backend && python server.py" --port 3000 \
       --server "cd frontend && npm run dev" --port 5173 \
       -- python test.py
+
+    # Keep servers warm across runs: the first call starts a supervised pool,
+    # later calls attach to it (health-checked, restarted if needed)
+    python scripts/with_server.py --pool --server "npm run dev" --port 5173 -- python test_a.py
+    python scripts/with_server.py --pool -- python test_b.py
+    python scripts/with_server.py --pool-stop
+
+    # Run several test scripts concurrently against the same servers
+    python scripts/with_server.py --server "npm run dev" --port 5173 \
+      --shard-glob "tests/e2e/test_*.py" --jobs 4
+
+    # Start all servers at once and probe them concurrently
+    python scripts/with_server.py --parallel \
+      --server "cd backend && python server.py" --port 3000 --probe http:/health=200 \
+      --server "cd frontend && npm run dev" --port 5173 --probe "log:ready in \\d+ ms" \
+      -- python test.py
+
+Probes (one --probe per --server, default tcp):
+    tcp                 port accepts a TCP connection
+    http[:PATH[=CODE]]  GET PATH (default /) returns CODE (default 200)
+    log:REGEX           a line of server output matches REGEX
 """
 
-import subprocess
+import argparse
+import asyncio
+import collections
+import contextlib
+import functools
+import glob
+import json
+import os
+import re
+import signal
 import socket
-import time
+import subprocess
 import sys
-import argparse
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_TAIL_LINES = 20
+POLL_INITIAL = 0.005
+POLL_MAX = 0.5
+POOL_HEALTH_INTERVAL = 5
+DEFAULT_IDLE_TIMEOUT = 600
+STOP_GRACE = 5
+
+
+@dataclass
+class Probe:
+    """How to decide that a server is ready."""
+    kind: str
+    spec: str = 'tcp'
+    path: str = '/'
+    status: int = 200
+    pattern: re.Pattern | None = None
+
+    def describe(self, port):
+        if self.kind == 'http':
+            return f"GET http://localhost:{port}{self.path} -> {self.status}"
+        if self.kind == 'log':
+            return f"output matching /{self.pattern.pattern}/"
+        return f"TCP connect on port {port}"
+
+
+def parse_probe(spec):
+    """Parse a --probe value: tcp, http[:PATH[=CODE]] or log:REGEX."""
+    kind, _, rest = spec.partition(':')
+    if kind == 'tcp' and not rest:
+        return Probe('tcp')
+    if kind == 'http':
+        path, _, status = rest.partition('=')
+        path = path or '/'
+        if not path.startswith('/'):
+            path = '/' + path
+        try:
+            return Probe('http', spec, path=path, status=int(status) if status else 200)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid HTTP status in probe '{spec}'")
+    if kind == 'log' and rest:
+        try:
+            return Probe('log', spec, pattern=re.compile(rest))
+        except re.error as e:
+            raise argparse.ArgumentTypeError(f"invalid regex in probe '{spec}': {e}")
+    raise argparse.ArgumentTypeError(
+        f"invalid probe '{spec}' (expected tcp, http[:PATH[=CODE]] or log:REGEX)"
+    )
+
+
+async def tcp_ready(port):
+    """Single TCP connect attempt."""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection('localhost', port), timeout=1)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def http_ready(port, path, status):
+    """Single HTTP GET attempt; ready when the status line carries the expected code."""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection('localhost', port), timeout=1)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    try:
+        writer.write(
+            f"GET {path} HTTP/1.0\r\nHost: localhost:{port}\r\nConnection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout=2)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        writer.close()
+    parts = status_line.decode('latin-1').split()
+    return len(parts) >= 2 and parts[1] == str(status)
+
+
+class Server:
+    """One server process, its readiness probe and a drain of its output."""
+
+    def __init__(self, index, cmd, port, probe, tail_lines=DEFAULT_TAIL_LINES, log_dir=None):
+        self.index = index
+        self.cmd = cmd
+        self.port = port
+        self.probe = probe
+        self.process = None
+        self.ready = False
+        self.unhealthy = None           # why the last restart failed
+        self.tail = collections.deque(maxlen=tail_lines)
+        self.log_path = Path(log_dir) / f"server-{index}.log" if log_dir else None
+        self._log_matched = asyncio.Event()
+        self._drain_task = None
+        self._starts = 0
+
+    async def start(self):
+        # Use a shell to support commands with cd and &&
+        self.process = await asyncio.create_subprocess_shell(
+            self.cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            # Own process group, so stop() also reaches children of the shell
+            start_new_session=True,
+        )
+        # Keep reading output so a chatty server never blocks on a full pipe
+        self._drain_task = asyncio.create_task(self._drain(append=self._starts > 0))
+        self._starts += 1
+
+    async def _drain(self, append):
+        log_file = open(self.log_path, 'ab' if append else 'wb') if self.log_path else None
+        partial = b''
+        try:
+            while True:
+                chunk = await self.process.stdout.read(65536)
+                if log_file:
+                    log_file.write(chunk)
+                    log_file.flush()
+                if not chunk:
+                    if partial:
+                        self._on_line(partial)
+                    return
+                *lines, partial = (partial + chunk).split(b'\n')
+                for line in lines:
+                    self._on_line(line)
+        finally:
+            if log_file:
+                log_file.close()
+
+    def _on_line(self, raw):
+        line = raw.decode(errors='replace').rstrip('\r')
+        self.tail.append(line)
+        if self.probe.kind == 'log' and self.probe.pattern.search(line):
+            self._log_matched.set()
+
+    async def wait_ready(self, timeout):
+        """Block until the probe succeeds; raise RuntimeError on exit or timeout."""
+        if self.probe.kind == 'log':
+            await self._wait_log(timeout)
+        else:
+            await self._poll(timeout)
+        self.ready = True
+
+    async def _wait_log(self, timeout):
+        matched = asyncio.create_task(self._log_matched.wait())
+        exited = asyncio.create_task(self.process.wait())
+        try:
+            await asyncio.wait({matched, exited}, timeout=timeout,
+                               return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (matched, exited):
+                task.cancel()
+        if self._log_matched.is_set():
+            return
+        if self.process.returncode is not None:
+            self._raise_exited()
+        self._raise_timeout(timeout)
+
+    async def _poll(self, timeout):
+        """Probe with exponential backoff: fast detection without hammering the port."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = POLL_INITIAL
+
+        while True:
+            if self.process.returncode is not None:
+                self._raise_exited()
+            if await self._probe_once():
+                return
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self._raise_timeout(timeout)
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, POLL_MAX)
+
+    async def _probe_once(self):
+        if self.probe.kind == 'http':
+            return await http_ready(self.port, self.probe.path, self.probe.status)
+        return await tcp_ready(self.port)
+
+    async def healthy(self):
+        """Single health check: process alive and (for tcp/http probes) answering."""
+        if self.process is None or self.process.returncode is not None:
+            return False
+        if self.probe.kind == 'log':
+            return True
+        return await self._probe_once()
+
+    async def restart(self, timeout):
+        await self.stop()
+        self.ready = False
+        self._log_matched = asyncio.Event()
+        await self.start()
+        await self.wait_ready(timeout)
+
+    def _raise_timeout(self, timeout):
+        raise RuntimeError(
+            f"Server {self.index} failed to become ready within {timeout}s "
+            f"({self.probe.describe(self.port)})"
+        )
+
+    def _raise_exited(self):
+        raise RuntimeError(
+            f"Server {self.index} exited with code {self.process.returncode} before becoming ready"
+        )
+
+    def print_tail(self):
+        """Print the last captured lines of server output."""
+        source = f" (full log: {self.log_path})" if self.log_path else ""
+        print(f"\n--- Server {self.index} output, last {len(self.tail)} line(s){source} ---")
+        for line in self.tail:
+            print(f"  {line}")
+
+    async def stop(self):
+        if self.process is None:
+            return
+        # Signal the whole session even when the shell has already exited:
+        # servers it started outlive it in the same process group
+        self._signal(signal.SIGTERM)
+        if not await self._group_exited(STOP_GRACE):
+            self._signal(signal.SIGKILL)
+            await self._group_exited(STOP_GRACE)
+        if self._drain_task:
+            # A process that left the group can still hold the pipe open; stop
+            # reading rather than wait for an EOF that never comes
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._drain_task, timeout=STOP_GRACE)
+
+    async def _group_exited(self, timeout):
+        """Wait until the shell and everything else in its process group has exited."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self.process.wait(), timeout=timeout)
+        delay = POLL_INITIAL
+        while self._group_alive():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, POLL_MAX)
+        return True
+
+    def _group_alive(self):
+        try:
+            os.killpg(self.process.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def _signal(self, sig):
+        try:
+            os.killpg(self.process.pid, sig)
+        except ProcessLookupError:
+            pass
+
+
+async def wait_all_ready(servers, timeout):
+    """Probe every server concurrently; the first failure cancels the rest."""
+    tasks = [asyncio.create_task(s.wait_ready(timeout)) for s in servers]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            failure = None
+            for task in done:
+                server = servers[tasks.index(task)]
+                if task.exception() is not None:
+                    failure = failure or task.exception()
+                else:
+                    print(f"Server {server.index} ready on port {server.port}")
+            if failure is not None:
+                raise failure
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def start_servers(servers, timeout, parallel, started):
+    """Start servers and wait until all are ready, appending each to `started` as it launches."""
+    loop = asyncio.get_running_loop()
+
+    try:
+        if parallel:
+            for server in servers:
+                print(f"Starting server {server.index}/{len(servers)}: {server.cmd}")
+                await server.start()
+                started.append(server)
+
+            print(f"Waiting for {len(servers)} server(s) in parallel...")
+            t0 = loop.time()
+            await wait_all_ready(servers, timeout)
+            print(f"\nAll {len(servers)} server(s) ready in {loop.time() - t0:.1f}s")
+        else:
+            for server in servers:
+                print(f"Starting server {server.index}/{len(servers)}: {server.cmd}")
+                await server.start()
+                started.append(server)
+
+                # Wait for this server to be ready
+                print(f"Waiting for {server.probe.describe(server.port)}...")
+                await server.wait_ready(timeout)
+                print(f"Server ready on port {server.port}")
+
+            print(f"\nAll {len(servers)} server(s) ready")
+
+    except RuntimeError:
+        for server in started:
+            if not server.ready:
+                server.print_tail()
+        raise
+
+
+async def stop_servers(started):
+    print(f"\nStopping {len(started)} server(s)...")
+    for server in started:
+        await server.stop()
+        print(f"Server {server.index} stopped")
+    print("All servers stopped")
+
+
+@dataclass
+class Shard:
+    """One test command run concurrently with the others against the shared servers."""
+    index: int
+    label: str
+    argv: list[str]
+    returncode: int | None = None
+    duration: float = 0.0
+    output: bytes = b''
+
+
+def collect_shards(command, shell_commands, patterns):
+    """Build shards from the positional command, --shard commands and --shard-glob patterns."""
+    argvs = []
+    if command:
+        argvs.append((' '.join(command), command))
+    for cmd in shell_commands:
+        argvs.append((cmd, ['/bin/sh', '-c', cmd]))
+    for pattern in patterns:
+        paths = sorted(glob.glob(pattern, recursive=True))
+        if not paths:
+            print(f"Warning: --shard-glob '{pattern}' matched no files")
+        for path in paths:
+            if path.endswith('.py'):
+                argvs.append((path, [sys.executable, path]))
+            else:
+                argvs.append((path, [os.path.abspath(path)]))
+    return [Shard(i + 1, label, argv) for i, (label, argv) in enumerate(argvs)]
+
+
+async def run_shard(shard, total, semaphore, log_dir):
+    async with semaphore:
+        loop = asyncio.get_running_loop()
+        env = dict(os.environ, SHARD_INDEX=str(shard.index), SHARD_COUNT=str(total))
+        t0 = loop.time()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *shard.argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env
+            )
+            shard.output, _ = await process.communicate()
+            shard.returncode = process.returncode
+        except OSError as e:
+            shard.output = f"{e}\n".encode()
+            shard.returncode = 127
+        shard.duration = loop.time() - t0
+
+    if log_dir:
+        Path(log_dir, f"shard-{shard.index}.log").write_bytes(shard.output)
+
+    # Print each shard's output as one block so concurrent shards never interleave
+    status = 'PASS' if shard.returncode == 0 else f'FAIL ({shard.returncode})'
+    print(f"\n=== [{shard.index}/{total}] {shard.label}: {status} in {shard.duration:.1f}s ===")
+    text = shard.output.decode(errors='replace')
+    if text:
+        print(text, end='' if text.endswith('\n') else '\n')
+
+
+async def run_shards(shards, jobs, log_dir):
+    """Run shards with at most `jobs` in flight; return 0 only if every shard passed."""
+    loop = asyncio.get_running_loop()
+    print(f"Running {len(shards)} shard(s), {jobs} at a time")
+    semaphore = asyncio.Semaphore(jobs)
+    t0 = loop.time()
+    await asyncio.gather(*(run_shard(s, len(shards), semaphore, log_dir) for s in shards))
+    wall = loop.time() - t0
+
+    failed = [s for s in shards if s.returncode != 0]
+    serial = sum(s.duration for s in shards)
+    print(f"\n{'Shard':<6} {'Status':<6} {'Exit':>4} {'Time':>8}  Command")
+    for shard in shards:
+        status = 'PASS' if shard.returncode == 0 else 'FAIL'
+        print(f"{shard.index:<6} {status:<6} {shard.returncode:>4} {shard.duration:>7.1f}s  {shard.label}")
+    print(f"\n{len(shards) - len(failed)}/{len(shards)} shard(s) passed in {wall:.1f}s "
+          f"(serial time {serial:.1f}s)")
+    return 1 if failed else 0
+
+
+async def run_tests(command, shards, jobs, log_dir):
+    """Run the single command in the foreground, or the shards concurrently."""
+    if shards:
+        return await run_shards(shards, jobs, log_dir)
+    print(f"Running: {' '.join(command)}\n")
+    process = await asyncio.create_subprocess_exec(*command)
+    return await process.wait()
+
+
+async def run(servers, timeout, parallel, tests):
+    started = []
+
+    try:
+        await start_servers(servers, timeout, parallel, started)
+        return await tests()
+
+    finally:
+        # Clean up all servers
+        for server in started:
+            if server.ready and server.process.returncode is not None:
+                print(f"\nServer {server.index} exited unexpectedly with code "
+                      f"{server.process.returncode}")
+                server.print_tail()
+
+        await stop_servers(started)
 
 
-def is_server_ready(port, timeout=30):
-    """Wait for server to be ready by polling the port."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+class Pool:
+    """Supervisor that keeps servers warm and hands them out over a Unix control socket.
+
+    Protocol: one JSON object per line. {"op": "acquire"} health-checks every
+    server (restarting any that fail) and answers with the server list; the
+    client counts as active until it closes the connection. {"op": "status"}
+    and {"op": "stop"} do what they say. With no active clients for
+    idle_timeout seconds the pool shuts itself down.
+    """
+
+    def __init__(self, servers, socket_path, timeout, parallel, idle_timeout):
+        self.servers = servers
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.parallel = parallel
+        self.idle_timeout = idle_timeout
+        self.clients = 0
+        self.restarts = 0
+        self._last_used = 0.0
+        self._lock = asyncio.Lock()
+        self._shutdown = asyncio.Event()
+
+    async def serve(self):
+        loop = asyncio.get_running_loop()
+        started = []
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._shutdown.set)
+
         try:
-            with socket.create_connection(('localhost', port), timeout=1):
-                return True
-        except (socket.error, ConnectionRefusedError):
-            time.sleep(0.5)
-    return False
+            await start_servers(self.servers, self.timeout, self.parallel, started)
+
+            # Bind only once the servers are up: a reachable socket means a usable pool
+            server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+            os.chmod(self.socket_path, 0o600)
+            self._last_used = loop.time()
+            print(f"Pool listening on {self.socket_path} (idle timeout {self.idle_timeout}s)")
+
+            monitor = asyncio.create_task(self._monitor())
+            async with server:
+                await self._shutdown.wait()
+            monitor.cancel()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+            await stop_servers(started)
+
+    async def _handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        acquired = False
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    request = {}
+                op = request.get('op')
+
+                if op == 'acquire':
+                    try:
+                        await self.ensure_healthy()
+                    except RuntimeError as e:
+                        reply = {'ok': False, 'error': str(e)}
+                    else:
+                        if not acquired:
+                            acquired = True
+                            self.clients += 1
+                        reply = {'ok': True, **self.status()}
+                elif op == 'status':
+                    reply = {'ok': True, **self.status()}
+                elif op == 'stop':
+                    reply = {'ok': True}
+                    self._shutdown.set()
+                else:
+                    reply = {'ok': False, 'error': f"unknown op {op!r}"}
+
+                writer.write(json.dumps(reply).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if acquired:
+                self.clients -= 1
+            self._last_used = loop.time()
+            writer.close()
+
+    async def ensure_healthy(self):
+        """Health-check every server concurrently and restart the ones that fail.
+
+        Each restart is bounded (startup timeout plus the time stop() may
+        take), so the lock is never held indefinitely; a server that fails to
+        come back is marked unhealthy and reported, and retried on the next
+        check.
+        """
+        async with self._lock:
+            checks = await asyncio.gather(*(s.healthy() for s in self.servers))
+            errors = []
+            for server, ok in zip(self.servers, checks):
+                if ok:
+                    server.unhealthy = None
+                    continue
+                print(f"Server {server.index} failed health check, restarting...")
+                server.print_tail()
+                self.restarts += 1
+                try:
+                    await asyncio.wait_for(server.restart(self.timeout),
+                                           timeout=self.timeout + 4 * STOP_GRACE)
+                except (RuntimeError, asyncio.TimeoutError) as e:
+                    server.unhealthy = str(e) or f"Server {server.index} restart timed out"
+                    server.print_tail()
+                    errors.append(server.unhealthy)
+                    continue
+                server.unhealthy = None
+                print(f"Server {server.index} restarted on port {server.port}")
+            if errors:
+                raise RuntimeError('; '.join(errors))
+
+    async def _monitor(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(POOL_HEALTH_INTERVAL)
+            if self.clients == 0 and loop.time() - self._last_used > self.idle_timeout:
+                print(f"Pool idle for {self.idle_timeout}s, shutting down")
+                self._shutdown.set()
+                return
+            try:
+                await self.ensure_healthy()
+            except RuntimeError as e:
+                print(f"Error: {e}")
+
+    def status(self):
+        return {
+            'pid': os.getpid(),
+            'clients': self.clients,
+            'restarts': self.restarts,
+            'servers': [
+                {
+                    'index': s.index,
+                    'cmd': s.cmd,
+                    'port': s.port,
+                    'probe': s.probe.spec,
+                    'pid': s.process.pid if s.process else None,
+                    'running': s.process is not None and s.process.returncode is None,
+                    'unhealthy': s.unhealthy,
+                }
+                for s in self.servers
+            ],
+        }
+
+
+def default_pool_socket():
+    return os.path.join(tempfile.gettempdir(), f"with_server-pool-{os.getuid()}.sock")
+
+
+def pool_request(sock, op):
+    """Send one request on an open control connection and return the decoded reply."""
+    sock.sendall(json.dumps({'op': op}).encode() + b'\n')
+    buf = b''
+    while not buf.endswith(b'\n'):
+        chunk = sock.recv(65536)
+        if not chunk:
+            raise ConnectionError("pool closed the connection")
+        buf += chunk
+    return json.loads(buf)
+
+
+def pool_connect(socket_path):
+    """Connect to a running pool, or return None if there is none."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+def spawn_pool(args, socket_path):
+    """Launch a detached supervisor and wait until its control socket answers."""
+    # A socket file nobody listens on is left over from a crashed pool
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(socket_path)
+
+    cmd = [sys.executable, os.path.abspath(__file__), '--pool-supervise',
+           '--pool-socket', socket_path, '--idle-timeout', str(args.idle_timeout),
+           '--timeout', str(args.timeout), '--tail-lines', str(args.tail_lines)]
+    for server_cmd, port, probe in zip(args.servers, args.ports, args.probes):
+        cmd += ['--server', server_cmd, '--port', str(port), '--probe', probe.spec]
+    if args.parallel:
+        cmd.append('--parallel')
+    if args.log_dir:
+        cmd += ['--log-dir', os.path.abspath(args.log_dir)]
+
+    log_path = socket_path + '.log'
+    print(f"Starting server pool (supervisor log: {log_path})...")
+    with open(log_path, 'wb') as log:
+        supervisor = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=log,
+                                      stderr=subprocess.STDOUT, start_new_session=True)
+
+    delay = POLL_INITIAL
+    deadline = time.monotonic() + args.timeout * len(args.servers) + 5
+    while time.monotonic() < deadline:
+        if supervisor.poll() is not None:
+            break
+        sock = pool_connect(socket_path)
+        if sock is not None:
+            return sock
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX)
+
+    if supervisor.poll() is None:
+        supervisor.terminate()
+    with open(log_path, errors='replace') as log:
+        tail = collections.deque(log, maxlen=args.tail_lines)
+    print(f"\n--- Pool supervisor output, last {len(tail)} line(s) ---")
+    for line in tail:
+        print(f"  {line.rstrip()}")
+    raise RuntimeError("Server pool failed to start")
+
+
+def run_in_pool(args, tests):
+    """Attach to (or start) the warm pool, run the tests, then detach."""
+    socket_path = args.pool_socket
+    sock = pool_connect(socket_path)
+    if sock is None:
+        if not args.servers:
+            raise RuntimeError(f"No server pool at {socket_path}; pass --server/--port to start one")
+        sock = spawn_pool(args, socket_path)
+
+    with sock:
+        reply = pool_request(sock, 'acquire')
+        if not reply['ok']:
+            raise RuntimeError(f"Server pool unhealthy: {reply['error']}")
+
+        pooled = [(s['cmd'], s['port']) for s in reply['servers']]
+        if args.servers and pooled != list(zip(args.servers, args.ports)):
+            raise RuntimeError(
+                f"Server pool at {socket_path} runs different servers; stop it with --pool-stop"
+            )
+
+        ports = ', '.join(str(s['port']) for s in reply['servers'])
+        print(f"Attached to server pool (pid {reply['pid']}, ports {ports})")
+        # The open connection marks this run as an active client of the pool
+        return asyncio.run(tests())
 
 
 def main():
     parser = argparse.ArgumentParser(description='Run command with one or more servers')
-    parser.add_argument('--server', action='append', dest='servers', required=True,
+    parser.add_argument('--server', action='append', dest='servers', default=[],
                         help='Server command (can be repeated)')
-    parser.add_argument('--port', action='append', dest='ports', type=int, required=True,
+    parser.add_argument('--port', action='append', dest='ports', type=int, default=[],
                         help='Port for each server (must match --server count)')
+    parser.add_argument('--probe', action='append', dest='probes', type=parse_probe,
+                        help='Readiness probe for each server: tcp, http[:PATH[=CODE]] or '
+                             'log:REGEX (default: tcp; must match --server count if given)')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Start all servers at once and wait for them concurrently')
     parser.add_argument('--timeout', type=int, default=30,
                         help='Timeout in seconds per server (default: 30)')
+    parser.add_argument('--log-dir',
+                        help='Write each server\'s output to DIR/server-N.log')
+    parser.add_argument('--tail-lines', type=int, default=DEFAULT_TAIL_LINES,
+                        help=f'Output lines shown when a server fails (default: {DEFAULT_TAIL_LINES})')
+
+    sharding = parser.add_argument_group('parallel test shards')
+    sharding.add_argument('--shard', action='append', dest='shards', default=[], metavar='CMD',
+                          help='Shell command to run as a shard (can be repeated)')
+    sharding.add_argument('--shard-glob', action='append', dest='shard_globs', default=[],
+                          metavar='PATTERN',
+                          help='Run every matching script as a shard (*.py with python, '
+                               'others directly; ** recurses)')
+    sharding.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 4,
+                          help='Maximum shards running at once (default: CPU count)')
+
+    pool = parser.add_argument_group('warm server pool')
+    pool.add_argument('--pool', action='store_true',
+                      help='Run the command against a warm pool, starting it if needed')
+    pool.add_argument('--pool-start', action='store_true',
+                      help='Start the pool (if not running) and exit')
+    pool.add_argument('--pool-status', action='store_true',
+                      help='Print pool status as JSON and exit')
+    pool.add_argument('--pool-stop', action='store_true',
+                      help='Stop the pool and its servers')
+    pool.add_argument('--pool-socket', default=default_pool_socket(),
+                      help='Pool control socket (default: %(default)s)')
+    pool.add_argument('--idle-timeout', type=int, default=DEFAULT_IDLE_TIMEOUT,
+                      help=f'Stop the pool after this many idle seconds (default: {DEFAULT_IDLE_TIMEOUT})')
+    pool.add_argument('--pool-supervise', action='store_true', help=argparse.SUPPRESS)
+
     parser.add_argument('command', nargs=argparse.REMAINDER,
                         help='Command to run after server(s) ready')
 
     args = parser.parse_args()
 
+    if args.pool_status or args.pool_stop:
+        sock = pool_connect(args.pool_socket)
+        if sock is None:
+            print(f"No server pool at {args.pool_socket}")
+            sys.exit(1)
+        with sock:
+            reply = pool_request(sock, 'stop' if args.pool_stop else 'status')
+        print("Server pool stopping" if args.pool_stop else json.dumps(reply, indent=2))
+        sys.exit(0)
+
     # Remove the '--' separator if present
     if args.command and args.command[0] == '--':
         args.command = args.command[1:]
 
-    if not args.command:
+    shards = []
+    if args.shards or args.shard_globs:
+        shards = collect_shards(args.command, args.shards, args.shard_globs)
+        if args.jobs < 1:
+            print("Error: --jobs must be at least 1")
+            sys.exit(1)
+
+    needs_command = not (args.pool_start or args.pool_supervise)
+    if needs_command and not (args.command or shards):
         print("Error: No command specified to run")
         sys.exit(1)
 
+    # Attaching to a running pool needs no server configuration
+    if not args.servers and not args.pool:
+        print("Error: At least one --server is required")
+        sys.exit(1)
+
     # Parse server configurations
     if len(args.servers) != len(args.ports):
         print("Error: Number of --server and --port arguments must match")
         sys.exit(1)
 
-    servers = []
-    for cmd, port in zip(args.servers, args.ports):
-        servers.append({'cmd': cmd, 'port': port})
-
-    server_processes = []
-
-    try:
-        # Start all servers
-        for i, server in enumerate(servers):
-            print(f"Starting server {i+1}/{len(servers)}: {server['cmd']}")
-
-            # Use shell=True to support commands with cd and &&
-            process = subprocess.Popen(
-                server['cmd'],
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            server_processes.append(process)
-
-            # Wait for this server to be ready
-            print(f"Waiting for server on port {server['port']}...")
-            if not is_server_ready(server['port'], timeout=args.timeout):
-                raise RuntimeError(
-                    f"Server failed to start on port {server['port']} within {args.timeout}s"
-                )
+    args.probes = args.probes or [Probe('tcp')] * len(args.servers)
+    if len(args.probes) != len(args.servers):
+        print("Error: Number of --probe arguments must match --server count")
+        sys.exit(1)
 
-            print(f"Server ready on port {server['port']}")
+    if args.log_dir:
+        os.makedirs(args.log_dir, exist_ok=True)
 
-        print(f"\nAll {len(servers)} server(s) ready")
+    servers = [
+        Server(i + 1, cmd, port, probe, tail_lines=args.tail_lines, log_dir=args.log_dir)
+        for i, (cmd, port, probe) in enumerate(zip(args.servers, args.ports, args.probes))
+    ]
 
-        # Run the command
-        print(f"Running: {' '.join(args.command)}\n")
-        result = subprocess.run(args.command)
-        sys.exit(result.returncode)
+    tests = functools.partial(run_tests, args.command, shards, args.jobs, args.log_dir)
 
-    finally:
-        # Clean up all servers
-        print(f"\nStopping {len(server_processes)} server(s)...")
-        for i, process in enumerate(server_processes):
-            try:
-                process.terminate()
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
-            print(f"Server {i+1} stopped")
-        print("All servers stopped")
+    try:
+        if args.pool_supervise:
+            sys.stdout.reconfigure(line_buffering=True)
+            pool = Pool(servers, args.pool_socket, args.timeout, args.parallel, args.idle_timeout)
+            asyncio.run(pool.serve())
+            returncode = 0
+        elif args.pool_start:
+            sock = pool_connect(args.pool_socket) or spawn_pool(args, args.pool_socket)
+            sock.close()
+            print(f"Server pool ready on {args.pool_socket}")
+            returncode = 0
+        elif args.pool:
+            returncode = run_in_pool(args, tests)
+        else:
+            returncode = asyncio.run(run(servers, args.timeout, args.parallel, tests))
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    sys.exit(returncode)
 
 
 if __name__ == '__main__':